@@ -14,7 +14,7 @@ try:
 except ImportError:
     PANDAS_AVAILABLE = False
     print("⚠️ Pandas not available. Using basic implementations.")
-from core.drift_client import DriftClient, ETHPerpStrategy
+from core.drift_client import get_drift_client, get_strategy
 from core.price_fetcher import price_fetcher
 from core.indicators import calculate_rsi, calculate_ema, calculate_bollinger_bands
 from app_logger import log_signal
@@ -26,8 +26,8 @@ class AISignalDetector:
     """
     
     def __init__(self):
-        self.drift_client = DriftClient()
-        self.drift_strategy = ETHPerpStrategy(self.drift_client)
+        self.drift_client = get_drift_client()
+        self.drift_strategy = get_strategy()
         
         # Traditional signal weights (will be adapted by AI)
         self.signal_weights = {
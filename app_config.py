@@ -5,6 +5,8 @@ Combines all configuration settings from various modules
 import os
 import json
 from typing import Literal
+from config.trade_config import TradeConfig, CONFIG
+from wallet.TOKEN_config import TOKEN_LIST, TokenMeta, TOKEN_META, get_token_mint, get_token_decimals
 
 # =============================================================================
 # SAFETY CONFIGURATION - CRITICAL PROTECTION LAYER
@@ -110,89 +112,34 @@ AUTO_MODE = False      # True = auto-confirm trades, False = manual confirmation
 if not DRY_RUN and FORCED_DRY_RUN:
     DRY_RUN = True  # Force dry run for safety
 
+# Fixed trading settings, read from the frozen TradeConfig in config.trade_config.
+# DRY_RUN/AUTO_MODE above stay module attributes because the dashboards toggle
+# them at runtime.
+
 # Strategy Parameters
-SIGNAL_THRESHOLD = 0.75  # Minimum confidence to trigger a signal
+SIGNAL_THRESHOLD = CONFIG.signal_threshold
 
 # Risk Management
-TRADE_SIZE_USD = 100    # Default trade size in USD
-LEVERAGE = 1           # Leverage multiplier for perps
-PNL_ALERT_THRESHOLD = 20.0   # Alert when profit exceeds this
-MAX_LOSS_THRESHOLD = 50.0    # Max loss before auto-close
-AUTO_CLOSE_ENABLED = True    # Enable automatic position closing
+TRADE_SIZE_USD = CONFIG.trade_size_usd
+LEVERAGE = CONFIG.leverage
+PNL_ALERT_THRESHOLD = CONFIG.pnl_alert_threshold
+MAX_LOSS_THRESHOLD = CONFIG.max_loss_threshold
+AUTO_CLOSE_ENABLED = CONFIG.auto_close_enabled
 
 # Timing
-CYCLE_DELAY_SECONDS = 60    # Delay between trading cycles
+CYCLE_DELAY_SECONDS = CONFIG.cycle_delay_seconds
 
 # Logging
-LOG_FILE = "trade_log.txt"
-VERBOSE = False             # Enable detailed logging
+LOG_FILE = CONFIG.log_file
+VERBOSE = CONFIG.verbose
+AUDIT_ENABLED = CONFIG.audit_enabled
 
 # =============================================================================
 # WALLET CONFIGURATION
 # =============================================================================
 
-# List of supported tokens for signal detection and trading
-TOKEN_LIST = [
-    "SOL",
-    "USDC",
-    "BONK",
-    "JUP",
-    "ETH",
-    "BTC",
-    "RAY",
-    "SRM"
-]
-
-# Metadata for each token: mint address, decimals, display name
-TOKEN_META = {
-    "SOL": {
-        "mint": "So11111111111111111111111111111111111111112",
-        "decimals": 9,
-        "name": "Solana"
-    },
-    "USDC": {
-        "mint": "EPjFWdd5AufqSSqeM2qAqAqAqAqAqAqAqAqAqAqAqA",
-        "decimals": 6,
-        "name": "USD Coin"
-    },
-    "BONK": {
-        "mint": "DezX3zY3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3",
-        "decimals": 5,
-        "name": "Bonk"
-    },
-    "JUP": {
-        "mint": "JUPZ3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3",
-        "decimals": 6,
-        "name": "Jupiter"
-    },
-    "ETH": {
-        "mint": "7vfCXTUXx5WJV5JADk17DUJ4ksgau7utNKj4b963voxs",
-        "decimals": 8,
-        "name": "Ethereum (Wormhole)"
-    },
-    "BTC": {
-        "mint": "BTCmintAddressHere",
-        "decimals": 8,
-        "name": "Bitcoin (Wormhole)"
-    },
-    "RAY": {
-        "mint": "4k3Dyjzvzp8e2Y2X2X2X2X2X2X2X2X2X2X2X2X2X2X2",
-        "decimals": 6,
-        "name": "Raydium"
-    },
-    "SRM": {
-        "mint": "SRMmintAddressHere",
-        "decimals": 6,
-        "name": "Serum"
-    }
-}
-
-# Utility functions for token metadata
-def get_token_mint(token_symbol: str) -> str:
-    return TOKEN_META.get(token_symbol, {}).get("mint", "")
-
-def get_token_decimals(token_symbol: str) -> int:
-    return TOKEN_META.get(token_symbol, {}).get("decimals", 0)
+# TOKEN_LIST, TokenMeta and TOKEN_META (with get_token_mint/get_token_decimals)
+# are defined once in wallet.TOKEN_config and re-exported from here
 
 # =============================================================================
 # SAFE WALLET MANAGER CONFIGURATION
@@ -236,6 +183,8 @@ trade_config = type('TradeConfig', (), {
     'CYCLE_DELAY_SECONDS': CYCLE_DELAY_SECONDS,
     'LOG_FILE': LOG_FILE,
     'VERBOSE': VERBOSE,
+    'AUDIT_ENABLED': AUDIT_ENABLED,
+    'CONFIG': CONFIG,
 })()
 
 safety_config = type('SafetyConfig', (), {
@@ -248,7 +197,8 @@ __all__ = [
     'SafetyConfig', 'safety', 'DRY_RUN', 'AUTO_MODE', 'SIGNAL_THRESHOLD',
     'TRADE_SIZE_USD', 'LEVERAGE', 'PNL_ALERT_THRESHOLD', 'MAX_LOSS_THRESHOLD',
     'AUTO_CLOSE_ENABLED', 'CYCLE_DELAY_SECONDS', 'LOG_FILE', 'VERBOSE',
-    'TOKEN_LIST', 'TOKEN_META', 'get_token_mint', 'get_token_decimals',
+    'AUDIT_ENABLED', 'TradeConfig', 'CONFIG',
+    'TOKEN_LIST', 'TokenMeta', 'TOKEN_META', 'get_token_mint', 'get_token_decimals',
     'MIN_BALANCE_THRESHOLD', 'LOG_PATH', 'CONFIG_PATH', 'load_config', 'save_config',
     'trade_config', 'safety_config'
 ]
\ No newline at end of file
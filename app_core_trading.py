@@ -15,8 +15,9 @@ def execute_trade(signal_data: Dict[str, Any]):
     Replace with real trade logic (e.g., Drift SDK call).
     """
     print(f"✅ Simulated Trade Executed: {signal_data['action']} {signal_data['asset']}")
-    from logger import _write_log
-    _write_log("EXECUTE", f"{signal_data['action']} {signal_data['asset']} @ {signal_data['timestamp']}")
+    from logger import AUDIT_ENABLED, _write_log
+    if AUDIT_ENABLED:
+        _write_log("EXECUTE", "%s %s @ %s", signal_data['action'], signal_data['asset'], signal_data['timestamp'])
 
 # =============================================================================
 # PNL MONITOR (from core/pnl_moniter.py)
@@ -75,12 +76,50 @@ def close_perp_position(drift_client, market_index: int):
 # TRADE EXECUTER (from dashboard/dashboard.py - manual trade interface)
 # =============================================================================
 
+_MANUAL_TRADE_MENU = (
+    "\n📱 Manual Trade Interface\n"
+    "1. Long ETH\n"
+    "2. Short ETH\n"
+    "3. Close Position\n"
+    "4. View Position Status\n"
+    "5. Exit"
+)
+
+def _manual_perp_trade(direction: str):
+    """Build a menu action that executes (or simulates) a manual trade"""
+    label = direction.upper()
+
+    def action(drift_client, trade_size: float):
+        from logger import log_trade_action
+
+        log_trade_action(f"Manual {label} selected.")
+        if drift_client:
+            execute_perp_trade(direction, trade_size)
+        else:
+            print(f"✅ Simulated {label} trade executed")
+
+    return action
+
+def _manual_position_status(drift_client, trade_size: float):
+    """Menu action showing the current position"""
+    if drift_client:
+        display_position_status(drift_client)
+    else:
+        print("🧪 Dry-run mode: No live position data.")
+
+# Menu choice -> action(drift_client, trade_size); "5" exits the loop
+_MANUAL_TRADE_ACTIONS = {
+    "1": _manual_perp_trade("long"),
+    "2": _manual_perp_trade("short"),
+    "3": _manual_perp_trade("close"),
+    "4": _manual_position_status,
+}
+
 def manual_trade_interface():
     """
     Provides CLI or mobile-friendly manual control for Perp trades.
     """
     from config import AUTO_MODE, TRADE_SIZE_USD, DRY_RUN
-    from logger import log_trade_action
     
     if not AUTO_MODE:
         print("Manual controls are disabled.")
@@ -96,46 +135,17 @@ def manual_trade_interface():
         drift_client = None
 
     while True:
-        print("\n📱 Manual Trade Interface")
-        print("1. Long ETH")
-        print("2. Short ETH")
-        print("3. Close Position")
-        print("4. View Position Status")
-        print("5. Exit")
+        print(_MANUAL_TRADE_MENU)
 
         choice = input("Select an option: ").strip()
 
-        if choice == "1":
-            log_trade_action("Manual LONG selected.")
-            if drift_client:
-                execute_perp_trade("long", TRADE_SIZE_USD)
-            else:
-                print("✅ Simulated LONG trade executed")
-
-        elif choice == "2":
-            log_trade_action("Manual SHORT selected.")
-            if drift_client:
-                execute_perp_trade("short", TRADE_SIZE_USD)
-            else:
-                print("✅ Simulated SHORT trade executed")
-
-        elif choice == "3":
-            log_trade_action("Manual CLOSE selected.")
-            if drift_client:
-                execute_perp_trade("close", TRADE_SIZE_USD)
-            else:
-                print("✅ Simulated CLOSE trade executed")
-
-        elif choice == "4":
-            if drift_client:
-                display_position_status(drift_client)
-            else:
-                print("🧪 Dry-run mode: No live position data.")
-
-        elif choice == "5":
+        if choice == "5":
             print("Exiting manual interface.")
             break
 
+        action = _MANUAL_TRADE_ACTIONS.get(choice)
+        if action:
+            action(drift_client, TRADE_SIZE_USD)
         else:
             print("Invalid input. Try again.")
 
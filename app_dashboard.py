@@ -3,11 +3,99 @@ Consolidated Dashboard Module
 Combines all dashboard functionality from various modules
 """
 import os
+import sys
 import time
 import json
+import logging
+import random
+import select
 import threading
 from datetime import datetime
-from typing import Dict, Any, List
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import zip_longest
+from typing import Dict, Any, List, Optional, Tuple
+
+from dashboard.terminal import ANSI_CLEAR_SCREEN, enable_vt_mode, on_resize
+
+def _is_console_handler(handler: logging.Handler) -> bool:
+    """True for a StreamHandler writing to the terminal (file handlers subclass StreamHandler)"""
+    return (isinstance(handler, logging.StreamHandler) and not isinstance(handler, logging.FileHandler)
+            and getattr(handler, "stream", None) in (sys.stdout, sys.stderr, sys.__stdout__, sys.__stderr__))
+
+@contextmanager
+def silence_console_logging():
+    """
+    Keep log records off the terminal the dashboard is drawing on: every console
+    handler (app_logger's, wallet.logger's, or any other) is detached, and
+    DASHBOARD_ACTIVE tells loggers configured meanwhile to skip the console.
+    Both are restored when the block exits
+    """
+    previous_flag = os.environ.get("DASHBOARD_ACTIVE")
+    os.environ["DASHBOARD_ACTIVE"] = "1"
+    
+    loggers = [logging.getLogger()] + [
+        item for item in list(logging.Logger.manager.loggerDict.values()) if isinstance(item, logging.Logger)
+    ]
+    detached = []
+    for log in loggers:
+        for handler in list(log.handlers):
+            if _is_console_handler(handler):
+                log.removeHandler(handler)
+                detached.append((log, handler))
+    
+    try:
+        yield
+    finally:
+        for log, handler in detached:
+            log.addHandler(handler)
+        if previous_flag is None:
+            os.environ.pop("DASHBOARD_ACTIVE", None)
+        else:
+            os.environ["DASHBOARD_ACTIVE"] = previous_flag
+
+# Set once the simulation engine or its config fails to import, so later
+# refreshes serve the fallback status without retrying the import
+_simulator_unavailable = False
+
+# File-only while a dashboard owns the terminal (see silence_console_logging)
+logger = logging.getLogger("TradingBot.dashboard")
+
+# Open-position count at which PnL% is computed column-wise with NumPy
+VECTORIZE_MIN_POSITIONS = 100
+
+# Dedicated generator for the demo/test-trade simulation
+_RNG = random.Random()
+
+# Row templates for the position/trade tables, parsed once and reused per row
+_POS_HEADER = f"{'Symbol':<8} {'Side':<6} {'Entry':<10} {'Current':<10} {'Size':<10} {'PnL':<12} {'%':<8}"
+_POS_ROW = "{symbol:<8} {side:<6} ${entry:<9.2f} ${current:<9.2f} {size:<9.4f} {pnl:<11} {pct:<8}"
+_TRADE_HEADER = f"{'Symbol':<8} {'Side':<6} {'Entry':<10} {'Exit':<10} {'PnL':<12} {'Time':<12}"
+_TRADE_ROW = "{symbol:<8} {side:<6} ${entry:<9.2f} ${exit:<9.2f} {pnl:<11} {time:<12}"
+
+@lru_cache(maxsize=8)
+def _header_lines(mode: str, auto_mode: bool) -> Tuple[str, ...]:
+    """Static part of the TradingDashboard header for a mode combination"""
+    mode_indicator = "🧪 DRY RUN" if "DRY RUN" in mode else "🔴 LIVE"
+    auto_indicator = "🤖 AUTO" if auto_mode else "👤 MANUAL"
+    return (
+        "=" * 80,
+        f"🚀 JUPITER ETH PERPS TRADING BOT {mode_indicator} {auto_indicator}",
+        "=" * 80,
+    )
+
+@lru_cache(maxsize=2)
+def _controls_lines(dry_run_mode: bool) -> Tuple[str, ...]:
+    """TradingDashboard control instructions for the current trading mode"""
+    return (
+        "🎮 CONTROLS",
+        "-" * 40,
+        "Press 'L' + ENTER: Switch to LIVE trading" if dry_run_mode else "Press 'D' + ENTER: Switch to DRY RUN mode",
+        "Press 'Q' + ENTER: Quit dashboard",
+        "Press 'R' + ENTER: Reset simulation data",
+        "Press 'T' + ENTER: Force test trade",
+        "",
+    )
 
 # =============================================================================
 # MINIMAL DASHBOARD (from dashboard/minimal_dashboard.py)
@@ -23,10 +111,26 @@ class MinimalDashboard:
         self.show_help = False
         self.show_transactions = False
         self.running = False
+        self._banner = None  # (message, monotonic expiry)
+        self._parts: List[str] = []
+        self._commands = {
+            'q': self._cmd_quit,
+            'h': self._cmd_toggle_help,
+            't': self._cmd_toggle_transactions,
+            'x': self.show_safety_status,
+            'a': self._cmd_toggle_auto_approve,
+            's': self._cmd_toggle_running,
+        }
         
+    def _emit(self, line: str = ""):
+        """Queue a line for the screen being rendered"""
+        self._parts.append(line)
+    
     def clear(self):
         """Clear screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        enable_vt_mode()
+        sys.stdout.write(ANSI_CLEAR_SCREEN)
+        sys.stdout.flush()
     
     def header(self):
         """Simple header with safety status"""
@@ -44,15 +148,15 @@ class MinimalDashboard:
             
         auto = "AUTO" if self.auto_approve else "MANUAL"
         
-        print("┌─────────────────────────────────────────────────────────────┐")
-        print(f"│ {safety_symbol} ETH PERPS BOT │ {mode:<12} │ {auto:<7} │ {datetime.now().strftime('%H:%M:%S')} │")
-        print("└─────────────────────────────────────────────────────────────┘")
+        self._emit("┌─────────────────────────────────────────────────────────────┐")
+        self._emit(f"│ {safety_symbol} ETH PERPS BOT │ {mode:<12} │ {auto:<7} │ {datetime.now().strftime('%H:%M:%S')} │")
+        self._emit("└─────────────────────────────────────────────────────────────┘")
         
         # Safety status line
         if forced_dry_run:
-            print("  🔒 SAFETY ACTIVE - YOUR FUNDS ARE PROTECTED")
+            self._emit("  🔒 SAFETY ACTIVE - YOUR FUNDS ARE PROTECTED")
         else:
-            print("  ⚠️ WARNING: LIVE TRADING ENABLED - REAL MONEY AT RISK")
+            self._emit("  ⚠️ WARNING: LIVE TRADING ENABLED - REAL MONEY AT RISK")
         
         # Quick stats
         try:
@@ -63,43 +167,43 @@ class MinimalDashboard:
             trades = portfolio['total_trades']
             
             pnl_color = "+" if pnl >= 0 else ""
-            print(f"  Balance: ${balance:,.0f}  │  PnL: {pnl_color}${pnl:,.0f}  │  Trades: {trades}")
+            self._emit(f"  Balance: ${balance:,.0f}  │  PnL: {pnl_color}${pnl:,.0f}  │  Trades: {trades}")
         except:
-            print("  Balance: $0  │  PnL: $0  │  Trades: 0")
-        print()
+            self._emit("  Balance: $0  │  PnL: $0  │  Trades: 0")
+        self._emit()
     
     def main_menu(self):
         """Simple main menu"""
-        print("Commands:")
-        print("  [s] Start/Stop bot")
-        print("  [a] Toggle auto-approve")
-        print("  [t] Show transactions")
-        print("  [h] Help")
-        print("  [x] Safety status")
-        print("  [q] Quit")
-        print()
+        self._emit("Commands:")
+        self._emit("  [s] Start/Stop bot")
+        self._emit("  [a] Toggle auto-approve")
+        self._emit("  [t] Show transactions")
+        self._emit("  [h] Help")
+        self._emit("  [x] Safety status")
+        self._emit("  [q] Quit")
+        self._emit()
     
     def help_menu(self):
         """Expandable help menu"""
         if not self.show_help:
             return
             
-        print("┌─ HELP ─────────────────────────────────────────────┐")
-        print("│                                                    │")
-        print("│  s  - Start/stop the trading bot                  │")
-        print("│  a  - Toggle between auto and manual approval     │")
-        print("│  t  - Show/hide transaction history               │")
-        print("│  h  - Show/hide this help menu                    │")
-        print("│  x  - Show detailed safety status                 │")
-        print("│  q  - Quit the application                        │")
-        print("│                                                    │")
-        print("│  Auto Mode: Bot trades automatically              │")
-        print("│  Manual Mode: You approve each trade              │")
-        print("│                                                    │")
-        print("│  🔒 SAFETY: Multiple layers protect your funds    │")
-        print("│                                                    │")
-        print("└────────────────────────────────────────────────────┘")
-        print()
+        self._emit("┌─ HELP ─────────────────────────────────────────────┐")
+        self._emit("│                                                    │")
+        self._emit("│  s  - Start/stop the trading bot                  │")
+        self._emit("│  a  - Toggle between auto and manual approval     │")
+        self._emit("│  t  - Show/hide transaction history               │")
+        self._emit("│  h  - Show/hide this help menu                    │")
+        self._emit("│  x  - Show detailed safety status                 │")
+        self._emit("│  q  - Quit the application                        │")
+        self._emit("│                                                    │")
+        self._emit("│  Auto Mode: Bot trades automatically              │")
+        self._emit("│  Manual Mode: You approve each trade              │")
+        self._emit("│                                                    │")
+        self._emit("│  🔒 SAFETY: Multiple layers protect your funds    │")
+        self._emit("│                                                    │")
+        self._emit("└────────────────────────────────────────────────────┘")
+        self._emit()
     
     def transactions_menu(self):
         """Expandable transactions menu"""
@@ -109,39 +213,39 @@ class MinimalDashboard:
         try:
             from core.simulation_engine import simulator
             
-            print("┌─ TRANSACTIONS ─────────────────────────────────────┐")
+            self._emit("┌─ TRANSACTIONS ─────────────────────────────────────┐")
             
             # Open positions
             if simulator.positions:
-                print("│  OPEN POSITIONS:                                   │")
+                self._emit("│  OPEN POSITIONS:                                   │")
                 for i, (pos_id, pos) in enumerate(simulator.positions.items(), 1):
                     side_symbol = "↗" if pos.side == "long" else "↘"
                     pnl_symbol = "+" if pos.unrealized_pnl >= 0 else ""
-                    print(f"│  {i}. {side_symbol} {pos.symbol} ${pos.entry_price:.0f} → ${pos.current_price:.0f} ({pnl_symbol}${pos.unrealized_pnl:.0f})  │")
+                    self._emit(f"│  {i}. {side_symbol} {pos.symbol} ${pos.entry_price:.0f} → ${pos.current_price:.0f} ({pnl_symbol}${pos.unrealized_pnl:.0f})  │")
             else:
-                print("│  No open positions                                │")
+                self._emit("│  No open positions                                │")
             
-            print("│                                                    │")
+            self._emit("│                                                    │")
             
             # Recent trades
             recent_trades = simulator.trade_history[-5:] if simulator.trade_history else []
             if recent_trades:
-                print("│  RECENT TRADES:                                    │")
+                self._emit("│  RECENT TRADES:                                    │")
                 for i, trade in enumerate(recent_trades, 1):
                     side_symbol = "↗" if trade.side == "long" else "↘"
                     pnl_symbol = "+" if trade.realized_pnl >= 0 else ""
-                    entry_time = datetime.fromisoformat(trade.entry_time.replace('Z', '+00:00')).strftime('%m/%d %H:%M')
-                    print(f"│  {i}. {side_symbol} {trade.symbol} {entry_time} ({pnl_symbol}${trade.realized_pnl:.0f})      │")
+                    entry_time = trade.entry_display_time
+                    self._emit(f"│  {i}. {side_symbol} {trade.symbol} {entry_time} ({pnl_symbol}${trade.realized_pnl:.0f})      │")
             else:
-                print("│  No completed trades yet                          │")
+                self._emit("│  No completed trades yet                          │")
             
-            print("│                                                    │")
-            print("└────────────────────────────────────────────────────┘")
+            self._emit("│                                                    │")
+            self._emit("└────────────────────────────────────────────────────┘")
         except:
-            print("┌─ TRANSACTIONS ─────────────────────────────────────┐")
-            print("│  No data available                                │")
-            print("└────────────────────────────────────────────────────┘")
-        print()
+            self._emit("┌─ TRANSACTIONS ─────────────────────────────────────┐")
+            self._emit("│  No data available                                │")
+            self._emit("└────────────────────────────────────────────────────┘")
+        self._emit()
     
     def status_line(self):
         """Simple status line"""
@@ -149,11 +253,11 @@ class MinimalDashboard:
             from core.simulation_engine import simulator
             status = "Running..." if self.running else "Stopped"
             open_positions = len(simulator.positions)
-            print(f"Status: {status}  │  Open Positions: {open_positions}")
+            self._emit(f"Status: {status}  │  Open Positions: {open_positions}")
         except:
             status = "Running..." if self.running else "Stopped"
-            print(f"Status: {status}  │  Open Positions: 0")
-        print()
+            self._emit(f"Status: {status}  │  Open Positions: 0")
+        self._emit()
     
     def show_safety_status(self):
         """Display detailed safety status"""
@@ -175,48 +279,76 @@ class MinimalDashboard:
         
         return True
     
+    def flash(self, message: str, duration: float = 1.0):
+        """Show a transient message on the next redraws without blocking"""
+        self._banner = (message, time.monotonic() + duration)
+    
+    def banner_line(self):
+        """Render the transient banner until it expires"""
+        if self._banner is None:
+            return
+        message, expires_at = self._banner
+        if time.monotonic() >= expires_at:
+            self._banner = None
+            return
+        self._emit(message)
+        self._emit()
+    
     def display(self):
         """Display the complete dashboard"""
-        self.clear()
+        self._parts = []
         self.header()
         self.main_menu()
         self.help_menu()
         self.transactions_menu() 
         self.status_line()
+        self.banner_line()
         
+        # Emit the whole screen in one write
+        screen = "\n".join(self._parts) + "\n"
         if not self.running:
-            print("Enter command: ", end="", flush=True)
+            screen += "Enter command: "
+        self._parts = []
+        
+        enable_vt_mode()
+        sys.stdout.write(ANSI_CLEAR_SCREEN + screen)
+        sys.stdout.flush()
+    
+    def _cmd_quit(self):
+        return False
+    
+    def _cmd_toggle_help(self):
+        self.show_help = not self.show_help
+        return True
+    
+    def _cmd_toggle_transactions(self):
+        self.show_transactions = not self.show_transactions
+        return True
+    
+    def _cmd_toggle_auto_approve(self):
+        self.auto_approve = not self.auto_approve
+        mode = "AUTO" if self.auto_approve else "MANUAL"
+        self.flash(f"✓ Switched to {mode} mode")
+        return True
+    
+    def _cmd_toggle_running(self):
+        self.running = not self.running
+        if self.running:
+            print("\n✓ Bot started")
+            return 'start_bot'
+        self.flash("✓ Bot stopped")
+        return True
     
     def handle_command(self, cmd: str) -> bool:
         """Handle user commands - returns False to quit"""
         cmd = cmd.lower().strip()
         
-        if cmd == 'q':
-            return False
-        elif cmd == 'h':
-            self.show_help = not self.show_help
-        elif cmd == 't':
-            self.show_transactions = not self.show_transactions
-        elif cmd == 'x':
-            self.show_safety_status()
-            return True
-        elif cmd == 'a':
-            self.auto_approve = not self.auto_approve
-            mode = "AUTO" if self.auto_approve else "MANUAL"
-            print(f"\n✓ Switched to {mode} mode")
-            time.sleep(1)
-        elif cmd == 's':
-            self.running = not self.running
-            if self.running:
-                print("\n✓ Bot started")
-                return 'start_bot'
-            else:
-                print("\n✓ Bot stopped") 
-                time.sleep(1)
-        else:
-            if cmd:  # Only show error for non-empty commands
-                print(f"\nUnknown command: {cmd}")
-                time.sleep(1)
+        handler = self._commands.get(cmd)
+        if handler:
+            return handler()
+        
+        if cmd:  # Only show error for non-empty commands
+            self.flash(f"Unknown command: {cmd}")
         
         return True
     
@@ -255,32 +387,33 @@ class MinimalDashboard:
     def run_interactive(self):
         """Run interactive dashboard"""
         print("🚀 Starting Minimal Trading Dashboard...")
-        time.sleep(1)
-        
-        try:
-            while True:
-                self.display()
-                
-                if self.running:
-                    # Bot is running - simulate bot cycle
-                    time.sleep(2)
-                    continue
-                
-                # Wait for user input
-                try:
-                    cmd = input()
-                    result = self.handle_command(cmd)
+        with silence_console_logging():
+            time.sleep(1)
+            
+            try:
+                while True:
+                    self.display()
+                    
+                    if self.running:
+                        # Bot is running - simulate bot cycle
+                        time.sleep(2)
+                        continue
                     
-                    if result == False:
+                    # Wait for user input
+                    try:
+                        cmd = input()
+                        result = self.handle_command(cmd)
+                        
+                        if result == False:
+                            break
+                        elif result == 'start_bot':
+                            return 'start_bot'  # Signal to start the trading bot
+                            
+                    except KeyboardInterrupt:
                         break
-                    elif result == 'start_bot':
-                        return 'start_bot'  # Signal to start the trading bot
                         
-                except KeyboardInterrupt:
-                    break
-                    
-        except Exception as e:
-            print(f"Dashboard error: {e}")
+            except Exception as e:
+                print(f"Dashboard error: {e}")
         
         print("\n👋 Dashboard closed")
         return 'quit'
@@ -299,25 +432,85 @@ class TradingDashboard:
         self.dry_run_mode = True
         self.refresh_rate = 5  # seconds
         self.last_update = None
+        self._frame: List[str] = []
+        self._prev_frame: List[str] = []
+        self.status_ttl = 2.0  # seconds a status snapshot is reused
+        self._fallback_status: Dict[str, Any] = {
+            "mode": "DRY RUN",
+            "auto_mode": False,
+            "eth_price": 3000.0,
+            "portfolio": {"balance": 0, "total_pnl": 0, "total_trades": 0},
+            "positions": [],
+            "recent_trades": []
+        }
+        self._status_cache: Optional[Dict[str, Any]] = None
+        self._status_time = 0.0
+        self._typed: List[str] = []  # partial line read via msvcrt on Windows
+        self._banner = None  # (message, monotonic expiry)
+        self._commands = {
+            'q': self.stop,
+            'l': self.toggle_dry_run_mode,
+            'd': self.toggle_dry_run_mode,
+            'r': self.reset_simulation,
+            't': self.force_test_trade,
+        }
         
     def clear_screen(self):
         """Clear the console screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        enable_vt_mode()
+        sys.stdout.write(ANSI_CLEAR_SCREEN)
+        sys.stdout.flush()
+        self.invalidate()
+    
+    def _emit(self, line: str = ""):
+        """Queue a line for the frame being rendered"""
+        self._frame.append(line)
+    
+    def invalidate(self):
+        """Force the next frame to be redrawn from a blank screen"""
+        self._prev_frame = []
+    
+    def flush_frame(self):
+        """Write only the rows that changed since the previous frame"""
+        if not self._prev_frame:
+            enable_vt_mode()
+        out = [] if self._prev_frame else [ANSI_CLEAR_SCREEN]
+        for row, (old, new) in enumerate(zip_longest(self._prev_frame, self._frame), 1):
+            if old != new:
+                out.append(f"\x1b[{row};1H\x1b[2K{new or ''}")
+        # Park the cursor below the frame and wipe anything printed there since
+        out.append(f"\x1b[{len(self._frame) + 1};1H\x1b[J")
+        
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+        self._prev_frame = self._frame
+        self._frame = []
     
     def format_currency(self, amount: float) -> str:
         """Format currency with color coding"""
-        if amount >= 0:
-            return f"${amount:,.2f}"
-        else:
-            return f"-${abs(amount):,.2f}"
+        return f"${amount:,.2f}" if amount >= 0 else f"-${-amount:,.2f}"
     
     def format_percentage(self, percentage: float) -> str:
         """Format percentage with color coding"""
-        sign = "+" if percentage >= 0 else ""
-        return f"{sign}{percentage:.2f}%"
+        return f"{percentage:+.2f}%"
     
     def get_bot_status(self) -> Dict[str, Any]:
+        """Get current bot status, reusing a recent snapshot within status_ttl"""
+        now = time.monotonic()
+        if self._status_cache is not None and now - self._status_time < self.status_ttl:
+            return self._status_cache
+        
+        status = self._collect_bot_status()
+        self._status_cache = status
+        self._status_time = now
+        return status
+    
+    def _collect_bot_status(self) -> Dict[str, Any]:
         """Get current bot status and metrics"""
+        global _simulator_unavailable
+        if _simulator_unavailable:
+            return self._fallback_status
+        
         try:
             from core.simulation_engine import simulator
             from config import DRY_RUN, AUTO_MODE
@@ -336,100 +529,121 @@ class TradingDashboard:
                 "positions": list(simulator.positions.values()),
                 "recent_trades": simulator.trade_history[-5:] if simulator.trade_history else []
             }
-        except:
-            return {
-                "mode": "DRY RUN",
-                "auto_mode": False,
-                "eth_price": 3000.0,
-                "portfolio": {"balance": 0, "total_pnl": 0, "total_trades": 0},
-                "positions": [],
-                "recent_trades": []
-            }
+        except ImportError:
+            _simulator_unavailable = True
+            return self._fallback_status
+        except (AttributeError, KeyError):
+            return self._fallback_status
+        except Exception as e:
+            # Anything else (bad price data, network errors) must not stop the render loop
+            logger.warning(f"Failed to collect bot status: {e}")
+            return self._fallback_status
     
     def render_header(self, status: Dict[str, Any]):
         """Render dashboard header"""
-        mode_indicator = "🧪 DRY RUN" if "DRY RUN" in status["mode"] else "🔴 LIVE"
-        auto_indicator = "🤖 AUTO" if status["auto_mode"] else "👤 MANUAL"
-        
-        print("=" * 80)
-        print(f"🚀 JUPITER ETH PERPS TRADING BOT {mode_indicator} {auto_indicator}")
-        print("=" * 80)
-        print(f"ETH Price: ${status['eth_price']:,.2f} | Last Update: {datetime.now().strftime('%H:%M:%S')}")
-        print()
+        self._frame.extend(_header_lines(status["mode"], bool(status["auto_mode"])))
+        self._emit(f"ETH Price: ${status['eth_price']:,.2f} | Last Update: {datetime.now().strftime('%H:%M:%S')}")
+        self._emit()
     
     def render_portfolio_summary(self, portfolio: Dict[str, Any]):
         """Render portfolio summary section"""
-        print("📊 PORTFOLIO SUMMARY")
-        print("-" * 40)
-        print(f"Balance:        {self.format_currency(portfolio.get('balance', 0))}")
-        print(f"Unrealized PnL: {self.format_currency(portfolio.get('unrealized_pnl', 0))}")
-        print(f"Total PnL:      {self.format_currency(portfolio.get('total_pnl', 0))}")
-        print(f"Total Value:    {self.format_currency(portfolio.get('total_value', 0))}")
-        print(f"ROI:            {self.format_percentage(portfolio.get('roi', 0))}")
-        print()
+        self._emit("📊 PORTFOLIO SUMMARY")
+        self._emit("-" * 40)
+        self._emit(f"Balance:        {self.format_currency(portfolio.get('balance', 0))}")
+        self._emit(f"Unrealized PnL: {self.format_currency(portfolio.get('unrealized_pnl', 0))}")
+        self._emit(f"Total PnL:      {self.format_currency(portfolio.get('total_pnl', 0))}")
+        self._emit(f"Total Value:    {self.format_currency(portfolio.get('total_value', 0))}")
+        self._emit(f"ROI:            {self.format_percentage(portfolio.get('roi', 0))}")
+        self._emit()
         
-        print("📈 TRADING STATS")
-        print("-" * 40)
-        print(f"Total Trades:   {portfolio.get('total_trades', 0)}")
-        print(f"Win Rate:       {self.format_percentage(portfolio.get('win_rate', 0))}")
-        print(f"Open Positions: {portfolio.get('open_positions', 0)}")
-        print(f"Largest Win:    {self.format_currency(portfolio.get('largest_win', 0))}")
-        print(f"Largest Loss:   {self.format_currency(portfolio.get('largest_loss', 0))}")
-        print(f"Total Fees:     {self.format_currency(portfolio.get('total_fees', 0))}")
-        print()
+        self._emit("📈 TRADING STATS")
+        self._emit("-" * 40)
+        self._emit(f"Total Trades:   {portfolio.get('total_trades', 0)}")
+        self._emit(f"Win Rate:       {self.format_percentage(portfolio.get('win_rate', 0))}")
+        self._emit(f"Open Positions: {portfolio.get('open_positions', 0)}")
+        self._emit(f"Largest Win:    {self.format_currency(portfolio.get('largest_win', 0))}")
+        self._emit(f"Largest Loss:   {self.format_currency(portfolio.get('largest_loss', 0))}")
+        self._emit(f"Total Fees:     {self.format_currency(portfolio.get('total_fees', 0))}")
+        self._emit()
+    
+    def _position_pnl_pcts(self, positions: list) -> List[float]:
+        """PnL% of each position, vectorized with NumPy for large position books"""
+        if len(positions) < VECTORIZE_MIN_POSITIONS:
+            return [(pos.unrealized_pnl / (pos.size * pos.entry_price)) * 100 if pos.size * pos.entry_price > 0 else 0
+                    for pos in positions]
+        
+        import numpy as np
+        
+        count = len(positions)
+        size = np.fromiter((pos.size for pos in positions), float, count)
+        entry_price = np.fromiter((pos.entry_price for pos in positions), float, count)
+        unrealized_pnl = np.fromiter((pos.unrealized_pnl for pos in positions), float, count)
+        
+        notional = size * entry_price
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pnl_pct = np.where(notional > 0, unrealized_pnl / notional * 100.0, 0.0)
+        return pnl_pct.tolist()
     
     def render_open_positions(self, positions: list):
         """Render open positions"""
         if not positions:
-            print("📋 OPEN POSITIONS: None")
-            print()
+            self._emit("📋 OPEN POSITIONS: None")
+            self._emit()
             return
         
-        print("📋 OPEN POSITIONS")
-        print("-" * 80)
-        print(f"{'Symbol':<8} {'Side':<6} {'Entry':<10} {'Current':<10} {'Size':<10} {'PnL':<12} {'%':<8}")
-        print("-" * 80)
+        self._emit("📋 OPEN POSITIONS")
+        self._emit("-" * 80)
+        self._emit(_POS_HEADER)
+        self._emit("-" * 80)
         
-        for pos in positions:
-            pnl_pct = (pos.unrealized_pnl / (pos.size * pos.entry_price)) * 100 if pos.size * pos.entry_price > 0 else 0
-            print(f"{pos.symbol:<8} {pos.side.upper():<6} ${pos.entry_price:<9.2f} ${pos.current_price:<9.2f} "
-                  f"{pos.size:<9.4f} {self.format_currency(pos.unrealized_pnl):<11} {self.format_percentage(pnl_pct):<8}")
-        print()
+        for pos, pnl_pct in zip(positions, self._position_pnl_pcts(positions)):
+            self._emit(_POS_ROW.format(symbol=pos.symbol, side=pos.side.upper(),
+                                       entry=pos.entry_price, current=pos.current_price,
+                                       size=pos.size, pnl=self.format_currency(pos.unrealized_pnl),
+                                       pct=self.format_percentage(pnl_pct)))
+        self._emit()
     
     def render_recent_trades(self, trades: list):
         """Render recent completed trades"""
         if not trades:
-            print("📝 RECENT TRADES: None")
-            print()
+            self._emit("📝 RECENT TRADES: None")
+            self._emit()
             return
         
-        print("📝 RECENT TRADES")
-        print("-" * 80)
-        print(f"{'Symbol':<8} {'Side':<6} {'Entry':<10} {'Exit':<10} {'PnL':<12} {'Time':<12}")
-        print("-" * 80)
+        self._emit("📝 RECENT TRADES")
+        self._emit("-" * 80)
+        self._emit(_TRADE_HEADER)
+        self._emit("-" * 80)
         
         for trade in trades:
-            if trade.exit_time:
-                exit_time = datetime.fromisoformat(trade.exit_time.replace('Z', '+00:00')).strftime('%H:%M:%S')
-            else:
-                exit_time = "N/A"
+            exit_time = trade.exit_display_time if trade.exit_time else "N/A"
             
-            print(f"{trade.symbol:<8} {trade.side.upper():<6} ${trade.entry_price:<9.2f} ${trade.exit_price or 0:<9.2f} "
-                  f"{self.format_currency(trade.realized_pnl):<11} {exit_time:<12}")
-        print()
+            self._emit(_TRADE_ROW.format(symbol=trade.symbol, side=trade.side.upper(),
+                                         entry=trade.entry_price, exit=trade.exit_price or 0,
+                                         pnl=self.format_currency(trade.realized_pnl), time=exit_time))
+        self._emit()
     
     def render_controls(self):
         """Render control instructions"""
-        print("🎮 CONTROLS")
-        print("-" * 40)
-        if self.dry_run_mode:
-            print("Press 'L' + ENTER: Switch to LIVE trading")
-        else:
-            print("Press 'D' + ENTER: Switch to DRY RUN mode")
-        print("Press 'Q' + ENTER: Quit dashboard")
-        print("Press 'R' + ENTER: Reset simulation data")
-        print("Press 'T' + ENTER: Force test trade")
-        print()
+        self._frame.extend(_controls_lines(self.dry_run_mode))
+    
+    def flash(self, message: str, duration: Optional[float] = None):
+        """
+        Show command feedback inside the frame for duration seconds (one refresh
+        by default); anything printed below the frame is wiped by the next redraw
+        """
+        self._banner = (message, time.monotonic() + (self.refresh_rate if duration is None else duration))
+    
+    def banner_line(self):
+        """Render the command feedback until it expires"""
+        if self._banner is None:
+            return
+        message, expires_at = self._banner
+        if time.monotonic() >= expires_at:
+            self._banner = None
+            return
+        self._emit(message)
+        self._emit()
     
     def display_dashboard(self):
         """Display the main dashboard"""
@@ -437,21 +651,67 @@ class TradingDashboard:
             # Get current status
             status = self.get_bot_status()
             
-            # Clear screen and render dashboard
-            self.clear_screen()
-            
-            # Render all sections
+            # Render all sections into the frame buffer
+            self._frame = []
             self.render_header(status)
             self.render_portfolio_summary(status["portfolio"])
             self.render_open_positions(status["positions"])
             self.render_recent_trades(status["recent_trades"])
             self.render_controls()
+            self.banner_line()
             
-            print(f"🔄 Auto-refresh every {self.refresh_rate}s | Last update: {datetime.now().strftime('%H:%M:%S')}")
+            self._emit(f"🔄 Auto-refresh every {self.refresh_rate}s | Last update: {datetime.now().strftime('%H:%M:%S')}")
+            
+            self.flush_frame()
             
         except Exception as e:
+            self._frame = []
+            self.invalidate()
             print(f"❌ Dashboard error: {e}")
     
+    def stop(self):
+        """Stop the dashboard loop"""
+        self.is_running = False
+    
+    def handle_command(self, cmd: str):
+        """Run the control bound to cmd, ignoring unknown input"""
+        handler = self._commands.get(cmd.lower().strip())
+        if handler:
+            handler()
+            # Commands change state, so the next frame must not reuse the snapshot
+            self._status_cache = None
+    
+    def wait_for_command(self, timeout: float) -> Optional[str]:
+        """Wait up to timeout seconds for a line of input, None if none arrives"""
+        deadline = time.monotonic() + timeout
+        
+        if os.name == 'nt':
+            import msvcrt
+            while True:
+                while msvcrt.kbhit():
+                    ch = msvcrt.getwche()
+                    if ch in '\r\n':
+                        line = ''.join(self._typed)
+                        self._typed = []
+                        return line
+                    self._typed.append(ch)
+                if time.monotonic() >= deadline:
+                    return None
+                time.sleep(0.05)
+        
+        remaining = timeout
+        while remaining > 0:
+            ready, _, _ = select.select([sys.stdin], [], [], remaining)
+            if ready:
+                line = sys.stdin.readline()
+                if line:
+                    return line
+                # EOF: stdin will stay readable, so fall back to sleeping
+                time.sleep(max(0.0, deadline - time.monotonic()))
+                return None
+            remaining = deadline - time.monotonic()
+        return None
+    
     def run_interactive(self):
         """Run interactive dashboard mode"""
         print("🚀 Starting Interactive Trading Dashboard...")
@@ -459,62 +719,118 @@ class TradingDashboard:
         time.sleep(2)
         
         self.is_running = True
+        self.invalidate()
+        # Repaint from scratch when the terminal is resized
+        with silence_console_logging(), on_resize(self.invalidate):
+            try:
+                while self.is_running:
+                    # Display dashboard
+                    self.display_dashboard()
+                    
+                    # Wait for refresh or user input
+                    print("\nEnter command (or wait for auto-refresh): ", end="", flush=True)
+                    
+                    # Redraw as soon as a command arrives, otherwise on the refresh interval
+                    cmd = self.wait_for_command(self.refresh_rate)
+                    if cmd is not None:
+                        self.handle_command(cmd)
+                        continue
+                    
+                    # Simulate some commands for demo
+                    if _RNG.random() < 0.1:  # 10% chance to simulate a test trade
+                        self.force_test_trade()
+                    
+            except KeyboardInterrupt:
+                print("\n\n👋 Dashboard stopped by user")
+            except Exception as e:
+                print(f"\n❌ Dashboard error: {e}")
+            finally:
+                self.is_running = False
+    
+    def toggle_dry_run_mode(self):
+        """Toggle between dry run and live trading"""
+        from config import trade_config as cfg
         
-        try:
-            while self.is_running:
-                # Display dashboard
-                self.display_dashboard()
-                
-                # Wait for refresh or user input
-                print("\nEnter command (or wait for auto-refresh): ", end="", flush=True)
-                
-                # Simulate user input check (in real implementation, you'd use proper input handling)
-                time.sleep(self.refresh_rate)
-                
-                # Simulate some commands for demo
-                import random
-                if random.random() < 0.1:  # 10% chance to simulate a test trade
-                    self.force_test_trade()
-                
-        except KeyboardInterrupt:
-            print("\n\n👋 Dashboard stopped by user")
-        except Exception as e:
-            print(f"\n❌ Dashboard error: {e}")
-        finally:
-            self.is_running = False
+        if cfg.DRY_RUN:
+            # In a real implementation, you'd confirm with the user here
+            # For now, we'll keep it in dry run for safety
+            self.flash("⚠️  Live trading requested - safety override, staying in DRY RUN")
+            return False
+        else:
+            cfg.DRY_RUN = True
+            self.flash("✅ Switched to DRY RUN mode")
+            return True
+    
+    def reset_simulation(self):
+        """Reset simulation data"""
+        # For demo purposes, we'll just show the message
+        self.flash("⚠️  Reset skipped (demo mode) - trades and balance kept")
+        return False
     
     def force_test_trade(self):
         """Force a test trade for demonstration"""
         try:
             from core.simulation_engine import simulator
-            import random
             
             # Create a random test trade
-            side = random.choice(["long", "short"])
-            trade_size = random.uniform(100, 500)
+            side = _RNG.choice(["long", "short"])
+            trade_size = _RNG.uniform(100, 500)
             
-            print(f"\n🧪 Creating test {side} trade: ${trade_size:.2f}")
             position_id = simulator.open_position("ETH", side, trade_size, leverage=2.0)
             
             if position_id:
-                print(f"✅ Test position created: {position_id}")
+                self.flash(f"🧪 Test {side} trade ${trade_size:.2f}: ✅ position created: {position_id}")
             else:
-                print("❌ Failed to create test position")
-        except:
-            print("❌ Test trade failed - simulation engine not available")
+                self.flash(f"🧪 Test {side} trade ${trade_size:.2f}: ❌ failed to create position")
+        except ImportError:
+            self.flash("❌ Test trade failed - simulation engine not available")
+        except Exception as e:
+            self.flash(f"❌ Test trade failed: {e}")
 
 # =============================================================================
 # WEB DASHBOARD (from dashboard/web_dashboard.py)
 # =============================================================================
 
+LOG_TAIL_BYTES = 64 * 1024  # read at most this much from the end of the log
+LOG_TAIL_LINES = 500
+
+_log_cache = {"key": None, "lines": []}
+_log_cache_lock = threading.Lock()
+
+def read_log_tail(path: str) -> List[str]:
+    """Return the last LOG_TAIL_LINES lines of path, rereading only when it changes"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return []
+    
+    key = (path, st.st_mtime_ns, st.st_size)
+    with _log_cache_lock:
+        if _log_cache["key"] != key:
+            # One byte before the window tells whether its first line starts whole
+            start = max(0, st.st_size - LOG_TAIL_BYTES - 1)
+            with open(path, "rb") as f:
+                f.seek(start)
+                data = f.read()
+            if start:
+                newline = data.find(b"\n")
+                data = data[newline + 1:] if newline >= 0 else b""  # drop the partial first line
+            lines = data.decode("utf-8", "replace").splitlines(keepends=True)
+            _log_cache["lines"] = lines[-LOG_TAIL_LINES:]
+            _log_cache["key"] = key
+        return _log_cache["lines"]
+
 class WebDashboard:
     """
     Web-based dashboard using Flask
     """
     
+    # Seconds browsers may reuse a page before polling the log again
+    CACHE_MAX_AGE = 2
+    
     def __init__(self):
+        # Flask is imported and the app built on first run()
         self.app = None
-        self.setup_flask()
     
     def setup_flask(self):
         """Setup Flask application"""
@@ -526,30 +842,27 @@ class WebDashboard:
             
             @self.app.route("/")
             def index():
-                # Read log file
-                logs = []
-                if os.path.exists(LOG_FILE):
-                    with open(LOG_FILE, "r") as f:
-                        logs = f.readlines()
-                return render_template("index.html", logs=logs, dry_run=DRY_RUN)
+                return render_template("index.html", logs=read_log_tail(LOG_FILE), dry_run=DRY_RUN)
             
             @self.app.route("/logs")
             def logs():
-                # Read log file
-                logs = []
-                if os.path.exists(LOG_FILE):
-                    with open(LOG_FILE, "r") as f:
-                        logs = f.readlines()
-                return render_template("logs.html", logs=logs)
+                return render_template("logs.html", logs=read_log_tail(LOG_FILE))
+            
+            @self.app.after_request
+            def add_cache_headers(response):
+                response.cache_control.max_age = self.CACHE_MAX_AGE
+                return response
             
         except ImportError:
             print("Flask not available - web dashboard disabled")
             self.app = None
     
-    def run(self, debug=True, port=5000):
+    def run(self, debug=False, port=5000):
         """Run the web dashboard"""
+        if self.app is None:
+            self.setup_flask()
         if self.app:
-            self.app.run(debug=debug, port=port)
+            self.app.run(debug=debug, port=port, threaded=True, use_reloader=False)
         else:
             print("Web dashboard not available - Flask not installed")
 
@@ -573,7 +886,7 @@ def start_trading_dashboard(interactive=True):
     else:
         return trading_dashboard.run_background()
 
-def start_web_dashboard(debug=True, port=5000):
+def start_web_dashboard(debug=False, port=5000):
     """Start the web dashboard"""
     web_dashboard.run(debug=debug, port=port)
 
@@ -582,7 +895,7 @@ dashboard = minimal_dashboard
 
 # Export all classes and functions
 __all__ = [
-    'MinimalDashboard', 'TradingDashboard', 'WebDashboard',
+    'MinimalDashboard', 'TradingDashboard', 'WebDashboard', 'read_log_tail',
     'minimal_dashboard', 'trading_dashboard', 'web_dashboard',
     'start_minimal_dashboard', 'start_trading_dashboard', 'start_web_dashboard',
     'dashboard'
@@ -3,9 +3,15 @@ Consolidated Logger Module
 Combines all logging functionality from various modules
 """
 import os
+import time
+import queue
+import atexit
 import logging
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, BinaryIO, Optional
+
+from app_config import AUDIT_ENABLED
 
 # =============================================================================
 # CONFIGURATION
@@ -18,34 +24,123 @@ os.makedirs(LOG_DIR, exist_ok=True)
 # Timestamped log file name
 LOG_FILE = os.path.join(LOG_DIR, f"bot_{datetime.now().strftime('%Y-%m-%d')}.log")
 
-# Configure main logger
+# Configure main logger; the file rotates so it stays cheap to tail, and
+# console echo is skipped when a dashboard owns the terminal
+_log_handlers = [RotatingFileHandler(LOG_FILE, maxBytes=10_000_000, backupCount=5, delay=True)]
+if not os.environ.get("DASHBOARD_ACTIVE"):
+    _log_handlers.append(logging.StreamHandler())
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    handlers=[
-        logging.FileHandler(LOG_FILE),
-        logging.StreamHandler()
-    ]
+    handlers=_log_handlers
 )
 
 # Get logger instance
 logger = logging.getLogger("TradingBot")
 
+# Plain-text audit and transfer logs
+TRADE_LOG_PATH = "trade_log.txt"
+TRANSFER_LOG_PATH = os.path.join(LOG_DIR, "transfer_log.txt")
+
+class _BinaryAppendHandler(logging.Handler):
+    """Appends pre-encoded lines (record.msg) to a file kept open between writes"""
+    
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self.stream: Optional[BinaryIO] = None
+    
+    def emit(self, record: logging.LogRecord):
+        # Same failure handling as StreamHandler: an I/O error is reported, not
+        # raised into the listener thread, so later lines are still written
+        try:
+            if self.stream is None:
+                self.stream = open(self.path, "ab", buffering=0)
+            self.stream.write(record.msg)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def close(self):
+        self.acquire()
+        try:
+            if self.stream is not None:
+                self.stream.close()
+                self.stream = None
+        finally:
+            self.release()
+        super().close()
+
+class _PassthroughQueueHandler(QueueHandler):
+    """Enqueues records untouched since audit lines are already rendered bytes"""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+def _file_only_logger(name: str, handler: logging.Handler) -> logging.Logger:
+    """Logger that only feeds the shared write queue"""
+    handler.addFilter(logging.Filter(name))
+    file_logger = logging.getLogger(name)
+    file_logger.setLevel(logging.INFO)
+    file_logger.propagate = False
+    file_logger.addHandler(_queue_handler)
+    return file_logger
+
+# Audit and transfer lines are queued by the caller and written on a
+# background thread, so trading code never blocks on disk I/O
+_log_queue = queue.SimpleQueue()
+_queue_handler = _PassthroughQueueHandler(_log_queue)
+_trade_log_handler = _BinaryAppendHandler(TRADE_LOG_PATH)
+_transfer_log_handler = _BinaryAppendHandler(TRANSFER_LOG_PATH)
+_audit_logger = _file_only_logger("TradingBot.audit", _trade_log_handler)
+_transfer_logger = _file_only_logger("TradingBot.transfer", _transfer_log_handler)
+
+_log_listener = QueueListener(_log_queue, _trade_log_handler, _transfer_log_handler)
+_log_listener.start()
+
+def _stop_log_listener():
+    """Drain queued lines to disk and close the log files"""
+    _log_listener.stop()
+    _trade_log_handler.close()
+    _transfer_log_handler.close()
+
+atexit.register(_stop_log_listener)
+
+# Cached b"YYYY-MM-DDTHH:MM:SS" prefix for the current UTC second
+_ts_second = (-1, b"")
+
+def _utc_timestamp() -> bytes:
+    """UTC ISO-8601 timestamp with microseconds, formatting the date part once per second"""
+    global _ts_second
+    sec, frac = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _ts_second
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec)).encode("ascii")
+        _ts_second = (sec, prefix)
+    return b"%s.%06d" % (prefix, frac // 1000)
+
+# Per entry type b"[TYPE] %s | %s\n" templates, built on first use
+_entry_templates: Dict[str, bytes] = {}
+
 # =============================================================================
 # AUDIT LOGGER (from logger/audit_logger.py)
 # =============================================================================
 
-def _write_log(entry_type: str, details: str):
-    """Write log entry with timestamp"""
-    timestamp = datetime.utcnow().isoformat()
-    log_entry = f"[{entry_type}] {timestamp} | {details}\n"
-
-    # Only create directory if LOG_PATH has a directory component
-    log_dir = os.path.dirname("trade_log.txt")
-    if log_dir:
-        os.makedirs(log_dir, exist_ok=True)
-    with open("trade_log.txt", "a") as f:
-        f.write(log_entry)
+def _write_log(entry_type: str, details: str, *args):
+    """Write log entry with timestamp; `details % args` is only formatted when auditing is on"""
+    if not AUDIT_ENABLED:
+        return
+    if args:
+        details = details % args
+    template = _entry_templates.get(entry_type)
+    if template is None:
+        template = f"[{entry_type.replace('%', '%%')}] %s | %s\n".encode("utf-8")
+        _entry_templates[entry_type] = template
+    if not isinstance(details, str):
+        details = str(details)
+    _audit_logger.info(template % (_utc_timestamp(), details.encode("utf-8")))
 
 def log_signal(signal: str):
     """Log trading signal"""
@@ -61,11 +156,11 @@ def log_execution(details: str):
 
 def log_pnl_alert(pnl: float):
     """Log PnL alert"""
-    _write_log("PNL_ALERT", {"pnl": pnl})
+    _write_log("PNL_ALERT", f"pnl={pnl:.6f}")
 
 def log_auto_close(pnl: float):
     """Log auto close event"""
-    _write_log("AUTO_CLOSE", {"pnl": pnl})
+    _write_log("AUTO_CLOSE", f"pnl={pnl:.6f}")
 
 # =============================================================================
 # TRANSFER LOGGER (from safe_wallet_manager/transfer_logger.py)
@@ -73,8 +168,7 @@ def log_auto_close(pnl: float):
 
 def log_transfer(wallet: str, recipient: str, amount: float, tx_id: str):
     """Log wallet transfer"""
-    with open(f"{LOG_DIR}/transfer_log.txt", "a") as f:
-        f.write(f"{wallet} → {recipient} | {amount:.6f} SOL | tx: {tx_id}\n")
+    _transfer_logger.info(f"{wallet} → {recipient} | {amount:.6f} SOL | tx: {tx_id}\n".encode("utf-8"))
 
 # =============================================================================
 # GENERAL LOGGER (from wallet/logger.py)
@@ -114,6 +208,7 @@ def log_trade_action(action: str):
 
 # For backward compatibility with existing imports
 audit_logger = type('AuditLogger', (), {
+    'AUDIT_ENABLED': AUDIT_ENABLED,
     '_write_log': _write_log,
     'log_signal': log_signal,
     'log_simulation': log_simulation,
@@ -129,6 +224,7 @@ transfer_logger = type('TransferLogger', (), {
 # Export all functions for easy importing
 __all__ = [
     'logger', 'log_info', 'log_warning', 'log_error', 'log_debug', 'log_event',
+    'AUDIT_ENABLED',
     '_write_log', 'log_signal', 'log_simulation', 'log_execution', 
     'log_pnl_alert', 'log_auto_close', 'log_transfer', 'log_trade_action',
     'audit_logger', 'transfer_logger'
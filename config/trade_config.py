@@ -1,5 +1,7 @@
 # config/trade_config.py
 
+from dataclasses import dataclass
+
 # Import safety configuration first
 from config.safety_config import safety
 
@@ -16,19 +18,56 @@ AUTO_MODE = False      # True = auto-confirm trades, False = manual confirmation
 if not DRY_RUN and FORCED_DRY_RUN:
     DRY_RUN = True  # Force dry run for safety
 
+# === Fixed trading settings ===
+# Frozen once at import; the module constants below are read from CONFIG so
+# every spelling agrees. DRY_RUN/AUTO_MODE stay plain module attributes because
+# the dashboards toggle them at runtime.
+@dataclass(frozen=True)
+class TradeConfig:
+    """Immutable snapshot of the fixed trading settings"""
+    __slots__ = ("forced_dry_run", "signal_threshold", "trade_size_usd", "leverage",
+                 "pnl_alert_threshold", "max_loss_threshold", "auto_close_enabled",
+                 "cycle_delay_seconds", "log_file", "verbose", "audit_enabled")
+    forced_dry_run: bool
+    signal_threshold: float
+    trade_size_usd: float
+    leverage: int
+    pnl_alert_threshold: float
+    max_loss_threshold: float
+    auto_close_enabled: bool
+    cycle_delay_seconds: int
+    log_file: str
+    verbose: bool
+    audit_enabled: bool
+
+CONFIG = TradeConfig(
+    forced_dry_run=FORCED_DRY_RUN,
+    signal_threshold=0.75,       # Minimum confidence to trigger a signal
+    trade_size_usd=100,          # Default trade size in USD
+    leverage=1,                  # Leverage multiplier for perps
+    pnl_alert_threshold=20.0,    # Alert when profit exceeds this
+    max_loss_threshold=50.0,     # Max loss before auto-close
+    auto_close_enabled=True,     # Enable automatic position closing
+    cycle_delay_seconds=60,      # Delay between trading cycles
+    log_file="trade_log.txt",
+    verbose=False,               # Enable detailed logging
+    audit_enabled=True,          # Write audit entries (signals, executions, PnL) to LOG_FILE
+)
+
 # === Strategy Parameters ===
-SIGNAL_THRESHOLD = 0.75  # Minimum confidence to trigger a signal
+SIGNAL_THRESHOLD = CONFIG.signal_threshold
 
 # === Risk Management ===
-TRADE_SIZE_USD = 100    # Default trade size in USD
-LEVERAGE = 1           # Leverage multiplier for perps
-PNL_ALERT_THRESHOLD = 20.0   # Alert when profit exceeds this
-MAX_LOSS_THRESHOLD = 50.0    # Max loss before auto-close
-AUTO_CLOSE_ENABLED = True    # Enable automatic position closing
+TRADE_SIZE_USD = CONFIG.trade_size_usd
+LEVERAGE = CONFIG.leverage
+PNL_ALERT_THRESHOLD = CONFIG.pnl_alert_threshold
+MAX_LOSS_THRESHOLD = CONFIG.max_loss_threshold
+AUTO_CLOSE_ENABLED = CONFIG.auto_close_enabled
 
 # === Timing ===
-CYCLE_DELAY_SECONDS = 60    # Delay between trading cycles
+CYCLE_DELAY_SECONDS = CONFIG.cycle_delay_seconds
 
 # === Logging ===
-LOG_FILE = "trade_log.txt"
-VERBOSE = False             # Enable detailed logging
+LOG_FILE = CONFIG.log_file
+VERBOSE = CONFIG.verbose
+AUDIT_ENABLED = CONFIG.audit_enabled
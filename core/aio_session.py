@@ -0,0 +1,60 @@
+"""
+aiohttp sessions that follow the running event loop
+A ClientSession belongs to the loop it was created on; reusing it from a later
+loop (e.g. a second asyncio.run) makes every request fail, so the session is
+rebuilt whenever the running loop changes and closed at interpreter exit
+"""
+import asyncio
+import atexit
+from typing import Any, Callable, Optional
+
+class LoopBoundSession:
+    """
+    Lazily created aiohttp ClientSession for whichever event loop is running
+    factory builds the session (called with that loop running); callers keep one
+    LoopBoundSession per client instead of a bare session attribute
+    """
+    
+    def __init__(self, factory: Callable[[], Any]):
+        self._factory = factory
+        self._session = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        atexit.register(self.close_at_exit)
+    
+    def get(self):
+        """Session for the running loop, replacing one left over from an earlier loop"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            self._detach()
+            self._session = self._factory()
+            self._loop = loop
+        return self._session
+    
+    def _detach(self):
+        """
+        Drop the current session without awaiting its close: its loop has ended,
+        so it can no longer be closed there. detach() marks it closed, and the dead
+        loop's sockets are released when the connector is collected
+        """
+        session, self._session, self._loop = self._session, None, None
+        if session is not None and not session.closed:
+            session.detach()
+    
+    async def aclose(self):
+        """Close the session on the running loop"""
+        session, self._session, self._loop = self._session, None, None
+        if session is not None and not session.closed:
+            await session.close()
+    
+    def close_at_exit(self):
+        """Close a still-open session at exit, on its own loop if that loop is idle but not closed"""
+        session, loop = self._session, self._loop
+        if session is None or session.closed:
+            return
+        if loop is not None and not loop.is_closed() and not loop.is_running():
+            try:
+                loop.run_until_complete(self.aclose())
+                return
+            except RuntimeError:
+                pass
+        self._detach()
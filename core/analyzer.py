@@ -1,30 +1,50 @@
 # analyzer.py
 
-from collections import defaultdict
+from collections import Counter, defaultdict, namedtuple
 from datetime import datetime
+from itertools import groupby
+from operator import attrgetter
+
+# One parsed log entry
+ParsedEntry = namedtuple("ParsedEntry", "time asset signal conviction")
+
+# Memo of timestamp string -> datetime; log bursts repeat the same timestamp
+_ts_cache = {}
+_TS_CACHE_MAX = 4096
+
+def _parse_timestamp(ts_str):
+    """
+    Memoized datetime.fromisoformat; the memo is reset once it reaches _TS_CACHE_MAX entries.
+    """
+    parsed = _ts_cache.get(ts_str)
+    if parsed is None:
+        if len(_ts_cache) >= _TS_CACHE_MAX:
+            _ts_cache.clear()
+        parsed = _ts_cache[ts_str] = datetime.fromisoformat(ts_str)
+    return parsed
 
 def parse_logs(log_entries):
     """
     Parses structured log entries into a usable format.
     Assumes each entry is a dict with keys: timestamp, asset, signal_type, conviction_level
+    Returns an immutable tuple of ParsedEntry sorted chronologically, as the analyzers below expect.
     """
-    parsed = []
-    for entry in log_entries:
-        parsed.append({
-            "time": datetime.fromisoformat(entry["timestamp"]),
-            "asset": entry["asset"],
-            "signal": entry["signal_type"],
-            "conviction": entry.get("conviction_level", None)
-        })
-    return parsed
+    parsed = [
+        ParsedEntry(_parse_timestamp(entry["timestamp"]), entry["asset"],
+                    entry["signal_type"], entry.get("conviction_level", None))
+        for entry in log_entries
+    ]
+    parsed.sort(key=attrgetter("time"))
+    return tuple(parsed)
 
 def signal_stats(parsed_logs):
     """
     Returns frequency of each signal type per asset.
     """
-    stats = defaultdict(lambda: defaultdict(int))
-    for entry in parsed_logs:
-        stats[entry["asset"]][entry["signal"]] += 1
+    counts = Counter((entry.asset, entry.signal) for entry in parsed_logs)
+    stats = defaultdict(dict)
+    for (asset, signal), count in counts.items():
+        stats[asset][signal] = count
     return stats
 
 def detect_flip_flops(parsed_logs, cooldown_threshold=3):
@@ -34,37 +54,34 @@ def detect_flip_flops(parsed_logs, cooldown_threshold=3):
     flip_flops = []
     last_asset = None
     last_time = None
+    times = [entry.time for entry in parsed_logs]
+    assets = [entry.asset for entry in parsed_logs]
 
-    for entry in parsed_logs:
-        if last_asset and entry["asset"] != last_asset:
-            time_diff = (entry["time"] - last_time).seconds
+    for entry_time, asset in zip(times, assets):
+        if last_asset and asset != last_asset:
+            time_diff = (entry_time - last_time).total_seconds()
             if time_diff < cooldown_threshold:
                 flip_flops.append({
                     "from": last_asset,
-                    "to": entry["asset"],
-                    "time": entry["time"],
+                    "to": asset,
+                    "time": entry_time,
                     "seconds_between": time_diff
                 })
-        last_asset = entry["asset"]
-        last_time = entry["time"]
+        last_asset = asset
+        last_time = entry_time
     return flip_flops
 
 def conviction_trace(parsed_logs):
     """
     Tracks how long each conviction level lasted before switching.
     """
-    traces = []
-    current = None
-    start_time = None
+    # (conviction, start time) of each run of identical conviction levels
+    runs = [(conviction, next(group).time)
+            for conviction, group in groupby(parsed_logs, key=attrgetter("conviction"))]
 
-    for entry in parsed_logs:
-        if current != entry["conviction"]:
-            if current is not None:
-                duration = (entry["time"] - start_time).seconds
-                traces.append({
-                    "conviction": current,
-                    "duration_seconds": duration
-                })
-            current = entry["conviction"]
-            start_time = entry["time"]
-    return traces
\ No newline at end of file
+    # A run's duration lasts until the next run starts; the open last run is not reported
+    return [
+        {"conviction": conviction, "duration_seconds": (next_start - start).total_seconds()}
+        for (conviction, start), (_, next_start) in zip(runs, runs[1:])
+        if conviction is not None
+    ]
\ No newline at end of file
@@ -3,14 +3,63 @@ Drift Protocol Client for ETH Perpetuals Trading
 Provides real perps data including funding rates, mark prices, and positions
 """
 import asyncio
+import sys
 import json
+import time
+import functools
+import threading
 import requests
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, Optional, List, Tuple, Callable
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from core.aio_session import LoopBoundSession
 
-@dataclass
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Decode response bodies with orjson when installed, falling back to stdlib json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+DEFAULT_RPC_URL = "https://api.mainnet-beta.solana.com"
+
+# (connect, read) timeout applied to every DLOB request
+REQUEST_TIMEOUT = (3, 10)
+
+# Pooled keep-alive connections with retry/backoff on throttling and gateway errors
+POOL_SIZE = 32
+RETRY_POLICY = Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504])
+
+# DLOB fixed-point scales and market constants
+_PRICE_SCALE = 1e-6          # prices, OI and volume use 6 decimals
+_FUNDING_SCALE = 1e-9        # funding rates use 9 decimals
+_FUNDING_ANNUALIZER = 365 * 24  # hourly funding periods per year
+_ETH_MARKET_INDEX = 2
+
+# Seconds a DLOB response stays fresh before it is fetched again
+PERP_DATA_TTL = 1.0       # mark price moves every ~1s
+TRADES_TTL = 2.0
+MARKET_STATS_TTL = 30.0
+FUNDING_HISTORY_TTL = 300.0  # funding settles hourly
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters get plain frozen classes
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True)
 class PerpMarketData:
+    __slots__ = ("market_index", "symbol", "mark_price", "index_price", "funding_rate", "open_interest",
+                 "base_asset_amount_long", "base_asset_amount_short", "volume_24h", "price_change_24h")
+    
     market_index: int
     symbol: str
     mark_price: float
@@ -22,7 +71,7 @@ class PerpMarketData:
     volume_24h: float
     price_change_24h: float
     
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)  # defaulted fields rule out a hand-written __slots__
 class OrderParams:
     market_type: str  # "perp" or "spot"
     market_index: int
@@ -32,8 +81,11 @@ class OrderParams:
     order_type: str = "market"  # "market", "limit", "stop_market", "stop_limit"
     reduce_only: bool = False
     
-@dataclass
+@dataclass(frozen=True)
 class Position:
+    __slots__ = ("market_index", "base_asset_amount", "quote_asset_amount", "last_cumulative_funding_rate",
+                 "last_funding_rate_ts", "open_orders", "settle_pnl")
+    
     market_index: int
     base_asset_amount: int
     quote_asset_amount: int
@@ -41,51 +93,167 @@ class Position:
     last_funding_rate_ts: int
     open_orders: int
     settle_pnl: int
+
+@dataclass(frozen=True)
+class MarketConditions:
+    __slots__ = ("market_data", "mark_vs_index_spread", "funding_rate_annual", "avg_recent_funding",
+                 "funding_trend", "volume_trend", "market_skew", "long_ratio", "oi_imbalance", "timestamp")
+    
+    market_data: PerpMarketData
+    mark_vs_index_spread: float
+    funding_rate_annual: float
+    avg_recent_funding: float
+    funding_trend: str   # "increasing", "decreasing" or "stable"
+    volume_trend: str    # "increasing", "decreasing" or "unknown"
+    market_skew: str     # "long_heavy", "short_heavy", "balanced" or "no_positions"
+    long_ratio: float
+    oi_imbalance: float
+    timestamp: str
     
 
+def _window_volumes(trades: List[Dict], window: int) -> Tuple[float, float]:
+    """Base-asset volume of the latest `window` trades and of the `window` before them, in one pass"""
+    # Kept in pure Python: windows are 10-20 JSON dicts, where float() parsing dominates and
+    # array conversion or JIT dispatch (NumPy/Numba) would cost more than the loop itself
+    recent_volume = older_volume = 0.0
+    for i, trade in enumerate(islice(trades, 2 * window)):
+        if i < window:
+            recent_volume += float(trade.get('baseAssetAmount', 0))
+        else:
+            older_volume += float(trade.get('baseAssetAmount', 0))
+    return recent_volume, older_volume
+
+class BatchCall:
+    """
+    Collects independent DriftClient reads and executes them as one batch
+    
+    DLOB has no combined or batch endpoint, so the batch is fanned out
+    concurrently on the client's worker pool; results come back in the
+    order the calls were added.
+    """
+    
+    def __init__(self, client: "DriftClient"):
+        self.client = client
+        self._calls: List[Tuple[Callable, tuple, dict]] = []
+    
+    def add_call(self, method: Callable, *args, **kwargs) -> "BatchCall":
+        """Queue a client method call for the batch"""
+        self._calls.append((method, args, kwargs))
+        return self
+    
+    def execute(self) -> List[Any]:
+        """Run all queued calls concurrently and return their results in order"""
+        calls, self._calls = self._calls, []
+        futures = [self.client.executor.submit(method, *args, **kwargs) for method, args, kwargs in calls]
+        return [future.result() for future in futures]
+
 class DriftClient:
     """
     Drift Protocol client for ETH perpetuals trading
     """
     
-    def __init__(self, rpc_url: str = "https://api.mainnet-beta.solana.com"):
+    def __init__(self, rpc_url: str = DEFAULT_RPC_URL):
         self.rpc_url = rpc_url
         self.base_url = "https://dlob.drift.trade"
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=RETRY_POLICY)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.session.headers.update({
             'Accept': 'application/json',
-            'Content-Type': 'application/json'
+            'Content-Type': 'application/json',
+            'Connection': 'keep-alive'
         })
         
+        # Worker pool for fanning out independent requests (created on first use)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        # aiohttp session for the async API (created on first use, per event loop)
+        self._aio_session = LoopBoundSession(self._new_aio_session)
+        
+        # (path, params) -> (expiry, raw body) for endpoints fetched with a TTL. Bodies are
+        # kept undecoded so every hit decodes its own copy that callers may mutate; the
+        # lock covers BatchCall workers reading and writing the dict concurrently
+        self._response_cache: Dict[Tuple, Tuple[float, bytes]] = {}
+        self._cache_lock = threading.Lock()
+        
         # Market mappings - ETH-PERP is typically market index 2
         self.markets = {
-            'ETH-PERP': 2,
+            'ETH-PERP': _ETH_MARKET_INDEX,
             'BTC-PERP': 1,
             'SOL-PERP': 0
         }
     
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Shared thread pool used to issue independent DLOB requests concurrently"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="drift")
+        return self._executor
+    
+    def close(self):
+        """Shut down the worker pool and release pooled connections"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self.session.close()
+    
+    def _cache_get(self, key: Tuple) -> Optional[Any]:
+        """Decode a cached response body if it has not expired"""
+        with self._cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() >= entry[0]:
+                self._response_cache.pop(key, None)
+                return None
+            body = entry[1]
+        return _json_loads(body)
+    
+    def _cache_put(self, key: Tuple, ttl: float, body: bytes) -> Any:
+        """Decode a response body, keeping the raw bytes for ttl seconds"""
+        data = _json_loads(body)
+        if ttl > 0:
+            with self._cache_lock:
+                self._response_cache[key] = (time.monotonic() + ttl, body)
+        return data
+    
+    def _get_json(self, path: str, params: Optional[Dict[str, Any]] = None, ttl: float = 0.0) -> Any:
+        """GET a DLOB endpoint on the pooled session and decode the JSON body"""
+        # Bodies are decoded whole rather than streamed: they are bounded by limit/depth
+        # and callers such as strategy/signal_detector consume the full trade dicts
+        key = (path, tuple(sorted(params.items())) if params else ())
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        response = self.session.get(f"{self.base_url}{path}", params=params, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return self._cache_put(key, ttl, response.content)
+    
+    @staticmethod
+    def _parse_perp_market(market_index: int, data: Dict[str, Any]) -> PerpMarketData:
+        """Convert a DLOB perp market payload into PerpMarketData"""
+        market = data.get('market', {})
+        
+        return PerpMarketData(
+            market_index=market_index,
+            symbol='ETH-PERP',
+            mark_price=float(market.get('markPrice', 0)) * _PRICE_SCALE,
+            index_price=float(market.get('indexPrice', 0)) * _PRICE_SCALE,
+            funding_rate=float(market.get('fundingRate', 0)) * _FUNDING_SCALE,
+            open_interest=float(market.get('openInterest', 0)) * _PRICE_SCALE,
+            base_asset_amount_long=int(market.get('baseAssetAmountLong', 0)),
+            base_asset_amount_short=int(market.get('baseAssetAmountShort', 0)),
+            volume_24h=float(market.get('volume24h', 0)) * _PRICE_SCALE,
+            price_change_24h=float(market.get('priceChange24h', 0))
+        )
+    
     def get_eth_perp_data(self) -> Optional[PerpMarketData]:
         """Get comprehensive ETH perpetuals market data"""
         try:
-            eth_market_index = self.markets['ETH-PERP']
-            response = self.session.get(f"{self.base_url}/markets/perp/{eth_market_index}")
-            response.raise_for_status()
-            
-            data = response.json()
-            market = data.get('market', {})
-            
-            return PerpMarketData(
-                market_index=eth_market_index,
-                symbol='ETH-PERP',
-                mark_price=float(market.get('markPrice', 0)) / 1e6,  # Drift uses 6 decimals
-                index_price=float(market.get('indexPrice', 0)) / 1e6,
-                funding_rate=float(market.get('fundingRate', 0)) / 1e9,  # 9 decimals for funding
-                open_interest=float(market.get('openInterest', 0)) / 1e6,
-                base_asset_amount_long=int(market.get('baseAssetAmountLong', 0)),
-                base_asset_amount_short=int(market.get('baseAssetAmountShort', 0)),
-                volume_24h=float(market.get('volume24h', 0)) / 1e6,
-                price_change_24h=float(market.get('priceChange24h', 0))
-            )
+            data = self._get_json(f"/markets/perp/{_ETH_MARKET_INDEX}", ttl=PERP_DATA_TTL)
+            return self._parse_perp_market(_ETH_MARKET_INDEX, data)
             
         except Exception as e:
             print(f"[ERROR] Failed to get ETH perp data: {e}")
@@ -94,12 +262,9 @@ class DriftClient:
     def get_funding_rate_history(self, market_index: int = 2, limit: int = 100) -> List[Dict]:
         """Get historical funding rates for ETH-PERP"""
         try:
-            response = self.session.get(
-                f"{self.base_url}/markets/perp/{market_index}/funding",
-                params={'limit': limit}
-            )
-            response.raise_for_status()
-            return response.json().get('fundingRates', [])
+            data = self._get_json(f"/markets/perp/{market_index}/funding", {'limit': limit},
+                                  FUNDING_HISTORY_TTL)
+            return data.get('fundingRates', [])
             
         except Exception as e:
             print(f"[ERROR] Failed to get funding rate history: {e}")
@@ -108,12 +273,7 @@ class DriftClient:
     def get_orderbook(self, market_index: int = 2, depth: int = 20) -> Dict[str, Any]:
         """Get ETH-PERP orderbook data"""
         try:
-            response = self.session.get(
-                f"{self.base_url}/orderbook/perp/{market_index}",
-                params={'depth': depth}
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._get_json(f"/orderbook/perp/{market_index}", {'depth': depth})
             
         except Exception as e:
             print(f"[ERROR] Failed to get orderbook: {e}")
@@ -122,12 +282,8 @@ class DriftClient:
     def get_trades_history(self, market_index: int = 2, limit: int = 100) -> List[Dict]:
         """Get recent trades for ETH-PERP"""
         try:
-            response = self.session.get(
-                f"{self.base_url}/trades/perp/{market_index}",
-                params={'limit': limit}
-            )
-            response.raise_for_status()
-            return response.json().get('trades', [])
+            data = self._get_json(f"/trades/perp/{market_index}", {'limit': limit}, TRADES_TTL)
+            return data.get('trades', [])
             
         except Exception as e:
             print(f"[ERROR] Failed to get trades history: {e}")
@@ -142,25 +298,124 @@ class DriftClient:
     def get_market_stats(self) -> Dict[str, Any]:
         """Get overall market statistics"""
         try:
-            response = self.session.get(f"{self.base_url}/stats")
+            return self._get_json("/stats", ttl=MARKET_STATS_TTL)
+            
+        except Exception as e:
+            print(f"[ERROR] Failed to get market stats: {e}")
+            return {}
+    
+    # ------------------------------------------------------------------
+    # Async API: same endpoints and error handling, for callers running an
+    # event loop. Uses one aiohttp ClientSession when aiohttp is installed,
+    # otherwise the blocking session on the shared worker pool.
+    # ------------------------------------------------------------------
+    
+    def _new_aio_session(self):
+        """aiohttp session for the running loop, sized like the blocking pool"""
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=POOL_SIZE, ttl_dns_cache=300, keepalive_timeout=75),
+            timeout=aiohttp.ClientTimeout(sock_connect=REQUEST_TIMEOUT[0], sock_read=REQUEST_TIMEOUT[1]),
+            headers=dict(self.session.headers)
+        )
+    
+    async def _aget_json(self, path: str, params: Optional[Dict[str, Any]] = None, ttl: float = 0.0) -> Any:
+        """GET a DLOB endpoint without blocking the event loop"""
+        if not AIOHTTP_AVAILABLE:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, self._get_json, path, params, ttl)
+        
+        key = (path, tuple(sorted(params.items())) if params else ())
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        async with self._aio_session.get().get(f"{self.base_url}{path}", params=params) as response:
             response.raise_for_status()
-            return response.json()
+            return self._cache_put(key, ttl, await response.read())
+    
+    async def aget_eth_perp_data(self) -> Optional[PerpMarketData]:
+        """Async version of get_eth_perp_data"""
+        try:
+            data = await self._aget_json(f"/markets/perp/{_ETH_MARKET_INDEX}", ttl=PERP_DATA_TTL)
+            return self._parse_perp_market(_ETH_MARKET_INDEX, data)
+            
+        except Exception as e:
+            print(f"[ERROR] Failed to get ETH perp data: {e}")
+            return None
+    
+    async def aget_funding_rate_history(self, market_index: int = 2, limit: int = 100) -> List[Dict]:
+        """Async version of get_funding_rate_history"""
+        try:
+            data = await self._aget_json(f"/markets/perp/{market_index}/funding", {'limit': limit},
+                                         FUNDING_HISTORY_TTL)
+            return data.get('fundingRates', [])
+            
+        except Exception as e:
+            print(f"[ERROR] Failed to get funding rate history: {e}")
+            return []
+    
+    async def aget_orderbook(self, market_index: int = 2, depth: int = 20) -> Dict[str, Any]:
+        """Async version of get_orderbook"""
+        try:
+            return await self._aget_json(f"/orderbook/perp/{market_index}", {'depth': depth})
+            
+        except Exception as e:
+            print(f"[ERROR] Failed to get orderbook: {e}")
+            return {}
+    
+    async def aget_trades_history(self, market_index: int = 2, limit: int = 100) -> List[Dict]:
+        """Async version of get_trades_history"""
+        try:
+            data = await self._aget_json(f"/trades/perp/{market_index}", {'limit': limit}, TRADES_TTL)
+            return data.get('trades', [])
+            
+        except Exception as e:
+            print(f"[ERROR] Failed to get trades history: {e}")
+            return []
+    
+    async def aget_market_stats(self) -> Dict[str, Any]:
+        """Async version of get_market_stats"""
+        try:
+            return await self._aget_json("/stats", ttl=MARKET_STATS_TTL)
             
         except Exception as e:
             print(f"[ERROR] Failed to get market stats: {e}")
             return {}
     
-    def check_market_conditions(self) -> Dict[str, Any]:
+    async def acheck_market_conditions(self) -> Optional[MarketConditions]:
+        """Async version of check_market_conditions; the three requests run concurrently"""
+        eth_data, funding_history, trades = await asyncio.gather(
+            self.aget_eth_perp_data(),
+            self.aget_funding_rate_history(limit=24),
+            self.aget_trades_history(limit=50)
+        )
+        return self._summarize_conditions(eth_data, funding_history, trades)
+    
+    async def aclose(self):
+        """Close the async session and release the blocking resources"""
+        await self._aio_session.aclose()
+        self.close()
+    
+    def check_market_conditions(self) -> Optional[MarketConditions]:
         """
         Analyze current market conditions for trading decisions
-        Returns comprehensive market analysis
+        Returns comprehensive market analysis, or None without market data
         """
-        eth_data = self.get_eth_perp_data()
+        # The three endpoints are independent, so fetch them as one batch
+        eth_data, funding_history, trades = (
+            BatchCall(self)
+            .add_call(self.get_eth_perp_data)
+            .add_call(self.get_funding_rate_history, limit=24)  # Last 24 funding periods
+            .add_call(self.get_trades_history, limit=50)
+            .execute()
+        )
+        return self._summarize_conditions(eth_data, funding_history, trades)
+    
+    def _summarize_conditions(self, eth_data: Optional[PerpMarketData], funding_history: List[Dict],
+                              trades: List[Dict]) -> Optional[MarketConditions]:
+        """Build the market-conditions analysis from already fetched data"""
         if not eth_data:
-            return {}
-        
-        funding_history = self.get_funding_rate_history(limit=24)  # Last 24 funding periods
-        trades = self.get_trades_history(limit=50)
+            return None
         
         # Calculate funding rate trend
         if len(funding_history) >= 2:
@@ -173,8 +428,7 @@ class DriftClient:
         
         # Calculate volume trend
         if trades:
-            recent_volume = sum(float(t.get('baseAssetAmount', 0)) for t in trades[:10])
-            older_volume = sum(float(t.get('baseAssetAmount', 0)) for t in trades[10:20])
+            recent_volume, older_volume = _window_volumes(trades, 10)
             volume_trend = "increasing" if recent_volume > older_volume else "decreasing"
         else:
             volume_trend = "unknown"
@@ -182,9 +436,12 @@ class DriftClient:
         # Market skew (long vs short bias)
         total_long = eth_data.base_asset_amount_long
         total_short = abs(eth_data.base_asset_amount_short)
+        total_oi = total_long + total_short
+        
+        long_ratio = total_long / total_oi if total_oi > 0 else 0
+        oi_imbalance = (total_long - total_short) / total_oi if total_oi > 0 else 0
         
-        if total_long + total_short > 0:
-            long_ratio = total_long / (total_long + total_short)
+        if total_oi > 0:
             if long_ratio > 0.6:
                 market_skew = "long_heavy"
             elif long_ratio < 0.4:
@@ -194,18 +451,18 @@ class DriftClient:
         else:
             market_skew = "no_positions"
         
-        return {
-            'market_data': eth_data,
-            'mark_vs_index_spread': eth_data.mark_price - eth_data.index_price,
-            'funding_rate_annual': eth_data.funding_rate * 365 * 24,  # Assuming hourly funding
-            'avg_recent_funding': avg_recent_funding,
-            'funding_trend': funding_trend,
-            'volume_trend': volume_trend,
-            'market_skew': market_skew,
-            'long_ratio': total_long / (total_long + total_short) if (total_long + total_short) > 0 else 0,
-            'oi_imbalance': (total_long - total_short) / (total_long + total_short) if (total_long + total_short) > 0 else 0,
-            'timestamp': datetime.now(timezone.utc).isoformat()
-        }
+        return MarketConditions(
+            market_data=eth_data,
+            mark_vs_index_spread=eth_data.mark_price - eth_data.index_price,
+            funding_rate_annual=eth_data.funding_rate * _FUNDING_ANNUALIZER,  # Assuming hourly funding
+            avg_recent_funding=avg_recent_funding,
+            funding_trend=funding_trend,
+            volume_trend=volume_trend,
+            market_skew=market_skew,
+            long_ratio=long_ratio,
+            oi_imbalance=oi_imbalance,
+            timestamp=datetime.now(timezone.utc).isoformat()
+        )
 
 class ETHPerpStrategy:
     """
@@ -220,13 +477,19 @@ class ETHPerpStrategy:
         
     def analyze_funding_arbitrage(self) -> Dict[str, Any]:
         """Look for funding rate arbitrage opportunities"""
-        conditions = self.drift_client.check_market_conditions()
-        
+        return self._funding_arbitrage_signals(self.drift_client.check_market_conditions())
+    
+    async def aanalyze_funding_arbitrage(self) -> Dict[str, Any]:
+        """Async version of analyze_funding_arbitrage"""
+        return self._funding_arbitrage_signals(await self.drift_client.acheck_market_conditions())
+    
+    def _funding_arbitrage_signals(self, conditions: Optional[MarketConditions]) -> Dict[str, Any]:
+        """Derive funding/skew signals from a market-conditions analysis"""
         if not conditions:
             return {'signal': None, 'reason': 'No market data'}
         
-        funding_annual = conditions['funding_rate_annual']
-        market_skew = conditions['market_skew']
+        funding_annual = conditions.funding_rate_annual
+        market_skew = conditions.market_skew
         
         signals = []
         
@@ -267,16 +530,32 @@ class ETHPerpStrategy:
         return {
             'signals': signals,
             'market_conditions': conditions,
-            'timestamp': datetime.now(timezone.utc).isoformat()
+            'timestamp': conditions.timestamp  # analysed at the moment the conditions were built
         }
     
     def analyze_momentum(self) -> Dict[str, Any]:
         """Analyze price momentum and volume"""
-        eth_data = self.drift_client.get_eth_perp_data()
+        eth_data, trades = (
+            BatchCall(self.drift_client)
+            .add_call(self.drift_client.get_eth_perp_data)
+            .add_call(self.drift_client.get_trades_history, limit=100)
+            .execute()
+        )
+        return self._momentum_signals(eth_data, trades)
+    
+    async def aanalyze_momentum(self) -> Dict[str, Any]:
+        """Async version of analyze_momentum"""
+        eth_data, trades = await asyncio.gather(
+            self.drift_client.aget_eth_perp_data(),
+            self.drift_client.aget_trades_history(limit=100)
+        )
+        return self._momentum_signals(eth_data, trades)
+    
+    def _momentum_signals(self, eth_data: Optional[PerpMarketData], trades: List[Dict]) -> Dict[str, Any]:
+        """Derive momentum signals from perp market data and recent trades"""
         if not eth_data:
             return {'signal': None, 'reason': 'No market data'}
         
-        trades = self.drift_client.get_trades_history(limit=100)
         if not trades:
             return {'signal': None, 'reason': 'No trade data'}
         
@@ -284,11 +563,9 @@ class ETHPerpStrategy:
         price_change = eth_data.price_change_24h
         
         # Volume analysis
-        recent_trades = trades[:20]
-        older_trades = trades[20:40] if len(trades) > 40 else trades[20:]
-        
-        recent_volume = sum(float(t.get('baseAssetAmount', 0)) for t in recent_trades)
-        older_volume = sum(float(t.get('baseAssetAmount', 0)) for t in older_trades) if older_trades else recent_volume
+        recent_volume, older_volume = _window_volumes(trades, 20)
+        if len(trades) <= 20:
+            older_volume = recent_volume
         
         volume_ratio = recent_volume / older_volume if older_volume > 0 else 1
         
@@ -318,17 +595,27 @@ class ETHPerpStrategy:
             'timestamp': datetime.now(timezone.utc).isoformat()
         }
 
+@functools.lru_cache(maxsize=1)
+def get_drift_client(rpc_url: str = DEFAULT_RPC_URL) -> DriftClient:
+    """Shared DriftClient, so its connection pool and response cache persist across cycles"""
+    return DriftClient(rpc_url)
+
+@functools.lru_cache(maxsize=1)
+def get_strategy() -> ETHPerpStrategy:
+    """Shared ETHPerpStrategy bound to the shared DriftClient"""
+    return ETHPerpStrategy(get_drift_client())
+
 # Example usage and testing
 if __name__ == "__main__":
-    drift_client = DriftClient()
-    strategy = ETHPerpStrategy(drift_client)
+    drift_client = get_drift_client()
+    strategy = get_strategy()
     
     print("=== ETH Perpetuals Market Data ===")
     eth_data = drift_client.get_eth_perp_data()
     if eth_data:
         print(f"Mark Price: ${eth_data.mark_price:,.2f}")
         print(f"Index Price: ${eth_data.index_price:,.2f}")
-        print(f"Funding Rate: {eth_data.funding_rate:.6f} ({eth_data.funding_rate * 365 * 24:.2%} annual)")
+        print(f"Funding Rate: {eth_data.funding_rate:.6f} ({eth_data.funding_rate * _FUNDING_ANNUALIZER:.2%} annual)")
         print(f"Open Interest: ${eth_data.open_interest:,.0f}")
         print(f"24h Volume: ${eth_data.volume_24h:,.0f}")
         print(f"24h Change: {eth_data.price_change_24h:.2%}")
@@ -336,9 +623,9 @@ if __name__ == "__main__":
     print("\n=== Market Analysis ===")
     conditions = drift_client.check_market_conditions()
     if conditions:
-        print(f"Market Skew: {conditions['market_skew']}")
-        print(f"Long Ratio: {conditions['long_ratio']:.1%}")
-        print(f"Funding Trend: {conditions['funding_trend']}")
+        print(f"Market Skew: {conditions.market_skew}")
+        print(f"Long Ratio: {conditions.long_ratio:.1%}")
+        print(f"Funding Trend: {conditions.funding_trend}")
     
     print("\n=== Trading Signals ===")
     funding_signals = strategy.analyze_funding_arbitrage()
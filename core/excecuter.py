@@ -1,4 +1,4 @@
-from logger.audit_logger import _write_log
+from logger.audit_logger import AUDIT_ENABLED, _write_log
 
 def execute_trade(signal_data):
     """
@@ -6,4 +6,5 @@ def execute_trade(signal_data):
     Replace with real trade logic (e.g., Drift SDK call).
     """
     print(f"✅ Simulated Trade Executed: {signal_data['action']} {signal_data['asset']}")
-    _write_log("EXECUTE", f"{signal_data['action']} {signal_data['asset']} @ {signal_data['timestamp']}")
+    if AUDIT_ENABLED:
+        _write_log("EXECUTE", "%s %s @ %s", signal_data['action'], signal_data['asset'], signal_data['timestamp'])
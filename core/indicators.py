@@ -4,58 +4,312 @@ Supports both Drift Protocol and Jupiter ecosystem data
 """
 import pandas as pd
 import numpy as np
-from typing import Tuple, Optional
+from collections import deque
+from dataclasses import dataclass
+from typing import Tuple, Optional, Union
 
-def calculate_rsi(prices: pd.Series, period: int = 14) -> pd.Series:
+# Try to import TA-Lib, fall back to pandas rolling windows
+try:
+    import talib
+    TALIB_AVAILABLE = True
+except ImportError:
+    TALIB_AVAILABLE = False
+
+# Try to import Numba for the fused EMA/RSI/VWAP kernels, fall back to pandas
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Indicator inputs may be a pandas Series or a plain float array
+ArrayLike = Union[pd.Series, np.ndarray]
+
+_TALIB_ROLLING = {'mean': 'SMA', 'min': 'MIN', 'max': 'MAX'}
+
+# Annualized funding rate beyond which funding counts as extreme (50% annual)
+EXTREME_FUNDING_ANNUAL = 0.5
+
+@dataclass(frozen=True)
+class FundingStats:
+    __slots__ = ("current_funding_annual", "avg_funding_24h", "funding_volatility", "funding_trend",
+                 "extreme_funding")
+    
+    current_funding_annual: float
+    avg_funding_24h: float
+    funding_volatility: float
+    funding_trend: str  # "increasing" or "decreasing"
+    extreme_funding: bool
+
+@dataclass(frozen=True)
+class OIStats:
+    __slots__ = ("oi_trend", "oi_price_divergence", "oi_momentum", "price_oi_correlation")
+    
+    oi_trend: str  # "increasing" or "decreasing"
+    oi_price_divergence: bool
+    oi_momentum: float
+    price_oi_correlation: float
+
+@dataclass(frozen=True)
+class MarketStructure:
+    __slots__ = ("trend_structure", "distance_from_high", "distance_from_low", "swing_high_count",
+                 "swing_low_count")
+    
+    trend_structure: str  # "uptrend", "downtrend" or "sideways"
+    distance_from_high: float
+    distance_from_low: float
+    swing_high_count: int
+    swing_low_count: int
+
+@dataclass(frozen=True)
+class VolStats:
+    __slots__ = ("current_volatility", "volatility_percentile", "volatility_trend", "vol_of_vol")
+    
+    current_volatility: float  # annualized
+    volatility_percentile: bool  # above the 80th percentile of the window
+    volatility_trend: str  # "increasing" or "decreasing"
+    vol_of_vol: float
+
+def _as_float_array(values: ArrayLike) -> np.ndarray:
+    """
+    Contiguous float64 array view of a Series or array
+    """
+    if isinstance(values, pd.Series):
+        values = values.to_numpy(dtype=np.float64)
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+def _like(template: ArrayLike, values: np.ndarray) -> ArrayLike:
+    """
+    Wrap a result as a Series on the template's index if the caller passed a Series
+    """
+    if isinstance(template, pd.Series):
+        return pd.Series(values, index=template.index)
+    return values
+
+def _rolling(values: np.ndarray, period: int, how: str = 'mean') -> np.ndarray:
     """
-    Calculate Relative Strength Index (RSI)
+    Trailing rolling mean/min/max with NaN warm-up, matching pandas rolling(window=period)
+    TA-Lib's running-window kernels are used when installed, but only for gap-free
+    input: a NaN inside the series would poison their running state, while pandas
+    recovers once the gap leaves the window.
     """
-    delta = prices.diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+    if TALIB_AVAILABLE and values.size:
+        valid = ~np.isnan(values)
+        if valid[valid.argmax():].all():
+            return getattr(talib, _TALIB_ROLLING[how])(values, timeperiod=period)
+    return getattr(pd.Series(values).rolling(window=period), how)().to_numpy()
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _multi_ema_kernel(prices, alphas):
+        """
+        One pass over prices updating one EMA per smoothing factor; column j uses alphas[j].
+        Mirrors pandas' ewm(adjust=False) recurrence, including how a gap (NaN) decays
+        the weight of the previous value, so results equal the pandas fallback
+        """
+        n = prices.shape[0]
+        k = alphas.shape[0]
+        out = np.empty((n, k))
+        weighted = np.full(k, np.nan)
+        old_wt = np.ones(k)
+        
+        for i in range(n):
+            p = prices[i]
+            is_obs = not np.isnan(p)
+            for j in range(k):
+                a = alphas[j]
+                if not np.isnan(weighted[j]):
+                    old_wt[j] *= 1.0 - a
+                    if is_obs:
+                        if weighted[j] != p:
+                            weighted[j] = (old_wt[j] * weighted[j] + a * p) / (old_wt[j] + a)
+                        old_wt[j] = 1.0
+                elif is_obs:
+                    weighted[j] = p
+                out[i, j] = weighted[j]
+        return out
+
+    @njit(cache=True, error_model='numpy')
+    def _vwap_kernel(prices, volumes):
+        """
+        Running VWAP in one pass; NaN inputs are skipped by the running sums but
+        yield NaN at their own position, as pandas cumsum does
+        """
+        n = prices.shape[0]
+        out = np.empty(n)
+        sum_pv = 0.0
+        sum_v = 0.0
+        for i in range(n):
+            pv = prices[i] * volumes[i]
+            v = volumes[i]
+            num = np.nan
+            den = np.nan
+            if not np.isnan(pv):
+                sum_pv += pv
+                num = sum_pv
+            if not np.isnan(v):
+                sum_v += v
+                den = sum_v
+            out[i] = num / den
+        return out
+
+    @njit(cache=True, error_model='numpy')
+    def _wilder_rsi_kernel(prices, period):
+        """
+        RSI in one pass: Wilder-smoothed average gain/loss seeded with the simple
+        mean of the first `period` changes; a change involving a gap counts as flat
+        """
+        n = prices.shape[0]
+        out = np.full(n, np.nan)
+        if n <= period:
+            return out
+        
+        avg_gain = 0.0
+        avg_loss = 0.0
+        for i in range(1, period + 1):
+            d = prices[i] - prices[i - 1]
+            if d > 0:
+                avg_gain += d
+            elif d < 0:
+                avg_loss -= d
+        avg_gain /= period
+        avg_loss /= period
+        out[period] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        
+        for i in range(period + 1, n):
+            d = prices[i] - prices[i - 1]
+            gain = d if d > 0 else 0.0
+            loss = -d if d < 0 else 0.0
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        return out
+
+    @njit(cache=True, parallel=True)
+    def _ema_rows_kernel(values, alpha):
+        """
+        The _multi_ema_kernel recurrence for one smoothing factor applied to every
+        row of a (symbols, bars) array, with the symbols spread across threads
+        """
+        n_rows, n_bars = values.shape
+        out = np.empty((n_rows, n_bars))
+        for s in prange(n_rows):
+            weighted = np.nan
+            old_wt = 1.0
+            for t in range(n_bars):
+                p = values[s, t]
+                is_obs = not np.isnan(p)
+                if not np.isnan(weighted):
+                    old_wt *= 1.0 - alpha
+                    if is_obs:
+                        if weighted != p:
+                            weighted = (old_wt * weighted + alpha * p) / (old_wt + alpha)
+                        old_wt = 1.0
+                elif is_obs:
+                    weighted = p
+                out[s, t] = weighted
+        return out
+
+def _rolling_std(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Trailing rolling sample standard deviation (ddof=1), matching pandas rolling(window=period).std()
+    """
+    # TA-Lib's STDDEV is a population deviation from running sums, so pandas does this one
+    return pd.Series(values).rolling(window=period).std().to_numpy()
+
+def _simple_returns(values: np.ndarray) -> np.ndarray:
+    """
+    Period-over-period returns (value / previous - 1, as pct_change), one shorter than values
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return values[1:] / values[:-1] - 1
+
+def _ema_matrix(values: np.ndarray, periods: Tuple[int, ...]) -> np.ndarray:
+    """
+    EMAs of values for several periods at once, one column per period
+    """
+    if NUMBA_AVAILABLE:
+        # Smoothing factors derived from the span exactly as pandas does
+        com = (np.asarray(periods, dtype=np.float64) - 1) / 2.0
+        return _multi_ema_kernel(values, 1.0 / (1.0 + com))
+    series = pd.Series(values)
+    columns = [series.ewm(span=period, adjust=False).mean().to_numpy() for period in periods]
+    return np.column_stack(columns) if columns else np.empty((len(values), 0))
+
+def _ema_rows(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    EMA along each row of a (symbols, bars) array
+    """
+    if NUMBA_AVAILABLE:
+        return _ema_rows_kernel(values, 1.0 / (1.0 + (period - 1) / 2.0))
+    return pd.DataFrame(values.T).ewm(span=period, adjust=False).mean().to_numpy().T
+
+def _macd_lines(ema_fast: np.ndarray, ema_slow: np.ndarray, signal_period: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    MACD line, signal line and histogram from precomputed fast/slow EMAs
+    """
+    macd_line = ema_fast - ema_slow
+    signal_line = _ema_matrix(macd_line, (signal_period,))[:, 0]
+    return macd_line, signal_line, macd_line - signal_line
+
+def calculate_rsi(prices: ArrayLike, period: int = 14) -> ArrayLike:
+    """
+    Calculate Relative Strength Index (RSI) with Wilder's smoothing
+    """
+    arr = _as_float_array(prices)
+    if NUMBA_AVAILABLE:
+        return _like(prices, _wilder_rsi_kernel(arr, period))
     
-    rs = gain / loss
-    rsi = 100 - (100 / (1 + rs))
-    return rsi
+    rsi = np.full(len(arr), np.nan)
+    if len(arr) > period:
+        delta = np.diff(arr)
+        # Wilder's average is an EMA with alpha = 1/period seeded by the first simple mean
+        averages = []
+        for moves in (np.where(delta > 0, delta, 0.0), np.where(delta < 0, -delta, 0.0)):
+            seeded = moves[period - 1:].copy()
+            seeded[0] = moves[:period].mean()
+            averages.append(pd.Series(seeded).ewm(alpha=1.0 / period, adjust=False).mean().to_numpy())
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rs = averages[0] / averages[1]
+            rsi[period:] = 100 - (100 / (1 + rs))
+    return _like(prices, rsi)
 
-def calculate_ema(prices: pd.Series, period: int) -> pd.Series:
+def calculate_ema(prices: ArrayLike, period: int) -> ArrayLike:
     """
     Calculate Exponential Moving Average (EMA)
     """
-    return prices.ewm(span=period, adjust=False).mean()
+    return _like(prices, _ema_matrix(_as_float_array(prices), (period,))[:, 0])
 
-def calculate_sma(prices: pd.Series, period: int) -> pd.Series:
+def calculate_sma(prices: ArrayLike, period: int) -> ArrayLike:
     """
     Calculate Simple Moving Average (SMA)
     """
-    return prices.rolling(window=period).mean()
+    return _like(prices, _rolling(_as_float_array(prices), period))
 
-def calculate_bollinger_bands(prices: pd.Series, period: int = 20, std_dev: float = 2) -> Tuple[pd.Series, pd.Series, pd.Series]:
+def calculate_bollinger_bands(prices: ArrayLike, period: int = 20, std_dev: float = 2) -> Tuple[ArrayLike, ArrayLike, ArrayLike]:
     """
     Calculate Bollinger Bands
     Returns: (upper_band, middle_band, lower_band)
     """
-    middle_band = calculate_sma(prices, period)
-    std = prices.rolling(window=period).std()
+    arr = _as_float_array(prices)
+    middle_band = _rolling(arr, period)
+    std = _rolling_std(arr, period)
     
     upper_band = middle_band + (std * std_dev)
     lower_band = middle_band - (std * std_dev)
     
-    return upper_band, middle_band, lower_band
+    return _like(prices, upper_band), _like(prices, middle_band), _like(prices, lower_band)
 
-def calculate_macd(prices: pd.Series, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> Tuple[pd.Series, pd.Series, pd.Series]:
+def calculate_macd(prices: ArrayLike, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> Tuple[ArrayLike, ArrayLike, ArrayLike]:
     """
     Calculate MACD (Moving Average Convergence Divergence)
     Returns: (macd_line, signal_line, histogram)
     """
-    ema_fast = calculate_ema(prices, fast_period)
-    ema_slow = calculate_ema(prices, slow_period)
-    
-    macd_line = ema_fast - ema_slow
-    signal_line = calculate_ema(macd_line, signal_period)
-    histogram = macd_line - signal_line
+    emas = _ema_matrix(_as_float_array(prices), (fast_period, slow_period))
+    macd_line, signal_line, histogram = _macd_lines(emas[:, 0], emas[:, 1], signal_period)
     
-    return macd_line, signal_line, histogram
+    return _like(prices, macd_line), _like(prices, signal_line), _like(prices, histogram)
 
 def calculate_stochastic(high: pd.Series, low: pd.Series, close: pd.Series, 
                         k_period: int = 14, d_period: int = 3) -> Tuple[pd.Series, pd.Series]:
@@ -63,136 +317,237 @@ def calculate_stochastic(high: pd.Series, low: pd.Series, close: pd.Series,
     Calculate Stochastic Oscillator
     Returns: (%K, %D)
     """
-    lowest_low = low.rolling(window=k_period).min()
-    highest_high = high.rolling(window=k_period).max()
+    lowest_low = _rolling(_as_float_array(low), k_period, 'min')
+    highest_high = _rolling(_as_float_array(high), k_period, 'max')
     
-    k_percent = 100 * ((close - lowest_low) / (highest_high - lowest_low))
-    d_percent = k_percent.rolling(window=d_period).mean()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        k_percent = 100 * ((_as_float_array(close) - lowest_low) / (highest_high - lowest_low))
+    d_percent = _rolling(k_percent, d_period)
     
-    return k_percent, d_percent
+    return _like(close, k_percent), _like(close, d_percent)
 
-def calculate_atr(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
+def calculate_atr(high: ArrayLike, low: ArrayLike, close: ArrayLike, period: int = 14) -> ArrayLike:
     """
     Calculate Average True Range (ATR)
     """
-    tr1 = high - low
-    tr2 = abs(high - close.shift())
-    tr3 = abs(low - close.shift())
+    h = _as_float_array(high)
+    l = _as_float_array(low)
+    prev_close = np.empty_like(h)
+    prev_close[:1] = np.nan
+    prev_close[1:] = _as_float_array(close)[:-1]
     
-    true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-    atr = true_range.rolling(window=period).mean()
+    # fmax skips the NaN previous close on the first bar, as a row-wise pandas max does
+    true_range = np.fmax.reduce([h - l, np.abs(h - prev_close), np.abs(l - prev_close)])
+    atr = _rolling(true_range, period)
     
-    return atr
+    return _like(close, atr)
 
-def calculate_vwap(prices: pd.Series, volumes: pd.Series) -> pd.Series:
+def calculate_vwap(prices: ArrayLike, volumes: ArrayLike) -> ArrayLike:
     """
     Calculate Volume Weighted Average Price (VWAP)
     """
-    return (prices * volumes).cumsum() / volumes.cumsum()
+    # Misaligned Series need pandas' index alignment
+    if isinstance(volumes, pd.Series) and not (isinstance(prices, pd.Series) and prices.index.equals(volumes.index)):
+        return (prices * volumes).cumsum() / volumes.cumsum()
+    p = _as_float_array(prices)
+    v = _as_float_array(volumes)
+    if NUMBA_AVAILABLE:
+        return _like(prices, _vwap_kernel(p, v))
+    # Running sums skip NaNs but leave them NaN in place, like pandas cumsum
+    pv = p * v
+    pv_sum = np.nancumsum(pv)
+    v_sum = np.nancumsum(v)
+    pv_sum[np.isnan(pv)] = np.nan
+    v_sum[np.isnan(v)] = np.nan
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return _like(prices, pv_sum / v_sum)
 
-def calculate_funding_rate_indicators(funding_rates: pd.Series, period: int = 24) -> dict:
+def calculate_funding_rate_indicators(funding_rates: pd.Series, period: int = 24) -> FundingStats:
     """
     Calculate funding rate specific indicators for perpetuals
     """
-    # Convert to annualized rates for easier interpretation
-    annualized_rates = funding_rates * 365 * 24  # Assuming hourly funding
+    # Convert to annualized rates for easier interpretation (assuming hourly funding);
+    # only the window and the last two rates are used, so scale just those
+    rates = funding_rates.to_numpy()
+    recent_rates = funding_rates.tail(period) * 365 * 24
+    current = rates[-1] * 365 * 24 if len(rates) > 0 else 0
+    previous = rates[-2] * 365 * 24 if len(rates) > 1 else current
     
-    return {
-        'current_funding_annual': annualized_rates.iloc[-1] if len(annualized_rates) > 0 else 0,
-        'avg_funding_24h': annualized_rates.tail(period).mean(),
-        'funding_volatility': annualized_rates.tail(period).std(),
-        'funding_trend': 'increasing' if len(annualized_rates) >= 2 and annualized_rates.iloc[-1] > annualized_rates.iloc[-2] else 'decreasing',
-        'extreme_funding': abs(annualized_rates.iloc[-1]) > 0.5 if len(annualized_rates) > 0 else False  # 50% annual
-    }
+    return FundingStats(
+        current_funding_annual=current,
+        avg_funding_24h=recent_rates.mean(),
+        funding_volatility=recent_rates.std(),
+        funding_trend='increasing' if current > previous else 'decreasing',
+        extreme_funding=abs(current) > EXTREME_FUNDING_ANNUAL
+    )
 
-def calculate_oi_indicators(open_interest: pd.Series, prices: pd.Series) -> dict:
+class OICorrelator:
+    """
+    Rolling Pearson correlation between OI changes and price changes over the
+    last `window` pairs, updated in O(1) per sample with Welford co-moments
+    """
+    
+    def __init__(self, window: int = 20):
+        self.window = window
+        self.pairs = deque()
+        self.n = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.m_xx = 0.0
+        self.m_yy = 0.0
+        self.m_xy = 0.0
+    
+    def update(self, oi_change: float, price_change: float):
+        """
+        Add the newest (oi_change, price_change) pair, dropping the oldest once
+        the window is full; pairs with a NaN are counted but left out of the stats
+        """
+        self.pairs.append((oi_change, price_change))
+        if not (np.isnan(oi_change) or np.isnan(price_change)):
+            self._add(oi_change, price_change)
+        if len(self.pairs) > self.window:
+            x, y = self.pairs.popleft()
+            if not (np.isnan(x) or np.isnan(y)):
+                self._remove(x, y)
+    
+    def _add(self, x: float, y: float):
+        self.n += 1
+        dx = x - self.mean_x
+        dy = y - self.mean_y
+        self.mean_x += dx / self.n
+        self.mean_y += dy / self.n
+        self.m_xx += dx * (x - self.mean_x)
+        self.m_yy += dy * (y - self.mean_y)
+        self.m_xy += dx * (y - self.mean_y)
+    
+    def _remove(self, x: float, y: float):
+        self.n -= 1
+        if self.n == 0:
+            self.mean_x = self.mean_y = self.m_xx = self.m_yy = self.m_xy = 0.0
+            return
+        dx = x - self.mean_x
+        dy = y - self.mean_y
+        self.mean_x -= dx / self.n
+        self.mean_y -= dy / self.n
+        self.m_xx -= dx * (x - self.mean_x)
+        self.m_yy -= dy * (y - self.mean_y)
+        self.m_xy -= dx * (y - self.mean_y)
+    
+    @property
+    def correlation(self) -> float:
+        """
+        Correlation of the pairs in the window (NaN with fewer than two or no variance)
+        """
+        denom = np.sqrt(self.m_xx * self.m_yy)
+        if self.n < 2 or not denom > 0:
+            return np.nan
+        return self.m_xy / denom
+
+def calculate_oi_indicators(open_interest: ArrayLike, prices: ArrayLike,
+                            correlator: Optional[OICorrelator] = None) -> Optional[OIStats]:
     """
     Calculate Open Interest indicators for perpetuals
+    Callers evaluating every new bar can pass a long-lived OICorrelator; it is fed
+    the newest change pair and replaces the 20-pair correlation rescan. A fresh
+    correlator is first seeded with the history, so it agrees with the rescan
     """
     if len(open_interest) < 2 or len(prices) < 2:
-        return {}
+        return None
+    
+    # Align series on their most recent points
+    min_len = min(len(open_interest), len(prices))
+    oi_change = _simple_returns(_as_float_array(open_interest)[-min_len:])
+    price_change = _simple_returns(_as_float_array(prices)[-min_len:])
     
-    oi_change = open_interest.pct_change()
-    price_change = prices.pct_change()
+    # Average OI change over last 5 periods, skipping gaps
+    recent_oi = oi_change[-5:]
+    recent_oi = recent_oi[~np.isnan(recent_oi)]
     
-    # Align series
-    min_len = min(len(oi_change), len(price_change))
-    oi_change = oi_change.tail(min_len)
-    price_change = price_change.tail(min_len)
+    correlation = 0
+    if correlator is not None:
+        if not correlator.pairs:
+            window = correlator.window
+            for x, y in zip(oi_change[-window:-1], price_change[-window:-1]):
+                correlator.update(x, y)
+        correlator.update(oi_change[-1], price_change[-1])
+        correlation = correlator.correlation if min_len >= 20 else 0
+    elif min_len >= 20:
+        oi_tail, price_tail = oi_change[-20:], price_change[-20:]
+        paired = ~(np.isnan(oi_tail) | np.isnan(price_tail))
+        correlation = np.nan
+        if paired.sum() >= 2:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                correlation = np.corrcoef(oi_tail[paired], price_tail[paired])[0, 1]
     
-    return {
-        'oi_trend': 'increasing' if oi_change.iloc[-1] > 0 else 'decreasing',
-        'oi_price_divergence': (oi_change.iloc[-1] > 0 and price_change.iloc[-1] < 0) or 
-                              (oi_change.iloc[-1] < 0 and price_change.iloc[-1] > 0),
-        'oi_momentum': oi_change.tail(5).mean(),  # Average OI change over last 5 periods
-        'price_oi_correlation': oi_change.tail(20).corr(price_change.tail(20)) if len(oi_change) >= 20 else 0
-    }
+    return OIStats(
+        oi_trend='increasing' if oi_change[-1] > 0 else 'decreasing',
+        oi_price_divergence=(oi_change[-1] > 0 and price_change[-1] < 0) or
+                            (oi_change[-1] < 0 and price_change[-1] > 0),
+        oi_momentum=recent_oi.mean() if recent_oi.size else np.nan,
+        price_oi_correlation=correlation
+    )
 
-def calculate_market_structure(highs: pd.Series, lows: pd.Series, closes: pd.Series) -> dict:
+def calculate_market_structure(highs: pd.Series, lows: pd.Series, closes: pd.Series) -> Optional[MarketStructure]:
     """
     Calculate market structure indicators (higher highs, lower lows, etc.)
     """
     if len(closes) < 10:
-        return {}
+        return None
     
     # Recent highs and lows
     recent_high = highs.tail(20).max()
     recent_low = lows.tail(20).min()
     current_price = closes.iloc[-1]
     
-    # Swing points
-    swing_highs = []
-    swing_lows = []
-    
-    for i in range(2, len(highs) - 2):
-        # Swing high: higher than 2 periods before and after
-        if highs.iloc[i] > highs.iloc[i-1] and highs.iloc[i] > highs.iloc[i-2] and \
-           highs.iloc[i] > highs.iloc[i+1] and highs.iloc[i] > highs.iloc[i+2]:
-            swing_highs.append((i, highs.iloc[i]))
-        
-        # Swing low: lower than 2 periods before and after
-        if lows.iloc[i] < lows.iloc[i-1] and lows.iloc[i] < lows.iloc[i-2] and \
-           lows.iloc[i] < lows.iloc[i+1] and lows.iloc[i] < lows.iloc[i+2]:
-            swing_lows.append((i, lows.iloc[i]))
+    # Swing points: bars beyond both neighbours on each side, in bar order
+    h = highs.to_numpy()
+    l = lows.to_numpy()
+    mid_h = h[2:-2]
+    mid_l = l[2:-2]
+    swing_high_idx = np.flatnonzero((mid_h > h[1:-3]) & (mid_h > h[:-4]) &
+                                    (mid_h > h[3:-1]) & (mid_h > h[4:])) + 2
+    swing_low_idx = np.flatnonzero((mid_l < l[1:-3]) & (mid_l < l[:-4]) &
+                                   (mid_l < l[3:-1]) & (mid_l < l[4:])) + 2
     
-    # Determine trend structure
+    # Determine trend structure from the last two swings of each kind
     trend = 'sideways'
-    if len(swing_highs) >= 2 and len(swing_lows) >= 2:
-        recent_swing_highs = sorted(swing_highs, key=lambda x: x[0])[-2:]
-        recent_swing_lows = sorted(swing_lows, key=lambda x: x[0])[-2:]
+    if len(swing_high_idx) >= 2 and len(swing_low_idx) >= 2:
+        prev_high, last_high = h[swing_high_idx[-2:]]
+        prev_low, last_low = l[swing_low_idx[-2:]]
         
-        if (recent_swing_highs[1][1] > recent_swing_highs[0][1] and 
-            recent_swing_lows[1][1] > recent_swing_lows[0][1]):
+        if last_high > prev_high and last_low > prev_low:
             trend = 'uptrend'
-        elif (recent_swing_highs[1][1] < recent_swing_highs[0][1] and 
-              recent_swing_lows[1][1] < recent_swing_lows[0][1]):
+        elif last_high < prev_high and last_low < prev_low:
             trend = 'downtrend'
     
-    return {
-        'trend_structure': trend,
-        'distance_from_high': (recent_high - current_price) / recent_high,
-        'distance_from_low': (current_price - recent_low) / current_price,
-        'swing_high_count': len(swing_highs),
-        'swing_low_count': len(swing_lows)
-    }
+    return MarketStructure(
+        trend_structure=trend,
+        distance_from_high=(recent_high - current_price) / recent_high,
+        distance_from_low=(current_price - recent_low) / current_price,
+        swing_high_count=len(swing_high_idx),
+        swing_low_count=len(swing_low_idx)
+    )
 
-def calculate_volatility_indicators(prices: pd.Series, period: int = 20) -> dict:
+def calculate_volatility_indicators(prices: ArrayLike, period: int = 20) -> Optional[VolStats]:
     """
     Calculate various volatility indicators
     """
-    returns = prices.pct_change().dropna()
+    returns = _simple_returns(_as_float_array(prices))
+    returns = returns[~np.isnan(returns)]
     
     if len(returns) < period:
-        return {}
+        return None
     
-    rolling_vol = returns.rolling(window=period).std()
+    rolling_vol = _rolling_std(returns, period)
+    filled_vol = rolling_vol[~np.isnan(rolling_vol)]
+    high_vol = np.quantile(filled_vol, 0.8) if filled_vol.size else np.nan
     
-    return {
-        'current_volatility': rolling_vol.iloc[-1] * np.sqrt(365) if len(rolling_vol) > 0 else 0,  # Annualized
-        'volatility_percentile': (rolling_vol.iloc[-1] > rolling_vol.quantile(0.8)) if len(rolling_vol) > 0 else False,
-        'volatility_trend': 'increasing' if len(rolling_vol) >= 2 and rolling_vol.iloc[-1] > rolling_vol.iloc[-2] else 'decreasing',
-        'vol_of_vol': rolling_vol.rolling(window=10).std().iloc[-1] if len(rolling_vol) >= 10 else 0
-    }
+    return VolStats(
+        current_volatility=rolling_vol[-1] * np.sqrt(365) if len(rolling_vol) > 0 else 0,  # Annualized
+        volatility_percentile=(rolling_vol[-1] > high_vol) if len(rolling_vol) > 0 else False,
+        volatility_trend='increasing' if len(rolling_vol) >= 2 and rolling_vol[-1] > rolling_vol[-2] else 'decreasing',
+        vol_of_vol=np.std(rolling_vol[-10:], ddof=1) if len(rolling_vol) >= 10 else 0
+    )
 
 class TechnicalAnalysisEngine:
     """
@@ -202,6 +557,26 @@ class TechnicalAnalysisEngine:
     
     def __init__(self):
         self.lookback_period = 100
+    
+    def analyze_batch(self, prices_2d: np.ndarray, ema_periods: Tuple[int, ...] = (9, 21),
+                      sma_periods: Tuple[int, ...] = (20,)) -> dict:
+        """
+        EMAs and SMAs for a whole portfolio in one call
+        prices_2d holds one symbol per row and one bar per column; every result is
+        an array of the same shape, keyed 'ema_<period>' / 'sma_<period>'
+        """
+        arr = np.ascontiguousarray(prices_2d, dtype=np.float64)
+        if arr.ndim != 2:
+            raise ValueError("prices_2d must be a (symbols, bars) array")
+        
+        result = {}
+        for period in ema_periods:
+            result[f'ema_{period}'] = _ema_rows(arr, period)
+        for period in sma_periods:
+            # Per-row TA-Lib SMA beats a DataFrame rolling pass over the transposed block
+            rows = [_rolling(row, period) for row in arr]
+            result[f'sma_{period}'] = np.array(rows).reshape(arr.shape)
+        return result
         
     def analyze_price_action(self, price_data: list, volume_data: list = None) -> dict:
         """
@@ -210,15 +585,18 @@ class TechnicalAnalysisEngine:
         if len(price_data) < 20:
             return {'error': 'Insufficient data for analysis'}
         
+        # Convert once; the indicators below work on the float array directly.
+        # Kept in float64: TA-Lib only takes doubles, and at ETH price levels float32
+        # leaves ~1e-4 of resolution, enough to flip MACD-histogram sign changes near zero
         prices = pd.Series(price_data)
-        volumes = pd.Series(volume_data) if volume_data else None
+        arr = prices.to_numpy(dtype=np.float64)
+        volumes = _as_float_array(volume_data) if volume_data else None
         
-        # Basic indicators
-        rsi = calculate_rsi(prices)
-        ema_9 = calculate_ema(prices, 9)
-        ema_21 = calculate_ema(prices, 21)
-        bb_upper, bb_middle, bb_lower = calculate_bollinger_bands(prices)
-        macd, macd_signal, macd_hist = calculate_macd(prices)
+        # Basic indicators; the EMA 9/21 and MACD 12/26 EMAs share one pass over prices
+        rsi = calculate_rsi(arr)
+        ema_9, ema_21, ema_12, ema_26 = _ema_matrix(arr, (9, 21, 12, 26)).T
+        macd, macd_signal, macd_hist = _macd_lines(ema_12, ema_26, 9)
+        bb_upper, bb_middle, bb_lower = calculate_bollinger_bands(arr)
         
         # Market structure
         highs = prices  # Assuming price data represents close prices
@@ -228,42 +606,42 @@ class TechnicalAnalysisEngine:
         # Volatility
         volatility = calculate_volatility_indicators(prices)
         
-        current_price = prices.iloc[-1]
+        current_price = arr[-1]
         
         analysis = {
             'current_price': current_price,
-            'rsi': rsi.iloc[-1] if len(rsi) > 0 else 50,
-            'ema_9': ema_9.iloc[-1] if len(ema_9) > 0 else current_price,
-            'ema_21': ema_21.iloc[-1] if len(ema_21) > 0 else current_price,
-            'bb_upper': bb_upper.iloc[-1] if len(bb_upper) > 0 else current_price,
-            'bb_lower': bb_lower.iloc[-1] if len(bb_lower) > 0 else current_price,
-            'macd': macd.iloc[-1] if len(macd) > 0 else 0,
-            'macd_signal': macd_signal.iloc[-1] if len(macd_signal) > 0 else 0,
-            'macd_histogram': macd_hist.iloc[-1] if len(macd_hist) > 0 else 0,
+            'rsi': rsi[-1] if len(rsi) > 0 else 50,
+            'ema_9': ema_9[-1] if len(ema_9) > 0 else current_price,
+            'ema_21': ema_21[-1] if len(ema_21) > 0 else current_price,
+            'bb_upper': bb_upper[-1] if len(bb_upper) > 0 else current_price,
+            'bb_lower': bb_lower[-1] if len(bb_lower) > 0 else current_price,
+            'macd': macd[-1] if len(macd) > 0 else 0,
+            'macd_signal': macd_signal[-1] if len(macd_signal) > 0 else 0,
+            'macd_histogram': macd_hist[-1] if len(macd_hist) > 0 else 0,
             'market_structure': market_structure,
             'volatility': volatility,
-            'signals': self._generate_signals(prices, rsi, ema_9, ema_21, bb_upper, bb_lower, macd, macd_hist)
+            'signals': self._generate_signals(arr, rsi, ema_9, ema_21, bb_upper, bb_lower, macd, macd_hist)
         }
         
         if volumes is not None:
-            analysis['vwap'] = calculate_vwap(prices, volumes).iloc[-1]
+            analysis['vwap'] = calculate_vwap(arr, volumes)[-1]
         
         return analysis
     
     def _generate_signals(self, prices, rsi, ema_9, ema_21, bb_upper, bb_lower, macd, macd_hist) -> list:
         """
-        Generate trading signals based on technical indicators
+        Generate trading signals based on technical indicators (float arrays)
         """
         signals = []
         
         if len(prices) < 2:
             return signals
         
-        current_price = prices.iloc[-1]
+        current_price = prices[-1]
         
         # RSI signals
         if len(rsi) > 0:
-            current_rsi = rsi.iloc[-1]
+            current_rsi = rsi[-1]
             if current_rsi < 30:
                 signals.append({
                     'type': 'oversold',
@@ -281,8 +659,8 @@ class TechnicalAnalysisEngine:
         
         # EMA crossover signals
         if len(ema_9) > 0 and len(ema_21) > 0:
-            current_ema_9 = ema_9.iloc[-1]
-            current_ema_21 = ema_21.iloc[-1]
+            current_ema_9 = ema_9[-1]
+            current_ema_21 = ema_21[-1]
             
             if current_ema_9 > current_ema_21:
                 signals.append({
@@ -301,8 +679,8 @@ class TechnicalAnalysisEngine:
         
         # Bollinger Bands signals
         if len(bb_upper) > 0 and len(bb_lower) > 0:
-            current_bb_upper = bb_upper.iloc[-1]
-            current_bb_lower = bb_lower.iloc[-1]
+            current_bb_upper = bb_upper[-1]
+            current_bb_lower = bb_lower[-1]
             
             if current_price > current_bb_upper:
                 signals.append({
@@ -321,14 +699,14 @@ class TechnicalAnalysisEngine:
         
         # MACD signals
         if len(macd) > 1 and len(macd_hist) > 1:
-            if macd_hist.iloc[-1] > 0 and macd_hist.iloc[-2] <= 0:
+            if macd_hist[-1] > 0 and macd_hist[-2] <= 0:
                 signals.append({
                     'type': 'macd_bullish_crossover',
                     'indicator': 'MACD',
                     'direction': 'bullish',
                     'strength': 1.3
                 })
-            elif macd_hist.iloc[-1] < 0 and macd_hist.iloc[-2] >= 0:
+            elif macd_hist[-1] < 0 and macd_hist[-2] >= 0:
                 signals.append({
                     'type': 'macd_bearish_crossover',
                     'indicator': 'MACD',
@@ -359,7 +737,8 @@ if __name__ == "__main__":
     print(f"RSI: {analysis['rsi']:.1f}")
     print(f"EMA 9: ${analysis['ema_9']:.2f}")
     print(f"EMA 21: ${analysis['ema_21']:.2f}")
-    print(f"Market Structure: {analysis['market_structure'].get('trend_structure', 'unknown')}")
+    market_structure = analysis['market_structure']
+    print(f"Market Structure: {market_structure.trend_structure if market_structure else 'unknown'}")
     
     print("\nSignals Generated:")
     for signal in analysis['signals']:
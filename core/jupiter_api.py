@@ -2,12 +2,52 @@
 Jupiter API Integration for ETH Trading
 Handles both spot trading and perpetuals (when available)
 """
+import asyncio
 import requests
 import json
 import time
-from typing import Dict, Any, Optional, List
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 from wallet.TOKEN_config import TOKEN_META
+from core.aio_session import LoopBoundSession
+from core.rate_limit import RateLimitExceeded, rate_limited_get, rate_limited_read
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Encode/decode bodies with orjson when installed, falling back to stdlib json.
+# Both raise ValueError subclasses on malformed bodies.
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+PRICE_URL = "https://price.jup.ag/v4/price"
+
+# Pooled keep-alive connections shared by the sync and async sessions
+POOL_CONNECTIONS = 16
+POOL_SIZE = 32
+KEEPALIVE_TIMEOUT = 60
+
+# (connect, read) deadlines in seconds, so a stalled socket fails the call instead of hanging it
+CONNECT_TIMEOUT = 2
+REQUEST_TIMEOUT = (CONNECT_TIMEOUT, 10)
+
+# What a timed-out request raises on the sync (requests) and async (aiohttp) paths
+TIMEOUT_ERRORS = (requests.exceptions.Timeout, asyncio.TimeoutError)
+
+# Seconds a price (or price-only quote) stays fresh, so bursts of polls share one request
+PRICE_TTL = 0.2
+_CACHE_MAX = 128
 
 @dataclass
 class QuoteRequest:
@@ -33,32 +73,86 @@ class SwapResponse:
     route_plan: List[Dict]
 
 class JupiterAPI:
-    def __init__(self, base_url: str = "https://quote-api.jup.ag/v6"):
+    def __init__(self, base_url: str = "https://quote-api.jup.ag/v6", session: Optional[requests.Session] = None):
         self.base_url = base_url
-        self.session = requests.Session()
+        self.quote_url = f"{base_url}/quote"
+        self.swap_url = f"{base_url}/swap"
+        
+        # Callers that already pool connections to Jupiter hosts can share their session
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_SIZE)
+            session.mount('https://', adapter)
+        self.session = session
         self.session.headers.update({
             'Accept': 'application/json',
             'Content-Type': 'application/json'
         })
+        
+        # aiohttp session for the async API (created on first use, one per event loop)
+        self._aio_session = LoopBoundSession(self._new_aio_session)
+        
+        # (endpoint, params) -> (expiry, decoded body) for responses fetched with a TTL
+        self._response_cache: Dict[Tuple, Tuple[float, Any]] = {}
+    
+    def _cache_get(self, key: Tuple) -> Optional[Any]:
+        """Return a cached response body if it has not expired"""
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() < entry[0]:
+            return entry[1]
+        self._response_cache.pop(key, None)
+        return None
+    
+    def _cache_put(self, key: Tuple, ttl: float, data: Any) -> Any:
+        """Store a response body for ttl seconds and return it; the cache is reset once full"""
+        if ttl > 0:
+            if len(self._response_cache) >= _CACHE_MAX:
+                self._response_cache.clear()
+            self._response_cache[key] = (time.monotonic() + ttl, data)
+        return data
+    
+    @staticmethod
+    def _quote_key(request: QuoteRequest) -> Tuple:
+        """Cache key covering every field that shapes a quote"""
+        return ('quote', request.input_mint, request.output_mint, request.amount, request.slippage_bps,
+                request.swap_mode, request.only_direct_routes, request.as_legacy_transaction)
     
-    def get_quote(self, request: QuoteRequest) -> Optional[Dict[str, Any]]:
-        """Get a quote for token swap"""
+    @staticmethod
+    def _quote_params(request: QuoteRequest) -> Dict[str, Any]:
+        """Query parameters for the /quote endpoint"""
+        return {
+            'inputMint': request.input_mint,
+            'outputMint': request.output_mint,
+            'amount': request.amount,
+            'slippageBps': request.slippage_bps,
+            'swapMode': request.swap_mode,
+            'onlyDirectRoutes': str(request.only_direct_routes).lower(),
+            'asLegacyTransaction': str(request.as_legacy_transaction).lower()
+        }
+    
+    def get_quote(self, request: QuoteRequest, ttl: float = 0.0,
+                  raise_timeout: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Get a quote for token swap
+        Quotes are only reused when a ttl is given, i.e. for price lookups, never for swaps.
+        With raise_timeout a timed-out request raises instead of returning None
+        """
+        # A swap quote (no ttl) must be fresh, even when a price lookup cached the same request
+        key = self._quote_key(request)
+        cached = self._cache_get(key) if ttl > 0 else None
+        if cached is not None:
+            return cached
         try:
-            params = {
-                'inputMint': request.input_mint,
-                'outputMint': request.output_mint,
-                'amount': request.amount,
-                'slippageBps': request.slippage_bps,
-                'swapMode': request.swap_mode,
-                'onlyDirectRoutes': str(request.only_direct_routes).lower(),
-                'asLegacyTransaction': str(request.as_legacy_transaction).lower()
-            }
-            
-            response = self.session.get(f"{self.base_url}/quote", params=params)
+            response = rate_limited_get(self.session.get, self.quote_url,
+                                        params=self._quote_params(request), timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            return response.json()
+            return self._cache_put(key, ttl, _json_loads(response.content))
             
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, RateLimitExceeded, ValueError) as e:
+            if raise_timeout and isinstance(e, TIMEOUT_ERRORS):
+                raise
             print(f"[ERROR] Failed to get quote: {e}")
             return None
     
@@ -72,40 +166,133 @@ class JupiterAPI:
                 "prioritizationFeeLamports": prioritization_fee_lamports
             }
             
-            response = self.session.post(f"{self.base_url}/swap", json=payload)
+            response = rate_limited_get(self.session.post, self.swap_url,
+                                        data=_json_dumps(payload), timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
             
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, RateLimitExceeded, ValueError) as e:
             print(f"[ERROR] Failed to get swap transaction: {e}")
             return None
     
-    def get_price(self, token_addresses: List[str]) -> Optional[Dict[str, Any]]:
-        """Get current prices for tokens"""
+    def get_price(self, token_addresses: List[str], ttl: float = PRICE_TTL) -> Optional[Dict[str, Any]]:
+        """Get current prices for tokens, reusing a response younger than ttl seconds"""
+        key = ('price',) + tuple(sorted(token_addresses))
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
         try:
             params = {'ids': ','.join(token_addresses)}
-            response = self.session.get("https://price.jup.ag/v4/price", params=params)
+            response = rate_limited_get(self.session.get, PRICE_URL, params=params, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            return response.json()
+            return self._cache_put(key, ttl, _json_loads(response.content))
+            
+        except (requests.exceptions.RequestException, RateLimitExceeded, ValueError) as e:
+            print(f"[ERROR] Failed to get prices: {e}")
+            return None
+    
+    # ------------------------------------------------------------------
+    # Async API: same endpoints and error handling, so independent calls can
+    # overlap their round trips. Uses one aiohttp ClientSession when aiohttp
+    # is installed, otherwise the blocking methods on the default executor.
+    # ------------------------------------------------------------------
+    
+    def _new_aio_session(self):
+        """Pooled aiohttp session sharing the sync session's headers"""
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=POOL_SIZE, keepalive_timeout=KEEPALIVE_TIMEOUT),
+            timeout=aiohttp.ClientTimeout(sock_connect=REQUEST_TIMEOUT[0], sock_read=REQUEST_TIMEOUT[1]),
+            headers=dict(self.session.headers)
+        )
+    
+    def _get_aio_session(self):
+        """aiohttp session for the running event loop (rebuilt when the loop changes)"""
+        return self._aio_session.get()
+    
+    async def get_quote_async(self, request: QuoteRequest, ttl: float = 0.0,
+                              raise_timeout: bool = False) -> Optional[Dict[str, Any]]:
+        """Async version of get_quote"""
+        if not AIOHTTP_AVAILABLE:
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self.get_quote, request, ttl, raise_timeout)
+        key = self._quote_key(request)
+        cached = self._cache_get(key) if ttl > 0 else None
+        if cached is not None:
+            return cached
+        try:
+            body = await rate_limited_read(
+                lambda: self._get_aio_session().get(self.quote_url, params=self._quote_params(request)),
+                self.quote_url)
+            return self._cache_put(key, ttl, _json_loads(body))
+            
+        except Exception as e:
+            if raise_timeout and isinstance(e, TIMEOUT_ERRORS):
+                raise
+            print(f"[ERROR] Failed to get quote: {e}")
+            return None
+    
+    async def get_swap_transaction_async(self, quote: Dict[str, Any], user_public_key: str,
+                                         prioritization_fee_lamports: str = "auto") -> Optional[Dict[str, Any]]:
+        """Async version of get_swap_transaction"""
+        if not AIOHTTP_AVAILABLE:
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self.get_swap_transaction, quote, user_public_key, prioritization_fee_lamports)
+        try:
+            payload = {
+                "quoteResponse": quote,
+                "userPublicKey": user_public_key,
+                "prioritizationFeeLamports": prioritization_fee_lamports
+            }
+            
+            data = _json_dumps(payload)
+            body = await rate_limited_read(lambda: self._get_aio_session().post(self.swap_url, data=data),
+                                           self.swap_url)
+            return _json_loads(body)
             
-        except requests.exceptions.RequestException as e:
+        except Exception as e:
+            print(f"[ERROR] Failed to get swap transaction: {e}")
+            return None
+    
+    async def get_price_async(self, token_addresses: List[str], ttl: float = PRICE_TTL) -> Optional[Dict[str, Any]]:
+        """Async version of get_price"""
+        if not AIOHTTP_AVAILABLE:
+            return await asyncio.get_running_loop().run_in_executor(None, self.get_price, token_addresses, ttl)
+        key = ('price',) + tuple(sorted(token_addresses))
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        try:
+            params = {'ids': ','.join(token_addresses)}
+            body = await rate_limited_read(lambda: self._get_aio_session().get(PRICE_URL, params=params),
+                                           PRICE_URL)
+            return self._cache_put(key, ttl, _json_loads(body))
+            
+        except Exception as e:
             print(f"[ERROR] Failed to get prices: {e}")
             return None
+    
+    async def aclose(self):
+        """Close the async session and release pooled connections"""
+        await self._aio_session.aclose()
+        self.session.close()
 
 class ETHPerpTrader:
     """ETH Perpetuals Trading Handler"""
     
     def __init__(self, jupiter_api: JupiterAPI):
         self.jupiter_api = jupiter_api
-        self.eth_mint = TOKEN_META["ETH"]["mint"]
-        self.usdc_mint = TOKEN_META["USDC"]["mint"]
+        self.eth_mint = TOKEN_META["ETH"].mint
+        self.usdc_mint = TOKEN_META["USDC"].mint
+        
+        # Base units per whole token
+        self.eth_scale = 10 ** TOKEN_META["ETH"].decimals
+        self.usdc_scale = 10 ** TOKEN_META["USDC"].decimals
     
-    def get_eth_price(self) -> Optional[float]:
-        """Get current ETH price in USDC"""
+    def get_eth_price(self, raise_timeout: bool = False) -> Optional[float]:
+        """Get current ETH price in USDC; with raise_timeout a timed-out quote raises instead of returning None"""
         try:
             # Get quote for 1 ETH to USDC
-            eth_decimals = TOKEN_META["ETH"]["decimals"]
-            amount = 10 ** eth_decimals  # 1 ETH
+            amount = self.eth_scale  # 1 ETH
             
             quote_request = QuoteRequest(
                 input_mint=self.eth_mint,
@@ -113,24 +300,38 @@ class ETHPerpTrader:
                 amount=amount
             )
             
-            quote = self.jupiter_api.get_quote(quote_request)
+            # Always the same 1-ETH request, so polls within PRICE_TTL share one quote
+            quote = self.jupiter_api.get_quote(quote_request, ttl=PRICE_TTL, raise_timeout=raise_timeout)
             if quote and 'outAmount' in quote:
-                usdc_decimals = TOKEN_META["USDC"]["decimals"]
-                price = int(quote['outAmount']) / (10 ** usdc_decimals)
+                price = int(quote['outAmount']) / self.usdc_scale
                 return price
             
             return None
             
         except Exception as e:
+            if raise_timeout and isinstance(e, TIMEOUT_ERRORS):
+                raise
             print(f"[ERROR] Failed to get ETH price: {e}")
             return None
     
+    async def get_eth_price_async(self, raise_timeout: bool = False) -> Optional[float]:
+        """Async version of get_eth_price, sharing its quote cache"""
+        quote_request = QuoteRequest(
+            input_mint=self.eth_mint,
+            output_mint=self.usdc_mint,
+            amount=self.eth_scale  # 1 ETH
+        )
+        
+        quote = await self.jupiter_api.get_quote_async(quote_request, ttl=PRICE_TTL, raise_timeout=raise_timeout)
+        if quote and 'outAmount' in quote:
+            return int(quote['outAmount']) / self.usdc_scale
+        return None
+    
     def create_buy_order(self, usdc_amount: float, user_public_key: str, 
                         slippage_bps: int = 100) -> Optional[Dict[str, Any]]:
         """Create ETH buy order with USDC"""
         try:
-            usdc_decimals = TOKEN_META["USDC"]["decimals"]
-            amount_in_base_units = int(usdc_amount * (10 ** usdc_decimals))
+            amount_in_base_units = int(usdc_amount * self.usdc_scale)
             
             quote_request = QuoteRequest(
                 input_mint=self.usdc_mint,
@@ -149,7 +350,45 @@ class ETHPerpTrader:
                 'transaction': swap_transaction,
                 'side': 'buy',
                 'input_amount': usdc_amount,
-                'expected_output': int(quote['outAmount']) / (10 ** TOKEN_META["ETH"]["decimals"])
+                'expected_output': int(quote['outAmount']) / self.eth_scale
+            }
+            
+        except Exception as e:
+            print(f"[ERROR] Failed to create buy order: {e}")
+            return None
+    
+    async def create_buy_order_async(self, usdc_amount: float, user_public_key: str,
+                                     slippage_bps: int = 100) -> Optional[Dict[str, Any]]:
+        """
+        Async version of create_buy_order; the quote and the ETH spot price are
+        fetched concurrently, and the price is returned as 'market_price'
+        """
+        try:
+            amount_in_base_units = int(usdc_amount * self.usdc_scale)
+            
+            quote_request = QuoteRequest(
+                input_mint=self.usdc_mint,
+                output_mint=self.eth_mint,
+                amount=amount_in_base_units,
+                slippage_bps=slippage_bps
+            )
+            
+            quote, prices = await asyncio.gather(
+                self.jupiter_api.get_quote_async(quote_request),
+                self.jupiter_api.get_price_async([self.eth_mint])
+            )
+            if not quote:
+                return None
+            
+            swap_transaction = await self.jupiter_api.get_swap_transaction_async(quote, user_public_key)
+            price_info = (prices or {}).get('data', {}).get(self.eth_mint, {})
+            return {
+                'quote': quote,
+                'transaction': swap_transaction,
+                'side': 'buy',
+                'input_amount': usdc_amount,
+                'expected_output': int(quote['outAmount']) / self.eth_scale,
+                'market_price': price_info.get('price')
             }
             
         except Exception as e:
@@ -160,8 +399,7 @@ class ETHPerpTrader:
                          slippage_bps: int = 100) -> Optional[Dict[str, Any]]:
         """Create ETH sell order for USDC"""
         try:
-            eth_decimals = TOKEN_META["ETH"]["decimals"]
-            amount_in_base_units = int(eth_amount * (10 ** eth_decimals))
+            amount_in_base_units = int(eth_amount * self.eth_scale)
             
             quote_request = QuoteRequest(
                 input_mint=self.eth_mint,
@@ -180,7 +418,7 @@ class ETHPerpTrader:
                 'transaction': swap_transaction,
                 'side': 'sell',
                 'input_amount': eth_amount,
-                'expected_output': int(quote['outAmount']) / (10 ** TOKEN_META["USDC"]["decimals"])
+                'expected_output': int(quote['outAmount']) / self.usdc_scale
             }
             
         except Exception as e:
@@ -3,15 +3,133 @@ Jupiter Integration Module
 Provides complementary market data to enhance Drift ETH perps trading
 Uses Jupiter's spot data, volume metrics, and ecosystem insights
 """
+import asyncio
+import hashlib
+import inspect
+import io
+import os
 import requests
 import json
-from typing import Dict, Any, Optional, List
+import sys
+import time
+import threading
+import numpy as np
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timezone
-from dataclasses import dataclass
-from core.jupiter_api import JupiterAPI, ETHPerpTrader
+from dataclasses import dataclass, asdict
+from core.jupiter_api import JupiterAPI, ETHPerpTrader, QuoteRequest, TIMEOUT_ERRORS
+from core.rate_limit import rate_limited_get
 
-@dataclass
+# Encode/decode with orjson when installed, falling back to stdlib json
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+# Liquidity probe sizes in ETH; the first quote is the reference price
+BASE_PROBE_AMOUNT = 0.1
+TEST_PROBE_AMOUNTS = [0.1, 0.5, 1.0, 5.0, 10.0]
+
+# Seconds to wait for the concurrent probe quotes before giving up on stragglers
+PROBE_TIMEOUT = 20
+
+# (connect, read) deadlines in seconds for the stats endpoint
+STATS_TIMEOUT = (2, 5)
+
+# Error reported when Jupiter data is missing because a request ran out of time,
+# so callers can tell "no data" apart from "no opportunity"
+TIMEOUT_ERROR = 'timeout'
+
+# Seconds a result is reused; one signal pass asks for insights several times
+INSIGHTS_TTL = 5.0
+VOLUME_METRICS_TTL = 30.0  # 24h volume stats move slowly
+
+# On-disk copy of the latest insights, so a restarted process can reuse them within
+# INSIGHTS_TTL instead of every instance hitting Jupiter at once. Policies:
+#   'enabled'  - read fresh entries and write new ones
+#   'replay'   - serve only the stored entry, whatever its age, and raise on a miss (backtests)
+#   'disabled' - no disk access
+INSIGHTS_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "copilot-bot", "jup_insights")
+CACHE_POLICIES = ('enabled', 'replay', 'disabled')
+
+class InsightsCacheMiss(LookupError):
+    """Raised in 'replay' mode when no stored insights exist"""
+
+# Drift/Jupiter price divergence thresholds and how the divergence reads, by its sign
+ARBITRAGE_THRESHOLD = 0.002    # 0.2%
+INTERPRETATION_THRESHOLD = 0.005  # 0.5%
+_MARKET_INTERPRETATIONS = {
+    1: 'Drift trading at premium - potential short opportunity',
+    -1: 'Drift trading at discount - potential long opportunity',
+    0: 'Prices well-aligned - no significant arbitrage'
+}
+
+# Ecosystem sentiment checks: a metric above its threshold scores a point and adds its
+# factor. Metrics are (24h volume, average trade size, -price impact, route efficiency);
+# price impact is negated so every check is "greater than"
+SENTIMENT_THRESHOLDS = (
+    1000000,  # $1M+ daily volume
+    10000,    # $10k+ average trade
+    -0.01,    # <1% price impact for 1 ETH
+    0.98      # >98% route efficiency
+)
+SENTIMENT_FACTORS = (
+    "High trading volume indicates strong interest",
+    "Large average trade size suggests institutional participation",
+    "Low price impact indicates healthy liquidity",
+    "High route efficiency indicates competitive pricing"
+)
+SENTIMENT_LABELS = ('bearish', 'bearish', 'neutral', 'bullish', 'bullish')  # by score
+
+# Everything the price comparison, sentiment and arbitrage checks derive from one
+# insights snapshot; the price fields are None when no Drift mark price is given
+InsightMetrics = namedtuple(
+    "InsightMetrics",
+    "jupiter_price price_difference absolute_difference direction volume_24h swap_count "
+    "avg_trade_size price_impact route_efficiency sentiment_factors"
+)
+ArbitrageDerivation = namedtuple("ArbitrageDerivation", "metrics mark_index_diff opportunities")
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO-8601 string"""
+    return datetime.now(timezone.utc).isoformat()
+
+def _derive_metrics(insights: "JupiterMarketInsights", drift_mark_price: Optional[float] = None) -> InsightMetrics:
+    """Read each insights field once and derive every comparison/sentiment input from it"""
+    jupiter_price = insights.eth_usdc_price
+    volume_24h = insights.volume_24h
+    swap_count = insights.swap_count_24h
+    price_impact = insights.price_impact
+    route_efficiency = insights.route_efficiency
+    
+    price_difference = absolute_difference = direction = None
+    if drift_mark_price is not None:
+        price_difference = (drift_mark_price - jupiter_price) / jupiter_price
+        absolute_difference = abs(price_difference)
+        direction = (price_difference > 0) - (price_difference < 0)
+    
+    # Sentiment indicators: one point per metric above its threshold
+    avg_trade_size = volume_24h / swap_count if swap_count > 0 else 0
+    metrics = (volume_24h, avg_trade_size, -price_impact, route_efficiency)
+    sentiment_factors = [factor for value, threshold, factor
+                         in zip(metrics, SENTIMENT_THRESHOLDS, SENTIMENT_FACTORS) if value > threshold]
+    
+    return InsightMetrics(jupiter_price, price_difference, absolute_difference, direction, volume_24h,
+                          swap_count, avg_trade_size, price_impact, route_efficiency, sentiment_factors)
+
+@dataclass(frozen=True)
 class JupiterMarketInsights:
+    __slots__ = ("eth_usdc_price", "volume_24h", "price_impact", "route_efficiency", "liquidity_depth",
+                 "swap_count_24h", "timestamp")
+    
     eth_usdc_price: float
     volume_24h: float
     price_impact: float
@@ -25,8 +143,17 @@ class JupiterEcosystemAnalyzer:
     Analyzes Jupiter ecosystem data to complement Drift perps trading
     """
     
-    def __init__(self):
-        self.jupiter_api = JupiterAPI()
+    def __init__(self, cache_policy: str = 'enabled', cache_dir: str = INSIGHTS_CACHE_DIR):
+        if cache_policy not in CACHE_POLICIES:
+            raise ValueError(f"cache_policy must be one of {CACHE_POLICIES}, got {cache_policy!r}")
+        
+        # One pooled session for the stats endpoint and every quote, so TLS
+        # connections are reused across refreshes
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+        self.session.mount('https://', adapter)
+        
+        self.jupiter_api = JupiterAPI(session=self.session)
         self.eth_trader = ETHPerpTrader(self.jupiter_api)
         
         # Jupiter-specific endpoints for analytics
@@ -36,12 +163,124 @@ class JupiterEcosystemAnalyzer:
         # Token addresses for ETH on Solana (Wormhole wrapped)
         self.eth_mint = "7vfCXTUXx5WJV5JADk17DUJ4ksgau7utNKj4b963voxs"
         self.usdc_mint = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+        
+        # Liquidity probe quotes: the base probe followed by each test size. Every
+        # input is constant, so the requests are built once and reused on each refresh
+        self._probe_requests = tuple(
+            QuoteRequest(
+                input_mint=self.eth_mint,
+                output_mint=self.usdc_mint,
+                amount=int(amount * 1e8),
+                slippage_bps=50
+            )
+            for amount in [BASE_PROBE_AMOUNT] + TEST_PROBE_AMOUNTS
+        )
+        
+        # Worker pool for the liquidity probe quotes (created on first use)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        # (value, monotonic fetch time) of the last successful fetch; the locks make
+        # concurrent callers wait for one refresh instead of each fetching
+        self._insights_cache = (None, 0.0)
+        self._volume_cache = (None, 0.0)
+        self._insights_lock = threading.Lock()
+        self._volume_lock = threading.Lock()
+        self._ainsights_lock: Optional[asyncio.Lock] = None  # created inside the event loop
+        
+        # Why the last insights refresh produced nothing (TIMEOUT_ERROR), or None
+        self.last_fetch_error: Optional[str] = None
+        
+        # Disk cache entry, keyed on everything that determines the insights
+        self.cache_policy = cache_policy
+        cache_key = hashlib.sha256(
+            f"jup_insights|{self.eth_mint}|{self.usdc_mint}|{BASE_PROBE_AMOUNT}|{TEST_PROBE_AMOUNTS}".encode()
+        ).hexdigest()
+        self._disk_cache_path = os.path.join(cache_dir, f"{cache_key}.json")
+    
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Shared thread pool used to issue the probe quotes concurrently"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1 + len(TEST_PROBE_AMOUNTS),
+                                                thread_name_prefix="jupiter-probe")
+        return self._executor
     
     def get_jupiter_eth_insights(self) -> Optional[JupiterMarketInsights]:
-        """Get comprehensive ETH trading insights from Jupiter"""
+        """Get comprehensive ETH trading insights from Jupiter (reused for INSIGHTS_TTL seconds)"""
+        with self._insights_lock:
+            insights, fetched_at = self._insights_cache
+            if insights is not None and time.monotonic() - fetched_at < INSIGHTS_TTL:
+                return insights
+            
+            insights, fetched_at = self._load_disk_insights()
+            if insights is None:
+                insights, fetched_at = self._fetch_jupiter_eth_insights(), time.monotonic()
+                self._store_disk_insights(insights)
+            if insights is not None:
+                self._insights_cache = (insights, fetched_at)
+            return insights
+    
+    async def aget_jupiter_eth_insights(self) -> Optional[JupiterMarketInsights]:
+        """
+        Async version of get_jupiter_eth_insights, sharing its cache; the price,
+        volume and liquidity requests are issued concurrently
+        """
+        if self._ainsights_lock is None:
+            self._ainsights_lock = asyncio.Lock()
+        async with self._ainsights_lock:
+            insights, fetched_at = self._insights_cache
+            if insights is not None and time.monotonic() - fetched_at < INSIGHTS_TTL:
+                return insights
+            
+            insights, fetched_at = self._load_disk_insights()
+            if insights is None:
+                insights, fetched_at = await self._afetch_jupiter_eth_insights(), time.monotonic()
+                self._store_disk_insights(insights)
+            if insights is not None:
+                self._insights_cache = (insights, fetched_at)
+            return insights
+    
+    def _load_disk_insights(self) -> Tuple[Optional[JupiterMarketInsights], float]:
+        """
+        Stored insights if the policy allows and (outside replay) they are younger than
+        INSIGHTS_TTL, with when they were fetched on the monotonic clock so the memory
+        cache expires them when the file would have (replayed insights count as fresh)
+        """
+        if self.cache_policy == 'disabled':
+            return None, 0.0
+        try:
+            age = 0.0
+            if self.cache_policy != 'replay':
+                age = max(0.0, time.time() - os.path.getmtime(self._disk_cache_path))
+                if age >= INSIGHTS_TTL:
+                    return None, 0.0
+            with open(self._disk_cache_path, 'rb') as f:
+                return JupiterMarketInsights(**_json_loads(f.read())), time.monotonic() - age
+        except (OSError, ValueError, TypeError) as e:
+            if self.cache_policy == 'replay':
+                raise InsightsCacheMiss(f"No stored Jupiter insights at {self._disk_cache_path}") from e
+            return None, 0.0
+    
+    def _store_disk_insights(self, insights: Optional[JupiterMarketInsights]):
+        """Write insights for other processes; written to a temp file and renamed so readers never see a partial file"""
+        if insights is None or self.cache_policy != 'enabled':
+            return
+        try:
+            os.makedirs(os.path.dirname(self._disk_cache_path), exist_ok=True)
+            tmp_path = f"{self._disk_cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(_json_dumps(asdict(insights)))
+            os.replace(tmp_path, self._disk_cache_path)
+        except OSError as e:
+            print(f"[WARNING] Failed to cache Jupiter insights on disk: {e}")
+    
+    def _fetch_jupiter_eth_insights(self) -> Optional[JupiterMarketInsights]:
+        """Build insights from fresh price, volume and liquidity data"""
         try:
+            self.last_fetch_error = None
+            
             # Get current ETH price through Jupiter
-            eth_price = self.eth_trader.get_eth_price()
+            eth_price = self.eth_trader.get_eth_price(raise_timeout=True)
             if not eth_price:
                 return None
             
@@ -49,33 +288,97 @@ class JupiterEcosystemAnalyzer:
             volume_data = self._get_volume_metrics()
             liquidity_data = self._get_liquidity_metrics()
             
-            return JupiterMarketInsights(
-                eth_usdc_price=eth_price,
-                volume_24h=volume_data.get('eth_volume_24h', 0),
-                price_impact=liquidity_data.get('price_impact_1_eth', 0),
-                route_efficiency=liquidity_data.get('route_efficiency', 0),
-                liquidity_depth=liquidity_data.get('liquidity_depth', 0),
-                swap_count_24h=volume_data.get('swap_count_24h', 0),
-                timestamp=datetime.now(timezone.utc).isoformat()
+            return self._build_insights(eth_price, volume_data, liquidity_data)
+            
+        except TIMEOUT_ERRORS as e:
+            print(f"[WARNING] Jupiter ETH price timed out: {e}")
+            self.last_fetch_error = TIMEOUT_ERROR
+            return None
+        except Exception as e:
+            print(f"[ERROR] Failed to get Jupiter ETH insights: {e}")
+            return None
+    
+    async def _afetch_jupiter_eth_insights(self) -> Optional[JupiterMarketInsights]:
+        """Async version of _fetch_jupiter_eth_insights"""
+        try:
+            self.last_fetch_error = None
+            
+            # The volume stats go through the cached sync path on the worker pool
+            loop = asyncio.get_running_loop()
+            eth_price, volume_data, liquidity_data = await asyncio.gather(
+                self.eth_trader.get_eth_price_async(raise_timeout=True),
+                loop.run_in_executor(self.executor, self._get_volume_metrics),
+                self._aget_liquidity_metrics()
             )
+            if not eth_price:
+                return None
             
+            return self._build_insights(eth_price, volume_data, liquidity_data)
+            
+        except TIMEOUT_ERRORS as e:
+            print(f"[WARNING] Jupiter ETH price timed out: {e}")
+            self.last_fetch_error = TIMEOUT_ERROR
+            return None
         except Exception as e:
             print(f"[ERROR] Failed to get Jupiter ETH insights: {e}")
             return None
     
+    def _build_insights(self, eth_price: float, volume_data: Dict[str, Any],
+                        liquidity_data: Dict[str, Any]) -> Optional[JupiterMarketInsights]:
+        """Combine the fetched parts; a timed-out part fails the whole refresh rather than reading as zero"""
+        if TIMEOUT_ERROR in (volume_data.get('error'), liquidity_data.get('error')):
+            print("[WARNING] Jupiter insights incomplete: request timed out")
+            self.last_fetch_error = TIMEOUT_ERROR
+            return None
+        
+        return JupiterMarketInsights(
+            eth_usdc_price=eth_price,
+            volume_24h=volume_data.get('eth_volume_24h', 0),
+            price_impact=liquidity_data.get('price_impact_1_eth', 0),
+            route_efficiency=liquidity_data.get('route_efficiency', 0),
+            liquidity_depth=liquidity_data.get('liquidity_depth', 0),
+            swap_count_24h=volume_data.get('swap_count_24h', 0),
+            timestamp=_now_iso()
+        )
+    
     def _get_volume_metrics(self) -> Dict[str, Any]:
-        """Get volume and trading activity metrics from Jupiter"""
+        """Get volume and trading activity metrics from Jupiter (reused for VOLUME_METRICS_TTL seconds)"""
+        with self._volume_lock:
+            metrics, fetched_at = self._volume_cache
+            if metrics and time.monotonic() - fetched_at < VOLUME_METRICS_TTL:
+                return metrics
+            
+            metrics = self._fetch_volume_metrics()
+            if metrics and 'error' not in metrics:
+                self._volume_cache = (metrics, time.monotonic())
+            return metrics
+    
+    def _http_get(self, url: str, **kwargs) -> Optional[Any]:
+        """
+        GET on the pooled session under the host's rate limit and 429/503 backoff;
+        returns the decoded JSON body, or None for any other non-200 response
+        """
+        response = rate_limited_get(self.session.get, url, timeout=STATS_TIMEOUT, **kwargs)
+        if response.status_code != 200:
+            return None
+        return _json_loads(response.content)
+    
+    def _fetch_volume_metrics(self) -> Dict[str, Any]:
+        """Fetch volume and trading activity metrics from Jupiter stats"""
         try:
-            response = requests.get(self.volume_url, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
+            data = self._http_get(self.volume_url)
+            if data is not None:
+                volume_24h = data.get('24h_volume') or {}
                 
                 # Extract ETH-related volume data
                 return {
                     'eth_volume_24h': self._extract_eth_volume(data),
-                    'swap_count_24h': data.get('24h_volume', {}).get('swapCount', 0),
-                    'total_volume_24h': data.get('24h_volume', {}).get('volume', 0)
+                    'swap_count_24h': volume_24h.get('swapCount', 0),
+                    'total_volume_24h': volume_24h.get('volume', 0)
                 }
+        except requests.exceptions.Timeout as e:
+            print(f"[WARNING] Jupiter volume metrics timed out: {e}")
+            return {'error': TIMEOUT_ERROR}
         except Exception as e:
             print(f"[WARNING] Failed to get Jupiter volume metrics: {e}")
         
@@ -84,68 +387,93 @@ class JupiterEcosystemAnalyzer:
     def _get_liquidity_metrics(self) -> Dict[str, Any]:
         """Analyze ETH liquidity on Jupiter by testing quotes"""
         try:
-            # Test various trade sizes to assess liquidity depth
-            test_amounts = [0.1, 0.5, 1.0, 5.0, 10.0]  # ETH amounts
-            price_impacts = []
+            # The probes are independent, so fetch the base and test quotes concurrently
+            futures = [self.executor.submit(self.jupiter_api.get_quote, probe, raise_timeout=True)
+                       for probe in self._probe_requests]
+            
+            # One deadline for the whole batch; a stalled probe just drops out, whether
+            # its own request timed out or it was still running at the deadline
+            deadline = time.monotonic() + PROBE_TIMEOUT
+            quotes, timed_out = [], []
+            for future in futures:
+                try:
+                    quotes.append(future.result(timeout=max(0.0, deadline - time.monotonic())))
+                except (FutureTimeoutError, *TIMEOUT_ERRORS):
+                    future.cancel()  # drops it if still queued; a running probe finishes unobserved
+                    timed_out.append(future)
+                    quotes.append(None)
+            
+            # Without the base quote there is nothing to measure impact against
+            if futures[0] in timed_out:
+                return {'error': TIMEOUT_ERROR}
+            
+            return self._summarize_liquidity(quotes)
             
-            base_quote = self.jupiter_api.get_quote(
-                self.jupiter_api.QuoteRequest(
-                    input_mint=self.eth_mint,
-                    output_mint=self.usdc_mint,
-                    amount=int(0.1 * 1e8),  # 0.1 ETH
-                    slippage_bps=50
-                )
-            )
-            
-            if not base_quote:
-                return {}
-            
-            base_price = int(base_quote['outAmount']) / int(base_quote['inAmount'])
+        except Exception as e:
+            print(f"[WARNING] Failed to get Jupiter liquidity metrics: {e}")
+            return {}
+    
+    async def _aget_liquidity_metrics(self) -> Dict[str, Any]:
+        """Async version of _get_liquidity_metrics"""
+        try:
+            tasks = [asyncio.ensure_future(self.jupiter_api.get_quote_async(probe, raise_timeout=True))
+                     for probe in self._probe_requests]
             
-            # Test price impact for different sizes
-            for amount in test_amounts:
-                quote = self.jupiter_api.get_quote(
-                    self.jupiter_api.QuoteRequest(
-                        input_mint=self.eth_mint,
-                        output_mint=self.usdc_mint,
-                        amount=int(amount * 1e8),
-                        slippage_bps=50
-                    )
-                )
-                
-                if quote:
-                    trade_price = int(quote['outAmount']) / int(quote['inAmount'])
-                    price_impact = abs(trade_price - base_price) / base_price
-                    price_impacts.append(price_impact)
+            # Same shared deadline as the sync path; stragglers are cancelled
+            done, pending = await asyncio.wait(tasks, timeout=PROBE_TIMEOUT)
+            for task in pending:
+                task.cancel()
             
-            # Calculate liquidity metrics
-            avg_price_impact = sum(price_impacts) / len(price_impacts) if price_impacts else 0
-            max_price_impact = max(price_impacts) if price_impacts else 0
+            # Checked for every task, so no probe's timeout is left unretrieved
+            timed_out = [task in pending or isinstance(task.exception(), TIMEOUT_ERRORS) for task in tasks]
+            if timed_out[0]:
+                return {'error': TIMEOUT_ERROR}
+            quotes = [None if stalled else task.result() for task, stalled in zip(tasks, timed_out)]
             
-            return {
-                'price_impact_1_eth': price_impacts[2] if len(price_impacts) > 2 else 0,
-                'avg_price_impact': avg_price_impact,
-                'max_price_impact': max_price_impact,
-                'route_efficiency': 1 - avg_price_impact,  # Higher is better
-                'liquidity_depth': self._calculate_liquidity_depth(price_impacts, test_amounts)
-            }
+            return self._summarize_liquidity(quotes)
             
         except Exception as e:
             print(f"[WARNING] Failed to get Jupiter liquidity metrics: {e}")
             return {}
     
+    def _summarize_liquidity(self, quotes: List[Optional[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Liquidity metrics from the base quote followed by the test quotes (None if missing)"""
+        base_quote = quotes[0]
+        if not base_quote:
+            return {}
+        
+        # Test price impact for different sizes against the base price, in one array pass
+        filled = [base_quote] + [quote for quote in quotes[1:] if quote]
+        out_amounts = np.fromiter((int(q['outAmount']) for q in filled), dtype=np.float64, count=len(filled))
+        in_amounts = np.fromiter((int(q['inAmount']) for q in filled), dtype=np.float64, count=len(filled))
+        prices = out_amounts / in_amounts
+        price_impacts = np.abs(prices[1:] - prices[0]) / prices[0]
+        
+        # Calculate liquidity metrics
+        avg_price_impact = float(price_impacts.mean()) if price_impacts.size else 0
+        max_price_impact = float(price_impacts.max()) if price_impacts.size else 0
+        
+        return {
+            'price_impact_1_eth': float(price_impacts[2]) if price_impacts.size > 2 else 0,
+            'avg_price_impact': avg_price_impact,
+            'max_price_impact': max_price_impact,
+            'route_efficiency': 1 - avg_price_impact,  # Higher is better
+            'liquidity_depth': self._calculate_liquidity_depth(price_impacts.tolist(), TEST_PROBE_AMOUNTS)
+        }
+    
     def _extract_eth_volume(self, volume_data: Dict) -> float:
         """Extract ETH-specific volume from Jupiter stats"""
         try:
-            # Look for ETH in the top tokens by volume
-            top_tokens = volume_data.get('24h_volume', {}).get('topTokens', [])
+            volume_24h = volume_data.get('24h_volume') or {}
             
-            for token in top_tokens:
-                if token.get('mint') == self.eth_mint:
-                    return float(token.get('volume', 0))
+            # Look for ETH in the top tokens by volume
+            eth_token = next((token for token in volume_24h.get('topTokens', ())
+                              if token.get('mint') == self.eth_mint), None)
+            if eth_token is not None:
+                return float(eth_token.get('volume', 0))
             
             # Fallback: estimate based on total volume
-            total_volume = float(volume_data.get('24h_volume', {}).get('volume', 0))
+            total_volume = float(volume_24h.get('volume', 0))
             return total_volume * 0.05  # Assume ETH is ~5% of total volume
             
         except Exception:
@@ -162,95 +490,67 @@ class JupiterEcosystemAnalyzer:
         # Lower price impact for large trades = higher liquidity depth
         return max(0, 1 - large_trade_impact * 10)  # Scale factor for interpretation
     
-    def compare_with_drift_pricing(self, drift_mark_price: float) -> Dict[str, Any]:
-        """Compare Jupiter spot pricing with Drift mark price"""
-        jupiter_insights = self.get_jupiter_eth_insights()
+    def compare_with_drift_pricing(self, drift_mark_price: float,
+                                   insights: Optional[JupiterMarketInsights] = None) -> Dict[str, Any]:
+        """Compare Jupiter spot pricing with Drift mark price (fetching insights unless given)"""
+        jupiter_insights = insights or self.get_jupiter_eth_insights()
         
         if not jupiter_insights:
             return {'error': 'No Jupiter data available'}
         
-        jupiter_price = jupiter_insights.eth_usdc_price
-        price_difference = (drift_mark_price - jupiter_price) / jupiter_price
-        
-        # Analyze the price divergence
-        analysis = {
-            'jupiter_spot_price': jupiter_price,
+        return self._comparison_view(jupiter_insights, drift_mark_price,
+                                     _derive_metrics(jupiter_insights, drift_mark_price))
+    
+    @staticmethod
+    def _comparison_view(insights: JupiterMarketInsights, drift_mark_price: float,
+                         metrics: InsightMetrics) -> Dict[str, Any]:
+        """The price divergence analysis, from already derived metrics"""
+        absolute_difference = metrics.absolute_difference
+        direction = metrics.direction
+        return {
+            'jupiter_spot_price': metrics.jupiter_price,
             'drift_mark_price': drift_mark_price,
-            'price_difference_pct': price_difference * 100,
-            'absolute_difference': abs(price_difference),
-            'drift_premium_discount': 'premium' if price_difference > 0 else 'discount',
-            'arbitrage_opportunity': abs(price_difference) > 0.002,  # 0.2% threshold
-            'jupiter_insights': jupiter_insights
+            'price_difference_pct': metrics.price_difference * 100,
+            'absolute_difference': absolute_difference,
+            'drift_premium_discount': 'premium' if direction > 0 else 'discount',
+            'arbitrage_opportunity': absolute_difference > ARBITRAGE_THRESHOLD,
+            'jupiter_insights': insights,
+            'market_interpretation': _MARKET_INTERPRETATIONS[
+                direction if absolute_difference > INTERPRETATION_THRESHOLD else 0]
         }
-        
-        # Add market interpretation
-        if abs(price_difference) > 0.005:  # 0.5% threshold
-            if price_difference > 0:
-                analysis['market_interpretation'] = 'Drift trading at premium - potential short opportunity'
-            else:
-                analysis['market_interpretation'] = 'Drift trading at discount - potential long opportunity'
-        else:
-            analysis['market_interpretation'] = 'Prices well-aligned - no significant arbitrage'
-        
-        return analysis
     
-    def get_eth_ecosystem_sentiment(self) -> Dict[str, Any]:
-        """Analyze ETH ecosystem sentiment through Jupiter activity"""
+    def get_eth_ecosystem_sentiment(self, insights: Optional[JupiterMarketInsights] = None,
+                                    timestamp: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Analyze ETH ecosystem sentiment through Jupiter activity (fetching insights unless given)
+        timestamp lets a caller stamp several results with one reading of the clock
+        """
         try:
-            insights = self.get_jupiter_eth_insights()
+            insights = insights or self.get_jupiter_eth_insights()
             if not insights:
                 return {}
             
-            # Analyze trading patterns
-            volume_24h = insights.volume_24h
-            swap_count = insights.swap_count_24h
-            avg_trade_size = volume_24h / swap_count if swap_count > 0 else 0
-            
-            # Sentiment indicators
-            sentiment_score = 0
-            sentiment_factors = []
-            
-            # High volume indicates interest
-            if volume_24h > 1000000:  # $1M+ daily volume
-                sentiment_score += 1
-                sentiment_factors.append("High trading volume indicates strong interest")
-            
-            # Large average trade size indicates institutional activity
-            if avg_trade_size > 10000:  # $10k+ average trade
-                sentiment_score += 1
-                sentiment_factors.append("Large average trade size suggests institutional participation")
-            
-            # Low price impact indicates good liquidity
-            if insights.price_impact < 0.01:  # <1% price impact for 1 ETH
-                sentiment_score += 1
-                sentiment_factors.append("Low price impact indicates healthy liquidity")
-            
-            # High route efficiency indicates competitive market
-            if insights.route_efficiency > 0.98:  # >98% efficiency
-                sentiment_score += 1
-                sentiment_factors.append("High route efficiency indicates competitive pricing")
-            
-            sentiment_label = 'bearish'
-            if sentiment_score >= 3:
-                sentiment_label = 'bullish'
-            elif sentiment_score >= 2:
-                sentiment_label = 'neutral'
-            
-            return {
-                'sentiment_score': sentiment_score,
-                'sentiment_label': sentiment_label,
-                'sentiment_factors': sentiment_factors,
-                'volume_24h': volume_24h,
-                'avg_trade_size': avg_trade_size,
-                'swap_count_24h': swap_count,
-                'price_impact_1eth': insights.price_impact,
-                'route_efficiency': insights.route_efficiency,
-                'timestamp': datetime.now(timezone.utc).isoformat()
-            }
+            return self._sentiment_view(_derive_metrics(insights), timestamp or _now_iso())
             
         except Exception as e:
             print(f"[ERROR] Failed to analyze ETH ecosystem sentiment: {e}")
             return {}
+    
+    @staticmethod
+    def _sentiment_view(metrics: InsightMetrics, timestamp: str) -> Dict[str, Any]:
+        """The ecosystem sentiment summary, from already derived metrics"""
+        sentiment_score = len(metrics.sentiment_factors)
+        return {
+            'sentiment_score': sentiment_score,
+            'sentiment_label': SENTIMENT_LABELS[sentiment_score],
+            'sentiment_factors': metrics.sentiment_factors,
+            'volume_24h': metrics.volume_24h,
+            'avg_trade_size': metrics.avg_trade_size,
+            'swap_count_24h': metrics.swap_count,
+            'price_impact_1eth': metrics.price_impact,
+            'route_efficiency': metrics.route_efficiency,
+            'timestamp': timestamp
+        }
 
 class JupiterDriftArbitrageDetector:
     """
@@ -267,69 +567,110 @@ class JupiterDriftArbitrageDetector:
         Detect arbitrage opportunities between Jupiter and Drift
         """
         try:
-            drift_mark_price = drift_market_data.get('mark_price', 0)
-            drift_index_price = drift_market_data.get('index_price', 0)
-            
-            if not drift_mark_price:
+            if not drift_market_data.get('mark_price', 0):
                 return {'error': 'No Drift market data'}
             
-            # Compare with Jupiter pricing
-            jupiter_comparison = self.jupiter_analyzer.compare_with_drift_pricing(drift_mark_price)
+            # Fetch Jupiter insights once for both the price comparison and the sentiment
+            insights = self.jupiter_analyzer.get_jupiter_eth_insights()
+            return self._find_opportunities(drift_market_data, insights)
             
-            if 'error' in jupiter_comparison:
-                return jupiter_comparison
-            
-            # Get ecosystem sentiment
-            ecosystem_sentiment = self.jupiter_analyzer.get_eth_ecosystem_sentiment()
-            
-            opportunities = []
-            
-            # Check for mark/index arbitrage on Drift
-            mark_index_diff = abs(drift_mark_price - drift_index_price) / drift_index_price
-            if mark_index_diff > 0.001:  # 0.1% threshold
-                opportunities.append({
-                    'type': 'mark_index_arbitrage',
-                    'description': f'Drift mark price {mark_index_diff:.3%} away from index',
-                    'opportunity_size': mark_index_diff,
-                    'confidence': min(mark_index_diff / 0.001, 3.0)
-                })
-            
-            # Check for Jupiter-Drift arbitrage
-            if jupiter_comparison.get('arbitrage_opportunity'):
-                price_diff = jupiter_comparison.get('absolute_difference', 0)
-                opportunities.append({
-                    'type': 'jupiter_drift_arbitrage',
-                    'description': f'Price difference: {price_diff:.3%} between Jupiter spot and Drift mark',
-                    'opportunity_size': price_diff,
-                    'confidence': min(price_diff / self.min_arbitrage_threshold, 2.5),
-                    'direction': 'buy_drift_sell_jupiter' if jupiter_comparison.get('price_difference_pct', 0) < 0 else 'sell_drift_buy_jupiter'
-                })
-            
-            # Filter opportunities by minimum thresholds
-            significant_opportunities = [
-                opp for opp in opportunities 
-                if opp['opportunity_size'] > self.min_arbitrage_threshold and
-                   opp['confidence'] > 1.0
-            ]
+        except Exception as e:
+            print(f"[ERROR] Arbitrage detection failed: {e}")
+            return {'error': str(e)}
+    
+    async def adetect_arbitrage_opportunities(self, drift_market_data) -> Dict[str, Any]:
+        """
+        Async version of detect_arbitrage_opportunities. drift_market_data may also be
+        an awaitable that fetches it, in which case the Drift fetch and the Jupiter
+        requests run concurrently
+        """
+        try:
+            if inspect.isawaitable(drift_market_data):
+                drift_market_data, insights = await asyncio.gather(
+                    drift_market_data,
+                    self.jupiter_analyzer.aget_jupiter_eth_insights()
+                )
+                if not (drift_market_data or {}).get('mark_price', 0):
+                    return {'error': 'No Drift market data'}
+            else:
+                if not drift_market_data.get('mark_price', 0):
+                    return {'error': 'No Drift market data'}
+                insights = await self.jupiter_analyzer.aget_jupiter_eth_insights()
             
-            return {
-                'opportunities': significant_opportunities,
-                'jupiter_comparison': jupiter_comparison,
-                'ecosystem_sentiment': ecosystem_sentiment,
-                'market_conditions': {
-                    'drift_mark_price': drift_mark_price,
-                    'drift_index_price': drift_index_price,
-                    'jupiter_spot_price': jupiter_comparison.get('jupiter_spot_price'),
-                    'mark_index_spread': mark_index_diff,
-                    'jupiter_drift_spread': jupiter_comparison.get('absolute_difference', 0)
-                },
-                'timestamp': datetime.now(timezone.utc).isoformat()
-            }
+            return self._find_opportunities(drift_market_data, insights)
             
         except Exception as e:
             print(f"[ERROR] Arbitrage detection failed: {e}")
             return {'error': str(e)}
     
+    def _find_opportunities(self, drift_market_data: Dict,
+                            insights: Optional[JupiterMarketInsights]) -> Dict[str, Any]:
+        """Score the opportunities for one Drift snapshot against the Jupiter insights"""
+        drift_mark_price = drift_market_data.get('mark_price', 0)
+        drift_index_price = drift_market_data.get('index_price', 0)
+        
+        if not insights:
+            # Distinguish "Jupiter too slow" from "no data at all"
+            return {'error': self.jupiter_analyzer.last_fetch_error or 'No Jupiter data available'}
+        
+        derived = self._derive_all(insights, drift_mark_price, drift_index_price)
+        metrics = derived.metrics
+        
+        # Comparison and sentiment are views over the same derived metrics,
+        # stamped with the same time as the result
+        now = _now_iso()
+        jupiter_comparison = self.jupiter_analyzer._comparison_view(insights, drift_mark_price, metrics)
+        
+        return {
+            'opportunities': derived.opportunities,
+            'jupiter_comparison': jupiter_comparison,
+            'ecosystem_sentiment': self.jupiter_analyzer._sentiment_view(metrics, now),
+            'market_conditions': {
+                'drift_mark_price': drift_mark_price,
+                'drift_index_price': drift_index_price,
+                'jupiter_spot_price': metrics.jupiter_price,
+                'mark_index_spread': derived.mark_index_diff,
+                'jupiter_drift_spread': metrics.absolute_difference
+            },
+            'timestamp': now
+        }
+    
+    def _derive_all(self, insights: JupiterMarketInsights, drift_mark_price: float,
+                    drift_index_price: float) -> ArbitrageDerivation:
+        """Derive the metrics and the significant opportunities in one pass over the inputs"""
+        metrics = _derive_metrics(insights, drift_mark_price)
+        opportunities = []
+        
+        # Check for mark/index arbitrage on Drift
+        mark_index_diff = abs(drift_mark_price - drift_index_price) / drift_index_price
+        if mark_index_diff > 0.001:  # 0.1% threshold
+            opportunities.append({
+                'type': 'mark_index_arbitrage',
+                'description': f'Drift mark price {mark_index_diff:.3%} away from index',
+                'opportunity_size': mark_index_diff,
+                'confidence': min(mark_index_diff / 0.001, 3.0)
+            })
+        
+        # Check for Jupiter-Drift arbitrage
+        price_diff = metrics.absolute_difference
+        if price_diff > ARBITRAGE_THRESHOLD:
+            opportunities.append({
+                'type': 'jupiter_drift_arbitrage',
+                'description': f'Price difference: {price_diff:.3%} between Jupiter spot and Drift mark',
+                'opportunity_size': price_diff,
+                'confidence': min(price_diff / self.min_arbitrage_threshold, 2.5),
+                'direction': 'buy_drift_sell_jupiter' if metrics.price_difference < 0 else 'sell_drift_buy_jupiter'
+            })
+        
+        # Filter opportunities by minimum thresholds
+        significant_opportunities = [
+            opp for opp in opportunities 
+            if opp['opportunity_size'] > self.min_arbitrage_threshold and
+               opp['confidence'] > 1.0
+        ]
+        
+        return ArbitrageDerivation(metrics, mark_index_diff, significant_opportunities)
+    
     def generate_arbitrage_signals(self, arbitrage_data: Dict) -> List[Dict[str, Any]]:
         """
         Generate trading signals based on arbitrage opportunities
@@ -338,39 +679,43 @@ class JupiterDriftArbitrageDetector:
         opportunities = arbitrage_data.get('opportunities', [])
         ecosystem_sentiment = arbitrage_data.get('ecosystem_sentiment', {})
         
+        # Same for every opportunity, so read once
+        market_conditions = arbitrage_data.get('market_conditions') or {}
+        drift_mark = market_conditions.get('drift_mark_price', 0)
+        drift_index = market_conditions.get('drift_index_price', 0)
+        
         for opp in opportunities:
-            if opp['confidence'] > 1.5:  # High confidence threshold
-                
-                if opp['type'] == 'jupiter_drift_arbitrage':
-                    direction = 'long' if 'buy_drift' in opp.get('direction', '') else 'short'
-                    signals.append({
-                        'direction': direction,
-                        'reason': f"Jupiter-Drift arbitrage: {opp['description']}",
-                        'confidence': opp['confidence'],
-                        'strategy': 'cross_platform_arbitrage',
-                        'opportunity_size': opp['opportunity_size']
-                    })
+            confidence = opp['confidence']
+            if confidence <= 1.5:  # High confidence threshold
+                continue
+            
+            opp_type = opp['type']
+            if opp_type == 'jupiter_drift_arbitrage':
+                direction = 'long' if 'buy_drift' in opp.get('direction', '') else 'short'
+                signals.append({
+                    'direction': direction,
+                    'reason': f"Jupiter-Drift arbitrage: {opp['description']}",
+                    'confidence': confidence,
+                    'strategy': 'cross_platform_arbitrage',
+                    'opportunity_size': opp['opportunity_size']
+                })
+            
+            elif opp_type == 'mark_index_arbitrage':
+                # Mark trading above index suggests long pressure
+                if drift_mark > drift_index:
+                    direction = 'short'  # Mark premium suggests potential reversal
+                    reason = "Drift mark trading at premium to index - potential short"
+                else:
+                    direction = 'long'   # Mark discount suggests potential recovery
+                    reason = "Drift mark trading at discount to index - potential long"
                 
-                elif opp['type'] == 'mark_index_arbitrage':
-                    # Mark trading above index suggests long pressure
-                    market_conditions = arbitrage_data.get('market_conditions', {})
-                    drift_mark = market_conditions.get('drift_mark_price', 0)
-                    drift_index = market_conditions.get('drift_index_price', 0)
-                    
-                    if drift_mark > drift_index:
-                        direction = 'short'  # Mark premium suggests potential reversal
-                        reason = "Drift mark trading at premium to index - potential short"
-                    else:
-                        direction = 'long'   # Mark discount suggests potential recovery
-                        reason = "Drift mark trading at discount to index - potential long"
-                    
-                    signals.append({
-                        'direction': direction,
-                        'reason': reason,
-                        'confidence': opp['confidence'],
-                        'strategy': 'mark_index_arbitrage',
-                        'opportunity_size': opp['opportunity_size']
-                    })
+                signals.append({
+                    'direction': direction,
+                    'reason': reason,
+                    'confidence': confidence,
+                    'strategy': 'mark_index_arbitrage',
+                    'opportunity_size': opp['opportunity_size']
+                })
         
         # Add ecosystem sentiment-based signals
         sentiment = ecosystem_sentiment.get('sentiment_label', 'neutral')
@@ -398,22 +743,27 @@ if __name__ == "__main__":
     jupiter_analyzer = JupiterEcosystemAnalyzer()
     arbitrage_detector = JupiterDriftArbitrageDetector()
     
-    print("=== Jupiter ETH Ecosystem Analysis ===")
+    # Collect the report and write it once at the end
+    out = io.StringIO()
+    
+    print("=== Jupiter ETH Ecosystem Analysis ===", file=out)
     insights = jupiter_analyzer.get_jupiter_eth_insights()
     if insights:
-        print(f"ETH Price: ${insights.eth_usdc_price:.2f}")
-        print(f"24h Volume: ${insights.volume_24h:,.0f}")
-        print(f"Price Impact (1 ETH): {insights.price_impact:.3%}")
-        print(f"Route Efficiency: {insights.route_efficiency:.2%}")
-        print(f"24h Swaps: {insights.swap_count_24h:,}")
-    
-    print("\n=== Ecosystem Sentiment ===")
-    sentiment = jupiter_analyzer.get_eth_ecosystem_sentiment()
+        print("\n".join((
+            f"ETH Price: ${insights.eth_usdc_price:.2f}",
+            f"24h Volume: ${insights.volume_24h:,.0f}",
+            f"Price Impact (1 ETH): {insights.price_impact:.3%}",
+            f"Route Efficiency: {insights.route_efficiency:.2%}",
+            f"24h Swaps: {insights.swap_count_24h:,}"
+        )), file=out)
+    
+    print("\n=== Ecosystem Sentiment ===", file=out)
+    sentiment = jupiter_analyzer.get_eth_ecosystem_sentiment(insights)
     if sentiment:
-        print(f"Sentiment: {sentiment.get('sentiment_label', 'unknown').upper()}")
-        print(f"Score: {sentiment.get('sentiment_score', 0)}/4")
+        print(f"Sentiment: {sentiment.get('sentiment_label', 'unknown').upper()}", file=out)
+        print(f"Score: {sentiment.get('sentiment_score', 0)}/4", file=out)
         for factor in sentiment.get('sentiment_factors', []):
-            print(f"  • {factor}")
+            print(f"  • {factor}", file=out)
     
     # Test arbitrage detection with sample Drift data
     sample_drift_data = {
@@ -422,15 +772,17 @@ if __name__ == "__main__":
         'funding_rate': 0.0001
     }
     
-    print("\n=== Arbitrage Opportunities ===")
+    print("\n=== Arbitrage Opportunities ===", file=out)
     arbitrage_result = arbitrage_detector.detect_arbitrage_opportunities(sample_drift_data)
     if arbitrage_result.get('opportunities'):
         for opp in arbitrage_result['opportunities']:
-            print(f"  {opp['type']}: {opp['description']} (confidence: {opp['confidence']:.1f})")
+            print(f"  {opp['type']}: {opp['description']} (confidence: {opp['confidence']:.1f})", file=out)
     else:
-        print("  No significant arbitrage opportunities detected")
+        print("  No significant arbitrage opportunities detected", file=out)
     
-    print("\n=== Generated Signals ===")
+    print("\n=== Generated Signals ===", file=out)
     signals = arbitrage_detector.generate_arbitrage_signals(arbitrage_result)
     for signal in signals:
-        print(f"  {signal['direction'].upper()}: {signal['reason']} (confidence: {signal['confidence']:.1f})")
\ No newline at end of file
+        print(f"  {signal['direction'].upper()}: {signal['reason']} (confidence: {signal['confidence']:.1f})", file=out)
+    
+    sys.stdout.write(out.getvalue())
@@ -1,40 +1,77 @@
 # core/market_data.py
 
+import os
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
-from driftpy.drift_client import DriftClient
-from driftpy.wallet import Wallet
-from solana.rpc.api import Client as SolanaClient
 from config.trade_config import RPC_URL, KEYPAIR_PATH, MARKET_INDEX
 from utils.logger import log_trade_action
 
-def init_drift_client():
-    solana_client = SolanaClient(RPC_URL)
-    wallet = Wallet(KEYPAIR_PATH)
+def init_drift_client(keypair_path=KEYPAIR_PATH, rpc_url=RPC_URL):
+    """
+    Returns a Drift client for the given wallet and RPC endpoint, reused across calls.
+    The cache is keyed on the process id as well, so a forked worker builds its own
+    client instead of sharing the parent's RPC connections.
+    """
+    return _drift_client_for(keypair_path, rpc_url, os.getpid())
+
+@lru_cache(maxsize=1)
+def _drift_client_for(keypair_path, rpc_url, pid):
+    # driftpy/solana are imported here so dry-run paths never pay for loading them
+    from driftpy.drift_client import DriftClient
+    from driftpy.wallet import Wallet
+    from solana.rpc.api import Client as SolanaClient
+
+    solana_client = SolanaClient(rpc_url)
+    wallet = Wallet(keypair_path)
     return DriftClient(solana_client, wallet)
 
+# Candles kept between calls; once it covers the requested window, each call only
+# asks Drift for the newest bars and appends them
+_ohlcv_cache = pd.DataFrame()
+INCREMENTAL_LIMIT = 2  # the still-forming bar and the one just closed
+
+def _candles_to_frame(candles):
+    """Build the OHLCV DataFrame column by column rather than a dict per candle"""
+    n = len(candles)
+    timestamps = np.fromiter((candle.timestamp for candle in candles), dtype=np.int64, count=n)
+    columns = {
+        field: np.fromiter((getattr(candle, field) for candle in candles), dtype=np.float64, count=n)
+        for field in ('open', 'high', 'low', 'close', 'volume')
+    }
+    return pd.DataFrame({'timestamp': pd.to_datetime(timestamps, unit='s'), **columns})
+
 def fetch_eth_perp_ohlcv(limit=100):
     """
     Fetches recent OHLCV data for ETH-PERP from Drift.
     Returns a DataFrame with columns: ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+    After the first full fetch only the last INCREMENTAL_LIMIT candles are requested and
+    merged into the cached window; a gap since the last call triggers a full refetch.
     """
+    global _ohlcv_cache
     try:
         drift_client = init_drift_client()
-        candles = drift_client.get_candles(market_index=MARKET_INDEX, limit=limit)
+        incremental = len(_ohlcv_cache) >= limit
+        candles = drift_client.get_candles(market_index=MARKET_INDEX,
+                                           limit=INCREMENTAL_LIMIT if incremental else limit)
 
         if not candles:
             log_trade_action("No candle data returned from Drift.")
             return pd.DataFrame()
 
-        df = pd.DataFrame([{
-            'timestamp': pd.to_datetime(candle.timestamp, unit='s'),
-            'open': candle.open,
-            'high': candle.high,
-            'low': candle.low,
-            'close': candle.close,
-            'volume': candle.volume
-        } for candle in candles])
+        new_rows = _candles_to_frame(candles)
+        if incremental and new_rows['timestamp'].iloc[0] > _ohlcv_cache['timestamp'].iloc[-1]:
+            # Missed bars between calls; the short fetch can't bridge them
+            _ohlcv_cache = pd.DataFrame()
+            return fetch_eth_perp_ohlcv(limit)
 
-        return df
+        if incremental:
+            # A re-sent bar replaces the cached one (the forming bar keeps updating)
+            new_rows = pd.concat([_ohlcv_cache, new_rows], ignore_index=True)
+            new_rows = new_rows.drop_duplicates('timestamp', keep='last')
+        _ohlcv_cache = new_rows.tail(limit).reset_index(drop=True)
+        return _ohlcv_cache.copy()
 
     except Exception as e:
         log_trade_action(f"[ERROR] Failed to fetch OHLCV data: {str(e)}")
@@ -1,9 +1,27 @@
 # performance.py
 
+import os
+
+TRADE_LOG = "trade_log.txt"
+
+def count_lines(path, chunk_size=1 << 20):
+    """
+    Count lines like len(f.readlines()) without building them: newlines are
+    counted in raw byte chunks, plus one for an unterminated last line
+    """
+    if os.path.getsize(path) == 0:
+        return 0
+    count = 0
+    last = b"\n"
+    with open(path, "rb", buffering=0) as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            count += chunk.count(b"\n")
+            last = chunk[-1:]
+    return count + (last != b"\n")
+
 def evaluate_performance():
     try:
-        with open("trade_log.txt", "r") as f:
-            trades = f.readlines()
-        print(f"[PERFORMANCE] Total trades: {len(trades)}")
+        trades = count_lines(TRADE_LOG)
+        print(f"[PERFORMANCE] Total trades: {trades}")
     except FileNotFoundError:
         print("[PERFORMANCE] No trades logged yet.")
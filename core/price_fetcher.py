@@ -5,12 +5,58 @@ Never raises on network errors; always returns a number (uses last good price or
 """
 from __future__ import annotations
 
+import asyncio
+import atexit
 import json
 import os
 import time
-from typing import Optional, Dict, List
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Optional, Dict, List, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from core.aio_session import LoopBoundSession
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+# The last-price file is always rewritten at this size (JSON padded with spaces), so an
+# in-place rewrite never leaves a reader a mix of the old and new payloads; the longest
+# payload, two 24-character floats, is 69 bytes with the stdlib encoder
+LAST_PRICE_RECORD_SIZE = 80
+
+# (url, query params, extract price from decoded JSON body)
+PriceSource = Tuple[str, Optional[Dict[str, str]], Callable[[Any], Optional[float]]]
+
+
+def _median(prices: List[float]) -> float:
+    """Median of the candidates; there are at most four sources, so small counts use min/max networks."""
+    n = len(prices)
+    if n == 1:
+        return prices[0]
+    if n == 2:
+        return (prices[0] + prices[1]) / 2.0
+    if n == 3:
+        a, b, c = prices
+        return max(min(a, b), min(max(a, b), c))
+    if n == 4:
+        a, b, c, d = prices
+        # Middle two of four: the larger of the pair minimums and the smaller of the pair maximums
+        return (max(min(a, b), min(c, d)) + min(max(a, b), max(c, d))) / 2.0
+    ordered = sorted(prices)
+    mid = n // 2
+    return ordered[mid] if n % 2 == 1 else (ordered[mid - 1] + ordered[mid]) / 2.0
 
 
 class PriceFetcher:
@@ -21,13 +67,21 @@ class PriceFetcher:
         max_retries_per_source: int = 2,
         retry_backoff_seconds: float = 0.4,
         last_price_path: str = "data/last_price.json",
+        total_timeout_seconds: float = 8.0,
+        cache_ttl_seconds: float = 1.0,
     ) -> None:
         self.prefer_perp = prefer_perp
         self.timeout_seconds = timeout_seconds
         self.max_retries_per_source = max_retries_per_source
         self.retry_backoff_seconds = retry_backoff_seconds
+        # Deadline for the whole fan-out; sources still retrying then are left out of the median
+        self.total_timeout_seconds = total_timeout_seconds
+        # A live price is reused for this long, so callers polling in a loop share one fan-out
+        self.cache_ttl_seconds = cache_ttl_seconds
         # Allow environment overrides for operational tuning
         env_timeout = os.getenv("ETH_PRICE_TIMEOUT_SECONDS")
+        env_total_timeout = os.getenv("ETH_PRICE_TOTAL_TIMEOUT_SECONDS")
+        env_cache_ttl = os.getenv("ETH_PRICE_CACHE_TTL")
         env_retries = os.getenv("ETH_PRICE_MAX_RETRIES")
         env_backoff = os.getenv("ETH_PRICE_RETRY_BACKOFF_SECONDS")
         env_last_path = os.getenv("ETH_PRICE_LAST_PATH")
@@ -35,10 +89,32 @@ class PriceFetcher:
         self.last_price_path = env_last_path or last_price_path
         self.last_good_price: Optional[float] = None
         self.last_fetch_epoch: Optional[float] = None
+        self._last_live_mono: Optional[float] = None  # monotonic time of the last live (non-fallback) price
+        # Keep-alive pool shared by every source, so polls reuse TCP/TLS connections;
+        # retries are handled per source below, not by the adapter
         self.session = requests.Session()
-        self.session.headers.update({"Accept": "application/json", "Content-Type": "application/json"})
+        self.session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=0))
+        self.session.headers.update({
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "Connection": "keep-alive",
+        })
         self.eth_mint = "7vfCXTUXx5WJV5JADk17DUJ4ksgau7utNKj4b963voxs"  # ETH (Wormhole)
 
+        # Preference order: perp (Drift) -> Jupiter spot -> Binance -> CoinGecko
+        self._sources: List[PriceSource] = [
+            ("https://dlob.drift.trade/markets/perp/2", None, self._extract_drift),
+            ("https://price.jup.ag/v4/price", {"ids": self.eth_mint}, self._extract_jupiter_spot),
+            ("https://api.binance.com/api/v3/ticker/price", {"symbol": "ETHUSDT"}, self._extract_binance),
+            ("https://api.coingecko.com/api/v3/simple/price",
+             {"ids": "ethereum", "vs_currencies": "usd"}, self._extract_coingecko),
+        ]
+
+        # Sources are queried concurrently: worker threads for the sync API,
+        # one aiohttp session per event loop for the async API (both created on first use)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._aio_session = LoopBoundSession(self._new_aio_session)
+
         # Apply env overrides after attributes exist
         try:
             if env_timeout is not None:
@@ -47,12 +123,17 @@ class PriceFetcher:
                 self.max_retries_per_source = int(env_retries)
             if env_backoff is not None:
                 self.retry_backoff_seconds = float(env_backoff)
+            if env_total_timeout is not None:
+                self.total_timeout_seconds = float(env_total_timeout)
+            if env_cache_ttl is not None:
+                self.cache_ttl_seconds = float(env_cache_ttl)
         except Exception:
             # Ignore malformed env values
             pass
 
         self._ensure_data_dir()
         self._load_last_price()
+        self._last_price_fd: Optional[int] = None  # opened on the first save
 
     def _ensure_data_dir(self) -> None:
         try:
@@ -76,91 +157,74 @@ class PriceFetcher:
             # Ignore persistence errors
             pass
 
+    def _open_last_price_fd(self) -> Optional[int]:
+        """Descriptor kept open for rewriting the last-price file in place (None where unsupported), closed at exit."""
+        if not hasattr(os, "pwrite"):
+            return None
+        try:
+            fd = os.open(self.last_price_path, os.O_WRONLY | os.O_CREAT, 0o644)
+        except OSError:
+            return None
+        atexit.register(self._close_last_price_fd)
+        return fd
+
+    def _close_last_price_fd(self) -> None:
+        fd, self._last_price_fd = self._last_price_fd, None
+        if fd is not None:
+            os.close(fd)
+
     def _save_last_price(self, price: float) -> None:
         try:
-            payload = {"price": float(price), "epoch": time.time()}
-            with open(self.last_price_path, "w") as f:
-                json.dump(payload, f)
+            payload = _json_dumps({"price": float(price), "epoch": time.time()})
+            opened = self._last_price_fd is None
+            if opened:
+                self._last_price_fd = self._open_last_price_fd()
+            if self._last_price_fd is not None:
+                # Overwrite the fixed-size record in place: no open/close or directory update per price
+                os.pwrite(self._last_price_fd, payload.ljust(LAST_PRICE_RECORD_SIZE), 0)
+                if opened:
+                    # Drop any longer file left by an earlier writer; a no-op from then on
+                    os.ftruncate(self._last_price_fd, LAST_PRICE_RECORD_SIZE)
+            else:
+                with open(self.last_price_path, "wb") as f:
+                    f.write(payload)
         except Exception:
             # Ignore persistence errors
             pass
 
     # ===== Source fetchers =====
-    def _fetch_from_drift(self) -> Optional[float]:
-        """Fetch ETH-PERP mark price from Drift (dlob)."""
-        try:
-            resp = self.session.get(
-                "https://dlob.drift.trade/markets/perp/2",
-                timeout=self.timeout_seconds,
-            )
-            if resp.status_code == 200:
-                data = resp.json().get("market", {})
-                # Prices are 6 decimals
-                mark_price = float(data.get("markPrice", 0)) / 1e6
-                if mark_price > 0:
-                    return mark_price
-        except Exception:
-            return None
-        return None
+    def _extract_drift(self, body: Any) -> Optional[float]:
+        """ETH-PERP mark price from Drift (dlob)."""
+        # Prices are 6 decimals
+        return float(body.get("market", {}).get("markPrice", 0)) / 1e6
 
-    def _fetch_from_jupiter_spot(self) -> Optional[float]:
-        """Fetch ETH spot price from Jupiter price API."""
-        try:
-            resp = self.session.get(
-                "https://price.jup.ag/v4/price",
-                params={"ids": self.eth_mint},
-                timeout=self.timeout_seconds,
-            )
-            if resp.status_code == 200:
-                j = resp.json()
-                price = (
-                    j.get("data", {})
-                    .get(self.eth_mint, {})
-                    .get("price")
-                )
-                if price is not None:
-                    price = float(price)
-                    if price > 0:
-                        return price
-        except Exception:
-            return None
-        return None
+    def _extract_jupiter_spot(self, body: Any) -> Optional[float]:
+        """ETH spot price from Jupiter price API."""
+        price = body.get("data", {}).get(self.eth_mint, {}).get("price")
+        return float(price) if price is not None else None
 
-    def _fetch_from_binance(self) -> Optional[float]:
-        try:
-            resp = self.session.get(
-                "https://api.binance.com/api/v3/ticker/price",
-                params={"symbol": "ETHUSDT"},
-                timeout=self.timeout_seconds,
-            )
-            if resp.status_code == 200:
-                price = float(resp.json().get("price", 0))
-                if price > 0:
-                    return price
-        except Exception:
-            return None
-        return None
+    def _extract_binance(self, body: Any) -> Optional[float]:
+        return float(body.get("price", 0))
+
+    def _extract_coingecko(self, body: Any) -> Optional[float]:
+        return float(body.get("ethereum", {}).get("usd", 0))
 
-    def _fetch_from_coingecko(self) -> Optional[float]:
+    def _fetch_source(self, url: str, params: Optional[Dict[str, str]], extract) -> Optional[float]:
         try:
-            resp = self.session.get(
-                "https://api.coingecko.com/api/v3/simple/price",
-                params={"ids": "ethereum", "vs_currencies": "usd"},
-                timeout=self.timeout_seconds,
-            )
+            resp = self.session.get(url, params=params, timeout=self.timeout_seconds)
             if resp.status_code == 200:
-                price = float(resp.json().get("ethereum", {}).get("usd", 0))
-                if price > 0:
+                price = extract(resp.json())
+                if price is not None and price > 0:
                     return price
         except Exception:
             return None
         return None
 
-    def _attempt_with_retries(self, fn) -> Optional[float]:
+    def _attempt_with_retries(self, fn, *args) -> Optional[float]:
         attempts = 0
         delay = self.retry_backoff_seconds
         while attempts <= self.max_retries_per_source:
-            result = fn()
+            result = fn(*args)
             if isinstance(result, (int, float)) and result > 0:
                 return float(result)
             attempts += 1
@@ -172,16 +236,83 @@ class PriceFetcher:
                 delay *= 1.8
         return None
 
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=len(self._sources), thread_name_prefix="price-source")
+        return self._executor
+
     def _gather_candidates(self) -> List[float]:
-        # Preference order: perp (Drift) -> Jupiter spot -> Binance -> CoinGecko
-        sources = [self._fetch_from_drift, self._fetch_from_jupiter_spot, self._fetch_from_binance, self._fetch_from_coingecko]
+        # All sources (with their retries) run at once, so a slow source costs
+        # its own latency rather than adding to everyone else's, and the whole
+        # fan-out is bounded by total_timeout_seconds
+        futures = [
+            self.executor.submit(self._attempt_with_retries, self._fetch_source, *source)
+            for source in self._sources
+        ]
+        done, not_done = wait(futures, timeout=self.total_timeout_seconds)
+        for future in not_done:
+            future.cancel()  # a source already running finishes in the background, unused
         prices: List[float] = []
-        for fetch_fn in sources:
-            price = self._attempt_with_retries(fetch_fn)
-            if price is not None and price > 0:
-                prices.append(price)
+        for future in futures:
+            if future in done:
+                price = future.result()
+                if price is not None and price > 0:
+                    prices.append(price)
         return prices
 
+    # ===== Async API =====
+    def _new_aio_session(self):
+        return aiohttp.ClientSession(
+            headers=dict(self.session.headers),
+            timeout=aiohttp.ClientTimeout(total=self.timeout_seconds),
+        )
+
+    def _get_aio_session(self):
+        """Pooled aiohttp session for the running event loop (rebuilt when the loop changes)."""
+        return self._aio_session.get()
+
+    async def _afetch_source(self, url: str, params: Optional[Dict[str, str]], extract) -> Optional[float]:
+        try:
+            async with self._get_aio_session().get(url, params=params) as resp:
+                if resp.status == 200:
+                    price = extract(await resp.json(content_type=None))
+                    if price is not None and price > 0:
+                        return price
+        except Exception:
+            return None
+        return None
+
+    async def _aattempt_with_retries(self, fn, *args) -> Optional[float]:
+        attempts = 0
+        delay = self.retry_backoff_seconds
+        while attempts <= self.max_retries_per_source:
+            result = await fn(*args)
+            if isinstance(result, (int, float)) and result > 0:
+                return float(result)
+            attempts += 1
+            if attempts <= self.max_retries_per_source:
+                await asyncio.sleep(delay)
+                delay *= 1.8
+        return None
+
+    async def _agather_candidates(self) -> List[float]:
+        if not AIOHTTP_AVAILABLE:
+            return await asyncio.get_running_loop().run_in_executor(None, self._gather_candidates)
+        tasks = [
+            asyncio.ensure_future(self._aattempt_with_retries(self._afetch_source, *source))
+            for source in self._sources
+        ]
+        done, pending = await asyncio.wait(tasks, timeout=self.total_timeout_seconds)
+        for task in pending:
+            task.cancel()
+        results = [task.result() for task in tasks if task in done and not task.exception()]
+        return [price for price in results if isinstance(price, float) and price > 0]
+
+    async def aclose(self) -> None:
+        """Close the async session."""
+        await self._aio_session.aclose()
+
     def get_eth_price(self) -> float:
         """
         Return a robust ETH price.
@@ -189,15 +320,28 @@ class PriceFetcher:
         - Chooses median of gathered candidates for robustness.
         - Falls back to last good price if available.
         - If nothing available, returns a safe default (3000.0).
+        - A live price younger than cache_ttl_seconds is returned without refetching.
         """
-        prices = self._gather_candidates()
+        if self._cache_fresh():
+            return self.last_good_price
+        return self._select_price(self._gather_candidates())
+
+    async def aget_eth_price(self) -> float:
+        """Async version of get_eth_price; all sources are queried concurrently over aiohttp."""
+        if self._cache_fresh():
+            return self.last_good_price
+        return self._select_price(await self._agather_candidates())
+
+    def _cache_fresh(self) -> bool:
+        return (self._last_live_mono is not None
+                and time.monotonic() - self._last_live_mono < self.cache_ttl_seconds)
 
+    def _select_price(self, prices: List[float]) -> float:
         selected: Optional[float] = None
         if prices:
+            self._last_live_mono = time.monotonic()
             # Median for robustness against outliers
-            prices.sort()
-            mid = len(prices) // 2
-            selected = prices[mid] if len(prices) % 2 == 1 else (prices[mid - 1] + prices[mid]) / 2.0
+            selected = _median(prices)
         elif self.last_good_price is not None:
             print(f"⚠️ Price APIs unavailable. Using last known price: ${self.last_good_price:,.2f}")
             selected = self.last_good_price
@@ -218,3 +362,4 @@ class PriceFetcher:
 
 # Global singleton
 price_fetcher = PriceFetcher()
+atexit.register(price_fetcher.session.close)
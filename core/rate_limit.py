@@ -0,0 +1,159 @@
+"""
+Client-side rate limiting for outbound HTTP APIs
+One token bucket per host, shared by every caller in the process, plus
+backoff with jitter when the server still answers 429/503; the backoff
+applies to the whole host, not just the request that was throttled.
+A single call never waits longer than MAX_TOTAL_WAIT in total: past that
+it gives up with the throttled response (or RateLimitExceeded)
+"""
+import asyncio
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlparse
+
+# Jupiter allows 210 requests/min; stay under it with room for a short burst
+DEFAULT_RATE_PER_MIN = 180
+DEFAULT_BURST = 30
+
+# Responses that mean "slow down"
+THROTTLE_STATUSES = (429, 503)
+
+# Retries after a throttled response, the largest backoff exponent, and the cap
+# on a self-chosen backoff (a server's Retry-After still holds the host in full)
+MAX_RETRIES = 8
+MAX_BACKOFF_EXPONENT = 6
+MAX_BACKOFF = 30.0
+
+# Most seconds one call spends waiting for the bucket and backoff before giving up
+MAX_TOTAL_WAIT = 15.0
+
+class RateLimitExceeded(Exception):
+    """Raised when the host stays rate limited past the caller's wait budget"""
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at rate_per_min, holding at most burst tokens
+    Callers that find it empty are scheduled in arrival order: the token is taken
+    immediately (the balance may go negative) and the caller sleeps off the deficit.
+    After a throttled response the whole host is also held back until blocked_until
+    """
+    
+    def __init__(self, rate_per_min: float = DEFAULT_RATE_PER_MIN, burst: int = DEFAULT_BURST):
+        self.rate_per_sec = rate_per_min / 60.0
+        self.burst = burst
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+    
+    def _reserve(self, max_wait: Optional[float] = None) -> Optional[float]:
+        """
+        Take one token and return how long to wait before using it, or None
+        (leaving the token) if that wait would be longer than max_wait
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate_per_sec)
+            self.last_refill = now
+            tokens = self.tokens - 1
+            deficit_wait = -tokens / self.rate_per_sec if tokens < 0 else 0.0
+            wait = max(deficit_wait, self.blocked_until - now)
+            if max_wait is not None and wait > max_wait:
+                return None
+            self.tokens = tokens
+            return wait
+    
+    def penalize(self, seconds: float):
+        """Hold every caller back for at least seconds from now"""
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+    
+    def acquire(self, max_wait: Optional[float] = None) -> bool:
+        """Block until a request may be sent; False, without waiting, if that is more than max_wait away"""
+        wait = self._reserve(max_wait)
+        if wait is None:
+            return False
+        if wait > 0:
+            time.sleep(wait)
+        return True
+    
+    async def acquire_async(self, max_wait: Optional[float] = None) -> bool:
+        """Wait, without blocking the event loop, until a request may be sent (see acquire)"""
+        wait = self._reserve(max_wait)
+        if wait is None:
+            return False
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return True
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+def get_bucket(url: str) -> TokenBucket:
+    """Shared bucket for the URL's host"""
+    host = urlparse(url).netloc
+    with _buckets_lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            bucket = _buckets[host] = TokenBucket()
+        return bucket
+
+def backoff_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """
+    Seconds to wait before retry number attempt (0-based): capped exponential
+    plus jitter, or the server's Retry-After (in seconds) if that is longer
+    """
+    delay = min(2 ** min(attempt, MAX_BACKOFF_EXPONENT), MAX_BACKOFF) + random.random()
+    if retry_after:
+        try:
+            delay = max(delay, float(retry_after))
+        except ValueError:
+            pass  # HTTP-date form; keep our own schedule
+    return delay
+
+def rate_limited_get(get: Callable[..., Any], url: str, **kwargs) -> Any:
+    """
+    Call get(url, **kwargs) (requests.get or a Session's get/post) through the
+    host's bucket, retrying while the response is throttled; each throttled
+    response backs off the whole host so other callers don't keep hammering it.
+    Returns the last throttled response once the next retry would pass the
+    MAX_TOTAL_WAIT budget; raises RateLimitExceeded if no request could be sent
+    """
+    bucket = get_bucket(url)
+    deadline = time.monotonic() + MAX_TOTAL_WAIT
+    response = None
+    for attempt in range(MAX_RETRIES + 1):
+        if not bucket.acquire(deadline - time.monotonic()):
+            break
+        response = get(url, **kwargs)
+        if response.status_code not in THROTTLE_STATUSES:
+            return response
+        bucket.penalize(backoff_delay(attempt, response.headers.get('Retry-After')))
+    if response is None:
+        raise RateLimitExceeded(f"{urlparse(url).netloc} is rate limited for more than {MAX_TOTAL_WAIT:.0f}s")
+    return response
+
+async def rate_limited_read(request: Callable[[], Any], url: str) -> bytes:
+    """
+    Async counterpart of rate_limited_get for aiohttp: request() opens the
+    request (a session's get/post, called again for each retry) and the body of
+    the first response that is not throttled is returned. Error statuses raise
+    ClientResponseError, as does the last throttled response once the next
+    retry would pass the MAX_TOTAL_WAIT budget
+    """
+    bucket = get_bucket(url)
+    deadline = time.monotonic() + MAX_TOTAL_WAIT
+    response = None
+    for attempt in range(MAX_RETRIES + 1):
+        if not await bucket.acquire_async(deadline - time.monotonic()):
+            break
+        async with request() as response:
+            if response.status not in THROTTLE_STATUSES:
+                response.raise_for_status()
+                return await response.read()
+        bucket.penalize(backoff_delay(attempt, response.headers.get('Retry-After')))
+    if response is None:
+        raise RateLimitExceeded(f"{urlparse(url).netloc} is rate limited for more than {MAX_TOTAL_WAIT:.0f}s")
+    response.raise_for_status()
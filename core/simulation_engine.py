@@ -3,14 +3,31 @@ Trading Simulation Engine
 Handles dry run mode with real-time data and realistic trade execution simulation
 SAFETY: This engine ONLY simulates trades - never executes real trades
 """
+import atexit
 import json
 import time
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
+from functools import cached_property
 import requests
 from core.price_fetcher import price_fetcher
 
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+# Open-position count at which updates are computed column-wise with NumPy
+VECTORIZE_MIN_POSITIONS = 100
+
+# Minimum seconds between full state snapshots; changes in between are written by
+# the next save after the interval, or at exit. Closed trades are appended to the
+# trade log immediately either way.
+SNAPSHOT_MIN_INTERVAL = 1.0
+
 @dataclass
 class SimulatedPosition:
     id: str
@@ -30,6 +47,16 @@ class SimulatedPosition:
     take_profit: Optional[float] = None
     fees_paid: float = 0.0
     funding_paid: float = 0.0
+    
+    @cached_property
+    def entry_display_time(self) -> str:
+        """Entry time formatted for display, parsed once per position"""
+        return datetime.fromisoformat(self.entry_time.replace('Z', '+00:00')).strftime('%m/%d %H:%M')
+    
+    @cached_property
+    def exit_display_time(self) -> str:
+        """Exit time formatted for display, parsed once per closed position"""
+        return datetime.fromisoformat(self.exit_time.replace('Z', '+00:00')).strftime('%H:%M:%S')
 
 @dataclass
 class SimulationMetrics:
@@ -61,7 +88,16 @@ class TradingSimulator:
         self.trade_history: List[SimulatedPosition] = []
         self.metrics = SimulationMetrics(starting_balance=starting_balance, current_balance=starting_balance)
         self.simulation_file = "simulation_data.json"
+        self.trade_log_file = "trade_history.jsonl"  # append-only, one closed trade per line
+        
+        # Closed trades never change, so each is encoded once and reused by every snapshot
+        self._encoded_history: List[bytes] = []
+        self._state_dirty = False
+        self._last_snapshot = 0.0
+        self._trade_log = None  # opened on the first close
+        
         self.load_simulation_state()
+        atexit.register(self.flush_simulation_state)
     
     def get_real_time_price(self, symbol: str = "ETH") -> float:
         """Get robust real-time price using central PriceFetcher."""
@@ -146,14 +182,30 @@ class TradingSimulator:
     
     def update_positions(self):
         """Update all open positions with current market data"""
+        open_positions = [position for position in self.positions.values() if position.status == "open"]
+        
+        # One price fetch per symbol per update
+        prices: Dict[str, float] = {}
+        for position in open_positions:
+            if position.symbol not in prices:
+                prices[position.symbol] = self.get_real_time_price(position.symbol)
+        
+        if len(open_positions) < VECTORIZE_MIN_POSITIONS:
+            positions_to_close = self._update_open_positions(open_positions, prices)
+        else:
+            positions_to_close = self._update_open_positions_vectorized(open_positions, prices)
+        
+        # Close positions that hit stop loss or take profit, at the price that triggered them
+        for position_id, reason in positions_to_close:
+            self.close_position(position_id, reason, prices[self.positions[position_id].symbol])
+    
+    def _update_open_positions(self, open_positions: List[SimulatedPosition],
+                               prices: Dict[str, float]) -> List[tuple]:
+        """Mark positions to market one by one; returns (position_id, reason) for SL/TP hits"""
         positions_to_close = []
         
-        for position_id, position in self.positions.items():
-            if position.status != "open":
-                continue
-            
-            # Get current price
-            current_price = self.get_real_time_price(position.symbol)
+        for position in open_positions:
+            current_price = prices[position.symbol]
             position.current_price = current_price
             
             # Calculate unrealized PnL
@@ -189,14 +241,47 @@ class TradingSimulator:
                     close_reason = "Take Profit"
             
             if should_close:
-                positions_to_close.append((position_id, close_reason))
+                positions_to_close.append((position.id, close_reason))
         
-        # Close positions that hit stop loss or take profit
-        for position_id, reason in positions_to_close:
-            self.close_position(position_id, reason)
+        return positions_to_close
+    
+    def _update_open_positions_vectorized(self, open_positions: List[SimulatedPosition],
+                                          prices: Dict[str, float]) -> List[tuple]:
+        """Same as _update_open_positions, computed column-wise for large position books"""
+        import numpy as np
+        
+        count = len(open_positions)
+        current_price = np.fromiter((prices[pos.symbol] for pos in open_positions), float, count)
+        entry_price = np.fromiter((pos.entry_price for pos in open_positions), float, count)
+        size = np.fromiter((pos.size for pos in open_positions), float, count)
+        leverage = np.fromiter((pos.leverage for pos in open_positions), float, count)
+        is_long = np.fromiter((pos.side == "long" for pos in open_positions), bool, count)
+        stop_loss = np.fromiter((pos.stop_loss for pos in open_positions), float, count)
+        take_profit = np.fromiter((pos.take_profit for pos in open_positions), float, count)
+        
+        # Same operation order as the scalar path: (diff / entry) * size * entry * leverage
+        price_diff = np.where(is_long, current_price - entry_price, entry_price - current_price)
+        unrealized_pnl = price_diff / entry_price * size * entry_price * leverage
+        
+        # Simulated funding for every position in one draw
+        funding_cost = size * current_price * np.random.uniform(-0.001, 0.001, count)
+        
+        hit_stop = np.where(is_long, current_price <= stop_loss, current_price >= stop_loss)
+        hit_target = np.where(is_long, current_price >= take_profit, current_price <= take_profit)
+        
+        for position, price, pnl, funding in zip(open_positions, current_price.tolist(),
+                                                 unrealized_pnl.tolist(), funding_cost.tolist()):
+            position.current_price = price
+            position.unrealized_pnl = pnl
+            position.funding_paid += funding
+        
+        # Stop loss wins when both trigger, as in the scalar path
+        return [(open_positions[i].id, "Stop Loss" if hit_stop[i] else "Take Profit")
+                for i in np.flatnonzero(hit_stop | hit_target)]
     
-    def close_position(self, position_id: str, reason: str = "Manual") -> bool:
-        """Close a simulated position"""
+    def close_position(self, position_id: str, reason: str = "Manual",
+                       current_price: Optional[float] = None) -> bool:
+        """Close a simulated position (at current_price if given, else at a freshly fetched price)"""
         if position_id not in self.positions:
             return False
         
@@ -205,7 +290,8 @@ class TradingSimulator:
             return False
         
         # Get current price for exit
-        current_price = self.get_real_time_price(position.symbol)
+        if current_price is None:
+            current_price = self.get_real_time_price(position.symbol)
         exit_fees = self.calculate_fees(position.size * current_price)
         
         # Calculate final PnL
@@ -244,6 +330,7 @@ class TradingSimulator:
         # Move to trade history
         self.trade_history.append(position)
         del self.positions[position_id]
+        self._append_trade_log(position)
         
         # Update win rate
         if self.metrics.total_trades > 0:
@@ -279,21 +366,48 @@ class TradingSimulator:
         }
     
     def save_simulation_state(self):
-        """Save simulation state to file"""
+        """Save simulation state to file (at most once per SNAPSHOT_MIN_INTERVAL; see flush_simulation_state)"""
+        self._state_dirty = True
+        if time.monotonic() - self._last_snapshot >= SNAPSHOT_MIN_INTERVAL:
+            self.flush_simulation_state()
+    
+    def flush_simulation_state(self):
+        """Write any unsaved state to the snapshot file now"""
+        if not self._state_dirty:
+            return
+        
+        # Encode only trades closed since the last snapshot
+        for trade in self.trade_history[len(self._encoded_history):]:
+            self._encoded_history.append(_json_dumps(asdict(trade)))
+        
         state = {
             "starting_balance": self.starting_balance,
             "current_balance": self.current_balance,
             "positions": {pid: asdict(pos) for pid, pos in self.positions.items()},
-            "trade_history": [asdict(trade) for trade in self.trade_history],
             "metrics": asdict(self.metrics)
         }
         
         try:
-            with open(self.simulation_file, 'w') as f:
-                json.dump(state, f, indent=2)
+            # Splice the pre-encoded history into the object's closing brace
+            payload = (_json_dumps(state)[:-1] + b',"trade_history":['
+                       + b','.join(self._encoded_history) + b']}')
+            with open(self.simulation_file, 'wb') as f:
+                f.write(payload)
+            self._state_dirty = False
+            self._last_snapshot = time.monotonic()
         except Exception as e:
             print(f"Error saving simulation state: {e}")
     
+    def _append_trade_log(self, position: SimulatedPosition):
+        """Append one closed trade to the JSONL trade log"""
+        try:
+            if self._trade_log is None:
+                self._trade_log = open(self.trade_log_file, 'ab')
+            self._trade_log.write(_json_dumps(asdict(position)) + b"\n")
+            self._trade_log.flush()
+        except Exception as e:
+            print(f"Error appending to trade log: {e}")
+    
     def load_simulation_state(self):
         """Load simulation state from file"""
         try:
@@ -310,6 +424,7 @@ class TradingSimulator:
             
             # Load trade history
             self.trade_history = []
+            self._encoded_history = []
             for trade_data in state.get("trade_history", []):
                 self.trade_history.append(SimulatedPosition(**trade_data))
             
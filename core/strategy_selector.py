@@ -1,7 +1,8 @@
 from wallet.logger import log_info, log_event
 log_info("Signal detected for SOL")
 
+SIGNAL_PRIORITY = {"breakout": 3, "dip": 2, "sideways": 1, "error": 0}
+
 def select_best_signal(signals: dict) -> str:
-    priority = {"breakout": 3, "dip": 2, "sideways": 1, "error": 0}
-    sorted_signals = sorted(signals.items(), key=lambda x: priority.get(x[1], 0), reverse=True)
-    return sorted_signals[0][0] if sorted_signals else None
+    # max() keeps the first of equal priorities, as the stable reverse sort did
+    return max(signals.items(), key=lambda x: SIGNAL_PRIORITY.get(x[1], 0), default=(None, None))[0]
@@ -22,8 +22,8 @@ def plot_asset_timeline(parsed_logs):
     """
     Plots a timeline of asset selections.
     """
-    times = [entry["time"] for entry in parsed_logs]
-    assets = [entry["asset"] for entry in parsed_logs]
+    times = [entry.time for entry in parsed_logs]
+    assets = [entry.asset for entry in parsed_logs]
 
     plt.figure(figsize=(10, 2))
     plt.plot(times, assets, marker='o', linestyle='-', color='green')
@@ -44,8 +44,8 @@ def plot_pnl_simulation(parsed_logs, price_lookup):
     last_asset = None
 
     for entry in parsed_logs:
-        ts = entry["time"].isoformat()
-        asset = entry["asset"]
+        ts = entry.time.isoformat()
+        asset = entry.asset
         price = price_lookup.get(ts, {}).get(asset)
 
         if price and last_price and last_asset == asset:
@@ -2,11 +2,13 @@
 Minimalistic Trading Dashboard
 Clean, simple interface with essential features only
 """
-import os
+import sys
 import time
 from datetime import datetime
 from typing import Dict, Any, List
 
+from dashboard.terminal import ANSI_CLEAR_SCREEN, enable_vt_mode
+
 class MinimalDashboard:
     """
     Clean, minimalistic trading dashboard
@@ -17,10 +19,26 @@ class MinimalDashboard:
         self.show_help = False
         self.show_transactions = False
         self.running = False
+        self._banner = None  # (message, monotonic expiry)
+        self._parts: List[str] = []
+        self._commands = {
+            'q': self._cmd_quit,
+            'h': self._cmd_toggle_help,
+            't': self._cmd_toggle_transactions,
+            'x': self.show_safety_status,
+            'a': self._cmd_toggle_auto_approve,
+            's': self._cmd_toggle_running,
+        }
         
+    def _emit(self, line: str = ""):
+        """Queue a line for the screen being rendered"""
+        self._parts.append(line)
+    
     def clear(self):
         """Clear screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        enable_vt_mode()
+        sys.stdout.write(ANSI_CLEAR_SCREEN)
+        sys.stdout.flush()
     
     def header(self):
         """Simple header with safety status"""
@@ -40,15 +58,15 @@ class MinimalDashboard:
             
         auto = "AUTO" if self.auto_approve else "MANUAL"
         
-        print("┌─────────────────────────────────────────────────────────────┐")
-        print(f"│ {safety_symbol} ETH PERPS BOT │ {mode:<12} │ {auto:<7} │ {datetime.now().strftime('%H:%M:%S')} │")
-        print("└─────────────────────────────────────────────────────────────┘")
+        self._emit("┌─────────────────────────────────────────────────────────────┐")
+        self._emit(f"│ {safety_symbol} ETH PERPS BOT │ {mode:<12} │ {auto:<7} │ {datetime.now().strftime('%H:%M:%S')} │")
+        self._emit("└─────────────────────────────────────────────────────────────┘")
         
         # Safety status line
         if forced_dry_run:
-            print("  🔒 SAFETY ACTIVE - YOUR FUNDS ARE PROTECTED")
+            self._emit("  🔒 SAFETY ACTIVE - YOUR FUNDS ARE PROTECTED")
         else:
-            print("  ⚠️ WARNING: LIVE TRADING ENABLED - REAL MONEY AT RISK")
+            self._emit("  ⚠️ WARNING: LIVE TRADING ENABLED - REAL MONEY AT RISK")
         
         # Quick stats
         portfolio = simulator.get_portfolio_summary()
@@ -57,41 +75,41 @@ class MinimalDashboard:
         trades = portfolio['total_trades']
         
         pnl_color = "+" if pnl >= 0 else ""
-        print(f"  Balance: ${balance:,.0f}  │  PnL: {pnl_color}${pnl:,.0f}  │  Trades: {trades}")
-        print()
+        self._emit(f"  Balance: ${balance:,.0f}  │  PnL: {pnl_color}${pnl:,.0f}  │  Trades: {trades}")
+        self._emit()
     
     def main_menu(self):
         """Simple main menu"""
-        print("Commands:")
-        print("  [s] Start/Stop bot")
-        print("  [a] Toggle auto-approve")
-        print("  [t] Show transactions")
-        print("  [h] Help")
-        print("  [x] Safety status")
-        print("  [q] Quit")
-        print()
+        self._emit("Commands:")
+        self._emit("  [s] Start/Stop bot")
+        self._emit("  [a] Toggle auto-approve")
+        self._emit("  [t] Show transactions")
+        self._emit("  [h] Help")
+        self._emit("  [x] Safety status")
+        self._emit("  [q] Quit")
+        self._emit()
     
     def help_menu(self):
         """Expandable help menu"""
         if not self.show_help:
             return
             
-        print("┌─ HELP ─────────────────────────────────────────────┐")
-        print("│                                                    │")
-        print("│  s  - Start/stop the trading bot                  │")
-        print("│  a  - Toggle between auto and manual approval     │")
-        print("│  t  - Show/hide transaction history               │")
-        print("│  h  - Show/hide this help menu                    │")
-        print("│  x  - Show detailed safety status                 │")
-        print("│  q  - Quit the application                        │")
-        print("│                                                    │")
-        print("│  Auto Mode: Bot trades automatically              │")
-        print("│  Manual Mode: You approve each trade              │")
-        print("│                                                    │")
-        print("│  🔒 SAFETY: Multiple layers protect your funds    │")
-        print("│                                                    │")
-        print("└────────────────────────────────────────────────────┘")
-        print()
+        self._emit("┌─ HELP ─────────────────────────────────────────────┐")
+        self._emit("│                                                    │")
+        self._emit("│  s  - Start/stop the trading bot                  │")
+        self._emit("│  a  - Toggle between auto and manual approval     │")
+        self._emit("│  t  - Show/hide transaction history               │")
+        self._emit("│  h  - Show/hide this help menu                    │")
+        self._emit("│  x  - Show detailed safety status                 │")
+        self._emit("│  q  - Quit the application                        │")
+        self._emit("│                                                    │")
+        self._emit("│  Auto Mode: Bot trades automatically              │")
+        self._emit("│  Manual Mode: You approve each trade              │")
+        self._emit("│                                                    │")
+        self._emit("│  🔒 SAFETY: Multiple layers protect your funds    │")
+        self._emit("│                                                    │")
+        self._emit("└────────────────────────────────────────────────────┘")
+        self._emit()
     
     def transactions_menu(self):
         """Expandable transactions menu"""
@@ -100,35 +118,35 @@ class MinimalDashboard:
             
         from core.simulation_engine import simulator
         
-        print("┌─ TRANSACTIONS ─────────────────────────────────────┐")
+        self._emit("┌─ TRANSACTIONS ─────────────────────────────────────┐")
         
         # Open positions
         if simulator.positions:
-            print("│  OPEN POSITIONS:                                   │")
+            self._emit("│  OPEN POSITIONS:                                   │")
             for i, (pos_id, pos) in enumerate(simulator.positions.items(), 1):
                 side_symbol = "↗" if pos.side == "long" else "↘"
                 pnl_symbol = "+" if pos.unrealized_pnl >= 0 else ""
-                print(f"│  {i}. {side_symbol} {pos.symbol} ${pos.entry_price:.0f} → ${pos.current_price:.0f} ({pnl_symbol}${pos.unrealized_pnl:.0f})  │")
+                self._emit(f"│  {i}. {side_symbol} {pos.symbol} ${pos.entry_price:.0f} → ${pos.current_price:.0f} ({pnl_symbol}${pos.unrealized_pnl:.0f})  │")
         else:
-            print("│  No open positions                                │")
+            self._emit("│  No open positions                                │")
         
-        print("│                                                    │")
+        self._emit("│                                                    │")
         
         # Recent trades
         recent_trades = simulator.trade_history[-5:] if simulator.trade_history else []
         if recent_trades:
-            print("│  RECENT TRADES:                                    │")
+            self._emit("│  RECENT TRADES:                                    │")
             for i, trade in enumerate(recent_trades, 1):
                 side_symbol = "↗" if trade.side == "long" else "↘"
                 pnl_symbol = "+" if trade.realized_pnl >= 0 else ""
-                entry_time = datetime.fromisoformat(trade.entry_time.replace('Z', '+00:00')).strftime('%m/%d %H:%M')
-                print(f"│  {i}. {side_symbol} {trade.symbol} {entry_time} ({pnl_symbol}${trade.realized_pnl:.0f})      │")
+                entry_time = trade.entry_display_time
+                self._emit(f"│  {i}. {side_symbol} {trade.symbol} {entry_time} ({pnl_symbol}${trade.realized_pnl:.0f})      │")
         else:
-            print("│  No completed trades yet                          │")
+            self._emit("│  No completed trades yet                          │")
         
-        print("│                                                    │")
-        print("└────────────────────────────────────────────────────┘")
-        print()
+        self._emit("│                                                    │")
+        self._emit("└────────────────────────────────────────────────────┘")
+        self._emit()
     
     def status_line(self):
         """Simple status line"""
@@ -137,8 +155,8 @@ class MinimalDashboard:
         status = "Running..." if self.running else "Stopped"
         open_positions = len(simulator.positions)
         
-        print(f"Status: {status}  │  Open Positions: {open_positions}")
-        print()
+        self._emit(f"Status: {status}  │  Open Positions: {open_positions}")
+        self._emit()
     
     def show_safety_status(self):
         """Display detailed safety status"""
@@ -160,48 +178,76 @@ class MinimalDashboard:
         
         return True
     
+    def flash(self, message: str, duration: float = 1.0):
+        """Show a transient message on the next redraws without blocking"""
+        self._banner = (message, time.monotonic() + duration)
+    
+    def banner_line(self):
+        """Render the transient banner until it expires"""
+        if self._banner is None:
+            return
+        message, expires_at = self._banner
+        if time.monotonic() >= expires_at:
+            self._banner = None
+            return
+        self._emit(message)
+        self._emit()
+    
     def display(self):
         """Display the complete dashboard"""
-        self.clear()
+        self._parts = []
         self.header()
         self.main_menu()
         self.help_menu()
         self.transactions_menu() 
         self.status_line()
+        self.banner_line()
         
+        # Emit the whole screen in one write
+        screen = "\n".join(self._parts) + "\n"
         if not self.running:
-            print("Enter command: ", end="", flush=True)
+            screen += "Enter command: "
+        self._parts = []
+        
+        enable_vt_mode()
+        sys.stdout.write(ANSI_CLEAR_SCREEN + screen)
+        sys.stdout.flush()
+    
+    def _cmd_quit(self):
+        return False
+    
+    def _cmd_toggle_help(self):
+        self.show_help = not self.show_help
+        return True
+    
+    def _cmd_toggle_transactions(self):
+        self.show_transactions = not self.show_transactions
+        return True
+    
+    def _cmd_toggle_auto_approve(self):
+        self.auto_approve = not self.auto_approve
+        mode = "AUTO" if self.auto_approve else "MANUAL"
+        self.flash(f"✓ Switched to {mode} mode")
+        return True
+    
+    def _cmd_toggle_running(self):
+        self.running = not self.running
+        if self.running:
+            print("\n✓ Bot started")
+            return 'start_bot'
+        self.flash("✓ Bot stopped")
+        return True
     
     def handle_command(self, cmd: str) -> bool:
         """Handle user commands - returns False to quit"""
         cmd = cmd.lower().strip()
         
-        if cmd == 'q':
-            return False
-        elif cmd == 'h':
-            self.show_help = not self.show_help
-        elif cmd == 't':
-            self.show_transactions = not self.show_transactions
-        elif cmd == 'x':
-            self.show_safety_status()
-            return True
-        elif cmd == 'a':
-            self.auto_approve = not self.auto_approve
-            mode = "AUTO" if self.auto_approve else "MANUAL"
-            print(f"\n✓ Switched to {mode} mode")
-            time.sleep(1)
-        elif cmd == 's':
-            self.running = not self.running
-            if self.running:
-                print("\n✓ Bot started")
-                return 'start_bot'
-            else:
-                print("\n✓ Bot stopped") 
-                time.sleep(1)
-        else:
-            if cmd:  # Only show error for non-empty commands
-                print(f"\nUnknown command: {cmd}")
-                time.sleep(1)
+        handler = self._commands.get(cmd)
+        if handler:
+            return handler()
+        
+        if cmd:  # Only show error for non-empty commands
+            self.flash(f"Unknown command: {cmd}")
         
         return True
     
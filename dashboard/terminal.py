@@ -0,0 +1,47 @@
+"""
+Terminal helpers shared by the console dashboards
+ANSI screen control and the terminal state a dashboard changes while it runs
+"""
+import os
+import signal
+import threading
+from contextlib import contextmanager
+from typing import Callable
+
+# Erase the whole screen and home the cursor
+ANSI_CLEAR_SCREEN = "\x1b[2J\x1b[H"
+
+_vt_mode_enabled = False
+
+def enable_vt_mode():
+    """Let the Windows console interpret ANSI escape sequences (no-op elsewhere)"""
+    global _vt_mode_enabled
+    if _vt_mode_enabled or os.name != 'nt':
+        return
+    _vt_mode_enabled = True
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            kernel32.SetConsoleMode(handle, mode.value | 0x0004)  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    except (AttributeError, OSError):
+        pass
+
+@contextmanager
+def on_resize(callback: Callable[[], None]):
+    """
+    Call callback whenever the terminal is resized while the block runs, then put
+    the previous SIGWINCH handler back; a no-op where SIGWINCH does not exist or
+    off the main thread (signal handlers can only be installed there)
+    """
+    if not hasattr(signal, "SIGWINCH") or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+    
+    previous = signal.signal(signal.SIGWINCH, lambda signum, frame: callback())
+    try:
+        yield
+    finally:
+        signal.signal(signal.SIGWINCH, previous if previous is not None else signal.SIG_DFL)
@@ -2,12 +2,58 @@
 Interactive Trading Dashboard
 Features dry run mode toggle and real-time simulation tracking
 """
+import os
+import sys
 import time
 import json
+import random
+import select
 from datetime import datetime
-from typing import Dict, Any
+from functools import lru_cache
+from itertools import zip_longest
+from typing import Dict, Any, List, Optional, Tuple
 import threading
 
+from config import trade_config as cfg
+from core.simulation_engine import simulator
+from dashboard.terminal import ANSI_CLEAR_SCREEN, enable_vt_mode, on_resize
+
+# Open-position count at which PnL% is computed column-wise with NumPy
+VECTORIZE_MIN_POSITIONS = 100
+
+# Dedicated generator for the demo/test-trade simulation
+_RNG = random.Random()
+
+# Row templates for the position/trade tables, parsed once and reused per row
+_POS_HEADER = f"{'Symbol':<8} {'Side':<6} {'Entry':<10} {'Current':<10} {'Size':<10} {'PnL':<12} {'%':<8}"
+_POS_ROW = "{symbol:<8} {side:<6} ${entry:<9.2f} ${current:<9.2f} {size:<9.4f} {pnl:<11} {pct:<8}"
+_TRADE_HEADER = f"{'Symbol':<8} {'Side':<6} {'Entry':<10} {'Exit':<10} {'PnL':<12} {'Time':<12}"
+_TRADE_ROW = "{symbol:<8} {side:<6} ${entry:<9.2f} ${exit:<9.2f} {pnl:<11} {time:<12}"
+
+@lru_cache(maxsize=8)
+def _header_lines(mode: str, auto_mode: bool) -> Tuple[str, ...]:
+    """Static part of the TradingDashboard header for a mode combination"""
+    mode_indicator = "🧪 DRY RUN" if "DRY RUN" in mode else "🔴 LIVE"
+    auto_indicator = "🤖 AUTO" if auto_mode else "👤 MANUAL"
+    return (
+        "=" * 80,
+        f"🚀 JUPITER ETH PERPS TRADING BOT {mode_indicator} {auto_indicator}",
+        "=" * 80,
+    )
+
+@lru_cache(maxsize=2)
+def _controls_lines(dry_run_mode: bool) -> Tuple[str, ...]:
+    """TradingDashboard control instructions for the current trading mode"""
+    return (
+        "🎮 CONTROLS",
+        "-" * 40,
+        "Press 'L' + ENTER: Switch to LIVE trading" if dry_run_mode else "Press 'D' + ENTER: Switch to DRY RUN mode",
+        "Press 'Q' + ENTER: Quit dashboard",
+        "Press 'R' + ENTER: Reset simulation data",
+        "Press 'T' + ENTER: Force test trade",
+        "",
+    )
+
 # Simple console-based dashboard since we have limited dependencies
 class TradingDashboard:
     """
@@ -19,29 +65,73 @@ class TradingDashboard:
         self.dry_run_mode = True
         self.refresh_rate = 5  # seconds
         self.last_update = None
+        self._frame: List[str] = []
+        self._prev_frame: List[str] = []
+        self.status_ttl = 2.0  # seconds a status snapshot is reused
+        self._status_cache: Optional[Dict[str, Any]] = None
+        self._status_time = 0.0
+        self._typed: List[str] = []  # partial line read via msvcrt on Windows
+        self._banner = None  # (message, monotonic expiry)
+        self._commands = {
+            'q': self.stop,
+            'l': self.toggle_dry_run_mode,
+            'd': self.toggle_dry_run_mode,
+            'r': self.reset_simulation,
+            't': self.force_test_trade,
+        }
         
     def clear_screen(self):
         """Clear the console screen"""
-        import os
-        os.system('cls' if os.name == 'nt' else 'clear')
+        enable_vt_mode()
+        sys.stdout.write(ANSI_CLEAR_SCREEN)
+        sys.stdout.flush()
+        self.invalidate()
+    
+    def _emit(self, line: str = ""):
+        """Queue a line for the frame being rendered"""
+        self._frame.append(line)
+    
+    def invalidate(self):
+        """Force the next frame to be redrawn from a blank screen"""
+        self._prev_frame = []
+    
+    def flush_frame(self):
+        """Write only the rows that changed since the previous frame"""
+        if not self._prev_frame:
+            enable_vt_mode()
+        out = [] if self._prev_frame else [ANSI_CLEAR_SCREEN]
+        for row, (old, new) in enumerate(zip_longest(self._prev_frame, self._frame), 1):
+            if old != new:
+                out.append(f"\x1b[{row};1H\x1b[2K{new or ''}")
+        # Park the cursor below the frame and wipe anything printed there since
+        out.append(f"\x1b[{len(self._frame) + 1};1H\x1b[J")
+        
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+        self._prev_frame = self._frame
+        self._frame = []
     
     def format_currency(self, amount: float) -> str:
         """Format currency with color coding"""
-        if amount >= 0:
-            return f"${amount:,.2f}"
-        else:
-            return f"-${abs(amount):,.2f}"
+        return f"${amount:,.2f}" if amount >= 0 else f"-${-amount:,.2f}"
     
     def format_percentage(self, percentage: float) -> str:
         """Format percentage with color coding"""
-        sign = "+" if percentage >= 0 else ""
-        return f"{sign}{percentage:.2f}%"
+        return f"{percentage:+.2f}%"
     
     def get_bot_status(self) -> Dict[str, Any]:
-        """Get current bot status and metrics"""
-        from core.simulation_engine import simulator
-        from config import trade_config as cfg
+        """Get current bot status, reusing a recent snapshot within status_ttl"""
+        now = time.monotonic()
+        if self._status_cache is not None and now - self._status_time < self.status_ttl:
+            return self._status_cache
         
+        status = self._collect_bot_status()
+        self._status_cache = status
+        self._status_time = now
+        return status
+    
+    def _collect_bot_status(self) -> Dict[str, Any]:
+        """Get current bot status and metrics"""
         # Get portfolio summary
         portfolio = simulator.get_portfolio_summary()
         
@@ -59,131 +149,140 @@ class TradingDashboard:
     
     def render_header(self, status: Dict[str, Any]):
         """Render dashboard header"""
-        mode_indicator = "🧪 DRY RUN" if "DRY RUN" in status["mode"] else "🔴 LIVE"
-        auto_indicator = "🤖 AUTO" if status["auto_mode"] else "👤 MANUAL"
-        
-        print("=" * 80)
-        print(f"🚀 JUPITER ETH PERPS TRADING BOT {mode_indicator} {auto_indicator}")
-        print("=" * 80)
-        print(f"ETH Price: ${status['eth_price']:,.2f} | Last Update: {datetime.now().strftime('%H:%M:%S')}")
-        print()
+        self._frame.extend(_header_lines(status["mode"], bool(status["auto_mode"])))
+        self._emit(f"ETH Price: ${status['eth_price']:,.2f} | Last Update: {datetime.now().strftime('%H:%M:%S')}")
+        self._emit()
     
     def render_portfolio_summary(self, portfolio: Dict[str, Any]):
         """Render portfolio summary section"""
-        print("📊 PORTFOLIO SUMMARY")
-        print("-" * 40)
-        print(f"Balance:        {self.format_currency(portfolio['balance'])}")
-        print(f"Unrealized PnL: {self.format_currency(portfolio['unrealized_pnl'])}")
-        print(f"Total PnL:      {self.format_currency(portfolio['total_pnl'])}")
-        print(f"Total Value:    {self.format_currency(portfolio['total_value'])}")
-        print(f"ROI:            {self.format_percentage(portfolio['roi'])}")
-        print()
+        self._emit("📊 PORTFOLIO SUMMARY")
+        self._emit("-" * 40)
+        self._emit(f"Balance:        {self.format_currency(portfolio['balance'])}")
+        self._emit(f"Unrealized PnL: {self.format_currency(portfolio['unrealized_pnl'])}")
+        self._emit(f"Total PnL:      {self.format_currency(portfolio['total_pnl'])}")
+        self._emit(f"Total Value:    {self.format_currency(portfolio['total_value'])}")
+        self._emit(f"ROI:            {self.format_percentage(portfolio['roi'])}")
+        self._emit()
         
-        print("📈 TRADING STATS")
-        print("-" * 40)
-        print(f"Total Trades:   {portfolio['total_trades']}")
-        print(f"Win Rate:       {self.format_percentage(portfolio['win_rate'])}")
-        print(f"Open Positions: {portfolio['open_positions']}")
-        print(f"Largest Win:    {self.format_currency(portfolio['largest_win'])}")
-        print(f"Largest Loss:   {self.format_currency(portfolio['largest_loss'])}")
-        print(f"Total Fees:     {self.format_currency(portfolio['total_fees'])}")
-        print()
+        self._emit("📈 TRADING STATS")
+        self._emit("-" * 40)
+        self._emit(f"Total Trades:   {portfolio['total_trades']}")
+        self._emit(f"Win Rate:       {self.format_percentage(portfolio['win_rate'])}")
+        self._emit(f"Open Positions: {portfolio['open_positions']}")
+        self._emit(f"Largest Win:    {self.format_currency(portfolio['largest_win'])}")
+        self._emit(f"Largest Loss:   {self.format_currency(portfolio['largest_loss'])}")
+        self._emit(f"Total Fees:     {self.format_currency(portfolio['total_fees'])}")
+        self._emit()
+    
+    def _position_pnl_pcts(self, positions: list) -> List[float]:
+        """PnL% of each position, vectorized with NumPy for large position books"""
+        if len(positions) < VECTORIZE_MIN_POSITIONS:
+            return [(pos.unrealized_pnl / (pos.size * pos.entry_price)) * 100 if pos.size * pos.entry_price > 0 else 0
+                    for pos in positions]
+        
+        import numpy as np
+        
+        count = len(positions)
+        size = np.fromiter((pos.size for pos in positions), float, count)
+        entry_price = np.fromiter((pos.entry_price for pos in positions), float, count)
+        unrealized_pnl = np.fromiter((pos.unrealized_pnl for pos in positions), float, count)
+        
+        notional = size * entry_price
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pnl_pct = np.where(notional > 0, unrealized_pnl / notional * 100.0, 0.0)
+        return pnl_pct.tolist()
     
     def render_open_positions(self, positions: list):
         """Render open positions"""
         if not positions:
-            print("📋 OPEN POSITIONS: None")
-            print()
+            self._emit("📋 OPEN POSITIONS: None")
+            self._emit()
             return
         
-        print("📋 OPEN POSITIONS")
-        print("-" * 80)
-        print(f"{'Symbol':<8} {'Side':<6} {'Entry':<10} {'Current':<10} {'Size':<10} {'PnL':<12} {'%':<8}")
-        print("-" * 80)
+        self._emit("📋 OPEN POSITIONS")
+        self._emit("-" * 80)
+        self._emit(_POS_HEADER)
+        self._emit("-" * 80)
         
-        for pos in positions:
-            pnl_pct = (pos.unrealized_pnl / (pos.size * pos.entry_price)) * 100 if pos.size * pos.entry_price > 0 else 0
-            print(f"{pos.symbol:<8} {pos.side.upper():<6} ${pos.entry_price:<9.2f} ${pos.current_price:<9.2f} "
-                  f"{pos.size:<9.4f} {self.format_currency(pos.unrealized_pnl):<11} {self.format_percentage(pnl_pct):<8}")
-        print()
+        for pos, pnl_pct in zip(positions, self._position_pnl_pcts(positions)):
+            self._emit(_POS_ROW.format(symbol=pos.symbol, side=pos.side.upper(),
+                                       entry=pos.entry_price, current=pos.current_price,
+                                       size=pos.size, pnl=self.format_currency(pos.unrealized_pnl),
+                                       pct=self.format_percentage(pnl_pct)))
+        self._emit()
     
     def render_recent_trades(self, trades: list):
         """Render recent completed trades"""
         if not trades:
-            print("📝 RECENT TRADES: None")
-            print()
+            self._emit("📝 RECENT TRADES: None")
+            self._emit()
             return
         
-        print("📝 RECENT TRADES")
-        print("-" * 80)
-        print(f"{'Symbol':<8} {'Side':<6} {'Entry':<10} {'Exit':<10} {'PnL':<12} {'Time':<12}")
-        print("-" * 80)
+        self._emit("📝 RECENT TRADES")
+        self._emit("-" * 80)
+        self._emit(_TRADE_HEADER)
+        self._emit("-" * 80)
         
         for trade in trades:
-            if trade.exit_time:
-                exit_time = datetime.fromisoformat(trade.exit_time.replace('Z', '+00:00')).strftime('%H:%M:%S')
-            else:
-                exit_time = "N/A"
+            exit_time = trade.exit_display_time if trade.exit_time else "N/A"
             
-            print(f"{trade.symbol:<8} {trade.side.upper():<6} ${trade.entry_price:<9.2f} ${trade.exit_price or 0:<9.2f} "
-                  f"{self.format_currency(trade.realized_pnl):<11} {exit_time:<12}")
-        print()
+            self._emit(_TRADE_ROW.format(symbol=trade.symbol, side=trade.side.upper(),
+                                         entry=trade.entry_price, exit=trade.exit_price or 0,
+                                         pnl=self.format_currency(trade.realized_pnl), time=exit_time))
+        self._emit()
     
     def render_controls(self):
         """Render control instructions"""
-        print("🎮 CONTROLS")
-        print("-" * 40)
-        if self.dry_run_mode:
-            print("Press 'L' + ENTER: Switch to LIVE trading")
-        else:
-            print("Press 'D' + ENTER: Switch to DRY RUN mode")
-        print("Press 'Q' + ENTER: Quit dashboard")
-        print("Press 'R' + ENTER: Reset simulation data")
-        print("Press 'T' + ENTER: Force test trade")
-        print()
+        self._frame.extend(_controls_lines(self.dry_run_mode))
+    
+    def flash(self, message: str, duration: Optional[float] = None):
+        """
+        Show command feedback inside the frame for duration seconds (one refresh
+        by default); anything printed below the frame is wiped by the next redraw
+        """
+        self._banner = (message, time.monotonic() + (self.refresh_rate if duration is None else duration))
+    
+    def banner_line(self):
+        """Render the command feedback until it expires"""
+        if self._banner is None:
+            return
+        message, expires_at = self._banner
+        if time.monotonic() >= expires_at:
+            self._banner = None
+            return
+        self._emit(message)
+        self._emit()
     
     def toggle_dry_run_mode(self):
         """Toggle between dry run and live trading"""
-        from config import trade_config as cfg
-        
         if cfg.DRY_RUN:
-            print("\n⚠️  SWITCHING TO LIVE TRADING MODE!")
-            print("Are you sure? This will use real money! (y/N): ", end="")
-            
-            # In a real implementation, you'd get user input here
+            # In a real implementation, you'd confirm with the user here
             # For now, we'll keep it in dry run for safety
-            print("N (Safety override - staying in dry run)")
+            self.flash("⚠️  Live trading requested - safety override, staying in DRY RUN")
             return False
         else:
             cfg.DRY_RUN = True
-            print("\n✅ Switched to DRY RUN mode")
+            self.flash("✅ Switched to DRY RUN mode")
             return True
     
     def reset_simulation(self):
         """Reset simulation data"""
-        from core.simulation_engine import simulator
-        
-        print("\n⚠️  Reset simulation data? This will clear all trades and reset balance. (y/N): ", end="")
         # For demo purposes, we'll just show the message
-        print("N (Demo mode - not resetting)")
+        self.flash("⚠️  Reset skipped (demo mode) - trades and balance kept")
         return False
     
     def force_test_trade(self):
         """Force a test trade for demonstration"""
-        from core.simulation_engine import simulator
-        import random
-        
         # Create a random test trade
-        side = random.choice(["long", "short"])
-        trade_size = random.uniform(100, 500)
+        side = _RNG.choice(["long", "short"])
+        trade_size = _RNG.uniform(100, 500)
         
-        print(f"\n🧪 Creating test {side} trade: ${trade_size:.2f}")
         position_id = simulator.open_position("ETH", side, trade_size, leverage=2.0)
         
         if position_id:
-            print(f"✅ Test position created: {position_id}")
+            self.flash(f"🧪 Test {side} trade ${trade_size:.2f}: ✅ position created: {position_id}")
         else:
-            print("❌ Failed to create test position")
+            self.flash(f"🧪 Test {side} trade ${trade_size:.2f}: ❌ failed to create position")
     
     def display_dashboard(self):
         """Display the main dashboard"""
@@ -191,21 +290,67 @@ class TradingDashboard:
             # Get current status
             status = self.get_bot_status()
             
-            # Clear screen and render dashboard
-            self.clear_screen()
-            
-            # Render all sections
+            # Render all sections into the frame buffer
+            self._frame = []
             self.render_header(status)
             self.render_portfolio_summary(status["portfolio"])
             self.render_open_positions(status["positions"])
             self.render_recent_trades(status["recent_trades"])
             self.render_controls()
+            self.banner_line()
+            
+            self._emit(f"🔄 Auto-refresh every {self.refresh_rate}s | Last update: {datetime.now().strftime('%H:%M:%S')}")
             
-            print(f"🔄 Auto-refresh every {self.refresh_rate}s | Last update: {datetime.now().strftime('%H:%M:%S')}")
+            self.flush_frame()
             
         except Exception as e:
+            self._frame = []
+            self.invalidate()
             print(f"❌ Dashboard error: {e}")
     
+    def stop(self):
+        """Stop the dashboard loop"""
+        self.is_running = False
+    
+    def handle_command(self, cmd: str):
+        """Run the control bound to cmd, ignoring unknown input"""
+        handler = self._commands.get(cmd.lower().strip())
+        if handler:
+            handler()
+            # Commands change state, so the next frame must not reuse the snapshot
+            self._status_cache = None
+    
+    def wait_for_command(self, timeout: float) -> Optional[str]:
+        """Wait up to timeout seconds for a line of input, None if none arrives"""
+        deadline = time.monotonic() + timeout
+        
+        if os.name == 'nt':
+            import msvcrt
+            while True:
+                while msvcrt.kbhit():
+                    ch = msvcrt.getwche()
+                    if ch in '\r\n':
+                        line = ''.join(self._typed)
+                        self._typed = []
+                        return line
+                    self._typed.append(ch)
+                if time.monotonic() >= deadline:
+                    return None
+                time.sleep(0.05)
+        
+        remaining = timeout
+        while remaining > 0:
+            ready, _, _ = select.select([sys.stdin], [], [], remaining)
+            if ready:
+                line = sys.stdin.readline()
+                if line:
+                    return line
+                # EOF: stdin will stay readable, so fall back to sleeping
+                time.sleep(max(0.0, deadline - time.monotonic()))
+                return None
+            remaining = deadline - time.monotonic()
+        return None
+    
     def run_interactive(self):
         """Run interactive dashboard mode"""
         print("🚀 Starting Interactive Trading Dashboard...")
@@ -213,29 +358,34 @@ class TradingDashboard:
         time.sleep(2)
         
         self.is_running = True
+        self.invalidate()
         
-        try:
-            while self.is_running:
-                # Display dashboard
-                self.display_dashboard()
-                
-                # Wait for refresh or user input
-                print("\nEnter command (or wait for auto-refresh): ", end="", flush=True)
-                
-                # Simulate user input check (in real implementation, you'd use proper input handling)
-                time.sleep(self.refresh_rate)
-                
-                # Simulate some commands for demo
-                import random
-                if random.random() < 0.1:  # 10% chance to simulate a test trade
-                    self.force_test_trade()
-                
-        except KeyboardInterrupt:
-            print("\n\n👋 Dashboard stopped by user")
-        except Exception as e:
-            print(f"\n❌ Dashboard error: {e}")
-        finally:
-            self.is_running = False
+        # Repaint from scratch when the terminal is resized
+        with on_resize(self.invalidate):
+            try:
+                while self.is_running:
+                    # Display dashboard
+                    self.display_dashboard()
+                    
+                    # Wait for refresh or user input
+                    print("\nEnter command (or wait for auto-refresh): ", end="", flush=True)
+                    
+                    # Redraw as soon as a command arrives, otherwise on the refresh interval
+                    cmd = self.wait_for_command(self.refresh_rate)
+                    if cmd is not None:
+                        self.handle_command(cmd)
+                        continue
+                    
+                    # Simulate some commands for demo
+                    if _RNG.random() < 0.1:  # 10% chance to simulate a test trade
+                        self.force_test_trade()
+                    
+            except KeyboardInterrupt:
+                print("\n\n👋 Dashboard stopped by user")
+            except Exception as e:
+                print(f"\n❌ Dashboard error: {e}")
+            finally:
+                self.is_running = False
     
     def run_background(self):
         """Run dashboard in background mode (for bot integration)"""
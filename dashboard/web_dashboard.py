@@ -1,20 +1,21 @@
 # dashboard/web_dashboard.py
 
 from flask import Flask, render_template
-import os
 from config import trade_config as cfg
+from app_dashboard import read_log_tail
 
 app = Flask(__name__)
 LOG_PATH = cfg.LOG_FILE
 
 @app.route("/")
 def index():
-    # Read log file
-    logs = []
-    if os.path.exists(LOG_PATH):
-        with open(LOG_PATH, "r") as f:
-            logs = f.readlines()
-    return render_template("index.html", logs=logs, dry_run=cfg.DRY_RUN_MODE)
+    return render_template("index.html", logs=read_log_tail(LOG_PATH), dry_run=cfg.DRY_RUN_MODE)
+
+@app.after_request
+def add_cache_headers(response):
+    # Let browsers reuse the page briefly instead of re-polling the log
+    response.cache_control.max_age = 2
+    return response
 
 if __name__ == "__main__":
-    app.run(debug=True, port=5000)
\ No newline at end of file
+    app.run(debug=False, port=5000, threaded=True, use_reloader=False)
\ No newline at end of file
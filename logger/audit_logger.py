@@ -1,21 +1,66 @@
 # logger/audit_logger.py
 
 import os
+import time
+import atexit
+import threading
 from config import trade_config as cfg
-from datetime import datetime
 
 LOG_PATH = cfg.LOG_FILE
+AUDIT_ENABLED = cfg.AUDIT_ENABLED
 
-def _write_log(entry_type, details):
-    timestamp = datetime.utcnow().isoformat()
-    log_entry = f"[{entry_type}] {timestamp} | {details}\n"
+# Only create directory if LOG_PATH has a directory component
+_log_dir = os.path.dirname(LOG_PATH)
+if _log_dir:
+    os.makedirs(_log_dir, exist_ok=True)
 
-    # Only create directory if LOG_PATH has a directory component
-    log_dir = os.path.dirname(LOG_PATH)
-    if log_dir:
-        os.makedirs(log_dir, exist_ok=True)
-    with open(LOG_PATH, "a") as f:
-        f.write(log_entry)
+# Persistent unbuffered binary handle, opened on first write
+_log_handle = None
+_log_lock = threading.Lock()
+
+def _close_log():
+    global _log_handle
+    with _log_lock:
+        if _log_handle is not None:
+            _log_handle.close()
+            _log_handle = None
+
+atexit.register(_close_log)
+
+# Cached b"YYYY-MM-DDTHH:MM:SS" prefix for the current UTC second
+_ts_second = (-1, b"")
+
+def _utc_timestamp():
+    """UTC ISO-8601 timestamp with microseconds, formatting the date part once per second"""
+    global _ts_second
+    sec, frac = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _ts_second
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec)).encode("ascii")
+        _ts_second = (sec, prefix)
+    return b"%s.%06d" % (prefix, frac // 1000)
+
+# Per entry type b"[TYPE] %s | %s\n" templates, built on first use
+_entry_templates = {}
+
+def _write_log(entry_type, details, *args):
+    global _log_handle
+    if not AUDIT_ENABLED:
+        return
+    if args:
+        details = details % args
+    template = _entry_templates.get(entry_type)
+    if template is None:
+        template = f"[{entry_type.replace('%', '%%')}] %s | %s\n".encode("utf-8")
+        _entry_templates[entry_type] = template
+    if not isinstance(details, str):
+        details = str(details)
+    log_entry = template % (_utc_timestamp(), details.encode("utf-8"))
+
+    with _log_lock:
+        if _log_handle is None:
+            _log_handle = open(LOG_PATH, "ab", buffering=0)
+        _log_handle.write(log_entry)
 
 def log_signal(signal):
     _write_log("SIGNAL", signal)
@@ -27,7 +72,7 @@ def log_execution(details):
     _write_log("EXECUTION", details)
 
 def log_pnl_alert(pnl):
-    _write_log("PNL_ALERT", {"pnl": pnl})
+    _write_log("PNL_ALERT", f"pnl={pnl:.6f}")
 
 def log_auto_close(pnl):
-    _write_log("AUTO_CLOSE", {"pnl": pnl})
+    _write_log("AUTO_CLOSE", f"pnl={pnl:.6f}")
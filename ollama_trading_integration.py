@@ -14,7 +14,7 @@ try:
     from core.price_fetcher import price_fetcher
     from ai_signal_detector import AISignalDetector
     from core.simulation_engine import simulator
-    from core.drift_client import DriftClient
+    from core.drift_client import get_drift_client
     from app_config import trade_config as cfg
     from app_logger import _write_log
     HAS_EXISTING_BOT = True
@@ -56,7 +56,7 @@ class IntegratedTradingAssistant:
         if HAS_EXISTING_BOT:
             try:
                 self.signal_detector = AISignalDetector()
-                self.drift_client = DriftClient()
+                self.drift_client = get_drift_client()
                 print("✅ Connected to existing trading bot infrastructure")
             except Exception as e:
                 print(f"⚠️ Could not initialize all components: {e}")
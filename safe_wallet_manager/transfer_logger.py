@@ -1,5 +1,23 @@
+import atexit
+import threading
 from safe_wallet_manager.config import LOG_PATH
 
+# Persistent line-buffered handle, opened on first transfer
+_log_handle = None
+_log_lock = threading.Lock()
+
+def _close_log():
+    global _log_handle
+    with _log_lock:
+        if _log_handle is not None:
+            _log_handle.close()
+            _log_handle = None
+
+atexit.register(_close_log)
+
 def log_transfer(wallet, recipient, amount, tx_id):
-    with open(f"{LOG_PATH}transfer_log.txt", "a") as f:
-        f.write(f"{wallet} → {recipient} | {amount:.6f} SOL | tx: {tx_id}\n")
+    global _log_handle
+    with _log_lock:
+        if _log_handle is None:
+            _log_handle = open(f"{LOG_PATH}transfer_log.txt", "a", buffering=1, encoding="utf-8")
+        _log_handle.write(f"{wallet} → {recipient} | {amount:.6f} SOL | tx: {tx_id}\n")
@@ -34,7 +34,7 @@ try:
     from core.price_fetcher import price_fetcher
     from ai_signal_detector import AISignalDetector
     from core.simulation_engine import simulator
-    from core.drift_client import DriftClient
+    from core.drift_client import get_drift_client
     from app_config import trade_config as cfg
     from app_logger import _write_log
     HAS_EXISTING_BOT = True
@@ -115,7 +115,7 @@ class SeamlessTradingAssistant:
         if not self.standalone_mode and self.config.get('use_bot_data', False) and HAS_EXISTING_BOT:
             try:
                 self.signal_detector = AISignalDetector()
-                self.drift_client = DriftClient()
+                self.drift_client = get_drift_client()
                 self.use_bot_data = True
                 print("✅ Connected to bot infrastructure (integrated mode)")
             except Exception as e:
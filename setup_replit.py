@@ -114,27 +114,30 @@ def test_bot():
 
 def show_next_steps():
     """Show next steps for the user"""
-    print("\n🎉 Setup Complete!")
-    print("=" * 50)
-    print("\n📱 Next Steps:")
-    print("1. Click the 'Run' button to start the bot")
-    print("2. The bot will run in offline mode by default")
-    print("3. Monitor the console for trading activity")
-    print("4. Press Ctrl+C to stop the bot")
-    
-    print("\n🔧 Available Modes:")
-    print("- Offline Mode (default): python main_offline.py")
-    print("- Mobile Mode: python main_mobile.py") 
-    print("- Full Mode: python main.py")
-    
-    print("\n📊 Features:")
-    print("- Realistic ETH price simulation")
-    print("- Technical analysis signals")
-    print("- Risk management (stop-loss/take-profit)")
-    print("- Portfolio tracking")
-    print("- Dry run mode (no real money)")
-    
-    print("\n🚀 Ready to trade!")
+    lines = [
+        "\n🎉 Setup Complete!",
+        "=" * 50,
+        "\n📱 Next Steps:",
+        "1. Click the 'Run' button to start the bot",
+        "2. The bot will run in offline mode by default",
+        "3. Monitor the console for trading activity",
+        "4. Press Ctrl+C to stop the bot",
+        
+        "\n🔧 Available Modes:",
+        "- Offline Mode (default): python main_offline.py",
+        "- Mobile Mode: python main_mobile.py",
+        "- Full Mode: python main.py",
+        
+        "\n📊 Features:",
+        "- Realistic ETH price simulation",
+        "- Technical analysis signals",
+        "- Risk management (stop-loss/take-profit)",
+        "- Portfolio tracking",
+        "- Dry run mode (no real money)",
+        
+        "\n🚀 Ready to trade!",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     """Main setup function"""
@@ -7,7 +7,7 @@ import logging
 import pandas as pd
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional, List, Tuple
-from core.drift_client import DriftClient, ETHPerpStrategy
+from core.drift_client import get_drift_client, get_strategy
 from core.indicators import calculate_rsi, calculate_ema, calculate_bollinger_bands
 from logger import log_signal
 
@@ -17,8 +17,8 @@ class MultiSourceETHPerpAnalyzer:
     """
     
     def __init__(self):
-        self.drift_client = DriftClient()
-        self.drift_strategy = ETHPerpStrategy(self.drift_client)
+        self.drift_client = get_drift_client()
+        self.drift_strategy = get_strategy()
         
         # Alternative data sources
         self.coingecko_base = "https://api.coingecko.com/api/v3"
@@ -113,8 +113,8 @@ class MultiSourceETHPerpAnalyzer:
         if not drift_conditions:
             return {'signal': None, 'reason': 'No Drift data available'}
         
-        drift_funding = drift_conditions.get('funding_rate_annual', 0)
-        drift_price = drift_conditions.get('market_data', {})
+        drift_funding = drift_conditions.funding_rate_annual
+        drift_price = drift_conditions.market_data
         
         if not drift_price:
             return {'signal': None, 'reason': 'No Drift price data'}
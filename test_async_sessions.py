@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# test_async_sessions.py - Async HTTP clients keep working across event loops
+
+import asyncio
+import os
+import tempfile
+import time
+import types
+
+class FakeResponse:
+    """Just enough of aiohttp.ClientResponse for the price and quote paths"""
+
+    def __init__(self, body: bytes, status: int = 200, headers: dict = None):
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise RuntimeError(f"HTTP {self.status}")
+
+    async def json(self, content_type=None):
+        import json
+        return json.loads(self._body)
+
+    async def read(self):
+        return self._body
+
+class FakeClientSession:
+    """Session bound to the loop it was created on, like aiohttp's"""
+
+    created = []
+    body = b'{"price": "3500.0"}'
+    responses = []  # (status, headers) served before falling back to 200 + body
+    requests_sent = 0
+
+    def __init__(self, *args, **kwargs):
+        self.loop = asyncio.get_running_loop()
+        self.closed = False
+        FakeClientSession.created.append(self)
+
+    def _request(self, url, **kwargs):
+        if self.closed:
+            raise RuntimeError("Session is closed")
+        if asyncio.get_running_loop() is not self.loop:
+            raise RuntimeError("Timeout context manager should be used inside a task")
+        FakeClientSession.requests_sent += 1
+        if FakeClientSession.responses:
+            status, headers = FakeClientSession.responses.pop(0)
+            return FakeResponse(b"", status, headers)
+        return FakeResponse(self.body)
+
+    get = post = _request
+
+    def detach(self):
+        self.closed = True
+
+    async def close(self):
+        self.closed = True
+
+def fake_aiohttp():
+    """Stand-in aiohttp module exposing what the clients construct"""
+    return types.SimpleNamespace(
+        ClientSession=FakeClientSession,
+        ClientTimeout=lambda **kwargs: kwargs,
+        TCPConnector=lambda **kwargs: kwargs,
+    )
+
+def test_price_fetcher_survives_new_event_loop():
+    """A second asyncio.run must fetch live prices, not fall back to the last known one"""
+    print("🧪 Testing PriceFetcher async session across event loops...")
+    try:
+        from core import price_fetcher as pf
+    except ImportError as e:
+        print(f"⚠️ Skipping: {e}")
+        return
+
+    saved = getattr(pf, "aiohttp", None), pf.AIOHTTP_AVAILABLE
+    pf.aiohttp, pf.AIOHTTP_AVAILABLE = fake_aiohttp(), True
+    FakeClientSession.created.clear()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            fetcher = pf.PriceFetcher(max_retries_per_source=0, cache_ttl_seconds=0,
+                                      last_price_path=os.path.join(tmp, "last_price.json"))
+
+            for run in range(2):
+                fetcher._last_live_mono = None
+                price = asyncio.run(fetcher.aget_eth_price())
+                print(f"📊 Run {run + 1}: ${price:,.2f}")
+                assert price == 3500.0
+                assert fetcher._last_live_mono is not None, "price did not come from a live fetch"
+    finally:
+        pf.aiohttp, pf.AIOHTTP_AVAILABLE = saved
+
+    assert len(FakeClientSession.created) == 2
+    assert FakeClientSession.created[0].closed
+    print("✅ PriceFetcher rebuilt its session for the new loop")
+
+def test_jupiter_api_survives_new_event_loop():
+    """Async quotes from a second event loop must not quietly return None"""
+    print("🧪 Testing JupiterAPI async session across event loops...")
+    try:
+        from core import jupiter_api as ja
+    except ImportError as e:
+        print(f"⚠️ Skipping: {e}")
+        return
+
+    saved = getattr(ja, "aiohttp", None), ja.AIOHTTP_AVAILABLE
+    ja.aiohttp, ja.AIOHTTP_AVAILABLE = fake_aiohttp(), True
+    FakeClientSession.created.clear()
+    try:
+        api = ja.JupiterAPI()
+        request = ja.QuoteRequest(input_mint="A", output_mint="B", amount=1)
+        for run in range(2):
+            quote = asyncio.run(api.get_quote_async(request))
+            print(f"📊 Run {run + 1}: {quote}")
+            assert quote == {"price": "3500.0"}
+    finally:
+        ja.aiohttp, ja.AIOHTTP_AVAILABLE = saved
+
+    assert len(FakeClientSession.created) == 2
+    print("✅ JupiterAPI rebuilt its session for the new loop")
+
+def test_drift_client_survives_new_event_loop():
+    """DLOB requests from a second event loop must get a fresh session"""
+    print("🧪 Testing DriftClient async session across event loops...")
+    try:
+        from core import drift_client as dc
+    except ImportError as e:
+        print(f"⚠️ Skipping: {e}")
+        return
+
+    saved = getattr(dc, "aiohttp", None), dc.AIOHTTP_AVAILABLE
+    dc.aiohttp, dc.AIOHTTP_AVAILABLE = fake_aiohttp(), True
+    FakeClientSession.created.clear()
+    try:
+        client = dc.DriftClient()
+        for run in range(2):
+            book = asyncio.run(client.aget_orderbook())
+            print(f"📊 Run {run + 1}: {book}")
+            assert book == {"price": "3500.0"}
+        client.close()
+    finally:
+        dc.aiohttp, dc.AIOHTTP_AVAILABLE = saved
+
+    assert len(FakeClientSession.created) == 2
+    print("✅ DriftClient rebuilt its session for the new loop")
+
+def test_async_quote_gives_up_on_long_retry_after():
+    """A 429 with a long Retry-After must back off the host and fail fast, not sleep for minutes"""
+    print("🧪 Testing async quote against Retry-After: 600...")
+    try:
+        from core import jupiter_api as ja
+        from core import rate_limit
+    except ImportError as e:
+        print(f"⚠️ Skipping: {e}")
+        return
+
+    saved = getattr(ja, "aiohttp", None), ja.AIOHTTP_AVAILABLE
+    ja.aiohttp, ja.AIOHTTP_AVAILABLE = fake_aiohttp(), True
+    FakeClientSession.responses[:] = [(429, {"Retry-After": "600"})]
+    FakeClientSession.requests_sent = 0
+    try:
+        api = ja.JupiterAPI()
+        request = ja.QuoteRequest(input_mint="A", output_mint="B", amount=1)
+
+        async def two_quotes():
+            return await api.get_quote_async(request), await api.get_quote_async(request)
+
+        start = time.monotonic()
+        first, second = asyncio.run(two_quotes())
+        elapsed = time.monotonic() - start
+        print(f"📊 Quotes: {first}, {second} in {elapsed:.2f}s")
+
+        assert first is None and second is None
+        assert elapsed < rate_limit.MAX_TOTAL_WAIT
+        assert FakeClientSession.requests_sent == 1, "second call should not reach the throttled host"
+        assert rate_limit.get_bucket(api.quote_url).blocked_until - time.monotonic() > 500
+    finally:
+        ja.aiohttp, ja.AIOHTTP_AVAILABLE = saved
+        FakeClientSession.responses.clear()
+        rate_limit._buckets.clear()
+    print("✅ Throttled host backed off without blocking the caller")
+
+if __name__ == "__main__":
+    test_price_fetcher_survives_new_event_loop()
+    test_jupiter_api_survives_new_event_loop()
+    test_drift_client_survives_new_event_loop()
+    test_async_quote_gives_up_on_long_retry_after()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# test_fast_paths.py - Compiled and vectorized fast paths agree with their reference paths
+
+import copy
+import random
+
+def _rsi_both_paths(prices, period=14):
+    """calculate_rsi through the Numba kernel and through the pandas fallback"""
+    from core import indicators
+
+    fast = indicators.calculate_rsi(prices, period)
+    indicators.NUMBA_AVAILABLE = False
+    try:
+        reference = indicators.calculate_rsi(prices, period)
+    finally:
+        indicators.NUMBA_AVAILABLE = True
+    return fast, reference
+
+def test_rsi_kernel_matches_pandas():
+    """Wilder RSI from the Numba kernel equals the pandas fallback, gaps and flat losses included"""
+    print("🧪 Testing RSI kernel against the pandas fallback...")
+    try:
+        import numpy as np
+        from core import indicators
+    except ImportError as e:
+        print(f"⚠️ Skipping: {e}")
+        return
+    if not indicators.NUMBA_AVAILABLE:
+        print("⚠️ Skipping: numba not installed")
+        return
+
+    rng = np.random.default_rng(7)
+    walk = 3000 + np.cumsum(rng.normal(0, 15, 300))
+
+    gapped = walk.copy()
+    gapped[[0, 20, 21, 22, 150, 299]] = np.nan
+
+    rising = np.linspace(3000, 3300, 60)          # no losses at all: RSI pinned at 100
+    flat = np.full(40, 3000.0)                    # no gains or losses: RSI undefined
+    climb_then_dip = np.concatenate([rising, rising[::-1][:10]])
+
+    cases = {
+        "random walk": walk,
+        "NaN gaps": gapped,
+        "zero-loss window": rising,
+        "flat prices": flat,
+        "zero-loss then dip": climb_then_dip,
+        "shorter than period": walk[:10],
+    }
+    for name, prices in cases.items():
+        fast, reference = _rsi_both_paths(prices)
+        assert fast.shape == reference.shape, name
+        assert np.allclose(fast, reference, rtol=1e-9, atol=1e-9, equal_nan=True), name
+        print(f"✅ {name}: last RSI {fast[-1]:.4f}")
+
+    fast, _ = _rsi_both_paths(rising)
+    assert np.all(fast[14:] == 100.0)
+
+def _positions(simulation_engine, count):
+    """Mixed long/short book around $3,000 with stops and targets on both sides of the price"""
+    rng = random.Random(11)
+    positions = []
+    for i in range(count):
+        side = "long" if i % 2 == 0 else "short"
+        entry = rng.uniform(2800, 3200)
+        symbol = "ETH" if i % 3 else "BTC"
+        sign = 1 if side == "long" else -1
+        positions.append(simulation_engine.SimulatedPosition(
+            id=f"{symbol}_{side}_{i}",
+            symbol=symbol,
+            side=side,
+            entry_price=entry,
+            size=rng.uniform(0.01, 2.0),
+            leverage=rng.choice([1.0, 2.0, 5.0]),
+            entry_time="2024-01-01T00:00:00+00:00",
+            current_price=entry,
+            unrealized_pnl=0.0,
+            stop_loss=entry * (1 - sign * rng.uniform(0.0, 0.08)),
+            take_profit=entry * (1 + sign * rng.uniform(0.0, 0.08)),
+        ))
+    # Stop and target both triggered: the stop has to win on both paths
+    positions[0].stop_loss, positions[0].take_profit = 3100.0, 2900.0
+    return positions
+
+def test_vectorized_position_update_matches_scalar():
+    """Column-wise mark-to-market gives the same prices, PnL and SL/TP exits as the scalar loop"""
+    print("🧪 Testing vectorized position update against the scalar loop...")
+    try:
+        from core import simulation_engine
+    except ImportError as e:
+        print(f"⚠️ Skipping: {e}")
+        return
+
+    simulator = simulation_engine.simulator
+    prices = {"ETH": 3000.0, "BTC": 2950.0}
+    scalar = _positions(simulation_engine, 250)
+    vectorized = copy.deepcopy(scalar)
+
+    scalar_exits = simulator._update_open_positions(scalar, prices)
+    vectorized_exits = simulator._update_open_positions_vectorized(vectorized, prices)
+
+    assert scalar_exits == vectorized_exits
+    assert ("BTC_long_0", "Stop Loss") in scalar_exits
+    for a, b in zip(scalar, vectorized):
+        assert a.current_price == b.current_price == prices[a.symbol]
+        assert a.unrealized_pnl == b.unrealized_pnl, a.id
+        # Funding is a random draw on each path; both stay within +/-0.1% of notional
+        limit = a.size * a.current_price * 0.001
+        assert abs(a.funding_paid) <= limit and abs(b.funding_paid) <= limit, a.id
+    print(f"✅ {len(scalar)} positions agree, {len(scalar_exits)} SL/TP exits")
+
+if __name__ == "__main__":
+    test_rsi_kernel_matches_pandas()
+    test_vectorized_position_update_matches_scalar()
@@ -11,7 +11,10 @@ pip install --upgrade pip
 
 # Install dependencies
 echo "📦 Installing Python packages..."
-pip install flask requests pandas tabulate pandas_ta
+pip install flask requests pandas tabulate
+
+# TA-Lib needs the C library; indicators fall back to pandas without it
+pip install TA-Lib || echo "⚠️  TA-Lib unavailable; using pandas fallback"
 
 # Create audit log file if missing
 if [ ! -f audit_log.json ]; then
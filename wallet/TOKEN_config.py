@@ -1,5 +1,8 @@
 # wallet/TOKEN_config.py
 
+import sys
+from dataclasses import dataclass
+
 # ✅ List of supported tokens for signal detection and trading
 TOKEN_LIST = [
     "SOL",
@@ -13,52 +16,36 @@ TOKEN_LIST = [
 ]
 
 # ✅ Metadata for each token: mint address, decimals, display name
+@dataclass(frozen=True)
+class TokenMeta:
+    """Static metadata for a supported token"""
+    __slots__ = ("mint", "decimals", "name")
+    mint: str
+    decimals: int
+    name: str
+
+_TOKEN_META_RAW = {
+    "SOL": ("So11111111111111111111111111111111111111112", 9, "Solana"),
+    "USDC": ("EPjFWdd5AufqSSqeM2qAqAqAqAqAqAqAqAqAqAqAqAqA", 6, "USD Coin"),
+    "BONK": ("DezX3zY3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3", 5, "Bonk"),
+    "JUP": ("JUPZ3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3", 6, "Jupiter"),
+    "ETH": ("7vfCXTUXx5WJV5JADk17DUJ4ksgau7utNKj4b963voxs", 8, "Ethereum (Wormhole)"),
+    "BTC": ("BTCmintAddressHere", 8, "Bitcoin (Wormhole)"),
+    "RAY": ("4k3Dyjzvzp8e2Y2X2X2X2X2X2X2X2X2X2X2X2X2X2X2", 6, "Raydium"),
+    "SRM": ("SRMmintAddressHere", 6, "Serum"),
+}
+
+# Single flat lookup: one hash probe per symbol, fields read from slots
 TOKEN_META = {
-    "SOL": {
-        "mint": "So11111111111111111111111111111111111111112",
-        "decimals": 9,
-        "name": "Solana"
-    },
-    "USDC": {
-        "mint": "EPjFWdd5AufqSSqeM2qAqAqAqAqAqAqAqAqAqAqAqAqA",
-        "decimals": 6,
-        "name": "USD Coin"
-    },
-    "BONK": {
-        "mint": "DezX3zY3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3",
-        "decimals": 5,
-        "name": "Bonk"
-    },
-    "JUP": {
-        "mint": "JUPZ3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3Z3",
-        "decimals": 6,
-        "name": "Jupiter"
-    },
-    "ETH": {
-        "mint": "7vfCXTUXx5WJV5JADk17DUJ4ksgau7utNKj4b963voxs",
-        "decimals": 8,
-        "name": "Ethereum (Wormhole)"
-    },
-    "BTC": {
-        "mint": "BTCmintAddressHere",
-        "decimals": 8,
-        "name": "Bitcoin (Wormhole)"
-    },
-    "RAY": {
-        "mint": "4k3Dyjzvzp8e2Y2X2X2X2X2X2X2X2X2X2X2X2X2X2X2",
-        "decimals": 6,
-        "name": "Raydium"
-    },
-    "SRM": {
-        "mint": "SRMmintAddressHere",
-        "decimals": 6,
-        "name": "Serum"
-    }
+    sys.intern(symbol): TokenMeta(sys.intern(mint), decimals, name)
+    for symbol, (mint, decimals, name) in _TOKEN_META_RAW.items()
 }
 
 # ✅ Utility function (optional)
 def get_token_mint(token_symbol: str) -> str:
-    return TOKEN_META.get(token_symbol, {}).get("mint", "")
+    meta = TOKEN_META.get(token_symbol)
+    return meta.mint if meta else ""
 
 def get_token_decimals(token_symbol: str) -> int:
-    return TOKEN_META.get(token_symbol, {}).get("decimals", 0)
+    meta = TOKEN_META.get(token_symbol)
+    return meta.decimals if meta else 0
@@ -2,6 +2,7 @@
 
 import logging
 import os
+from logging.handlers import RotatingFileHandler
 from datetime import datetime
 
 # ✅ Create logs directory if it doesn't exist
@@ -15,10 +16,8 @@ LOG_FILE = os.path.join(LOG_DIR, f"bot_{datetime.now().strftime('%Y-%m-%d')}.log
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    handlers=[
-        logging.FileHandler(LOG_FILE),
-        logging.StreamHandler()
-    ]
+    handlers=[RotatingFileHandler(LOG_FILE, maxBytes=10_000_000, backupCount=5, delay=True)]
+    + ([] if os.environ.get("DASHBOARD_ACTIVE") else [logging.StreamHandler()])
 )
 
 # ✅ Get logger instance